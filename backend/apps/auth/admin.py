@@ -50,4 +50,8 @@ class RefreshTokenAdmin(admin.ModelAdmin):
 class AuthAuditLogAdmin(admin.ModelAdmin):
     list_display = ("created_at", "action", "email", "successful", "ip_address")
     list_filter = ("action", "successful", "created_at")
-    search_fields = ("email", "user__email", "ip_address", "user_agent")
+    # Exact matches only so the changelist can use the (email|ip, created_at) indexes.
+    search_fields = ("=email", "=ip_address")
+    date_hierarchy = "created_at"
+    show_full_result_count = False
+    raw_id_fields = ("user",)
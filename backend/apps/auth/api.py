@@ -1,8 +1,11 @@
-import hashlib
+import uuid
 from datetime import datetime, timedelta
 
+import jwt
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.signals import user_login_failed
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
@@ -11,22 +14,56 @@ from ninja import Router
 from ninja.errors import HttpError
 from ninja.responses import Response
 
+from assets_backend.pagination import paginated_response
+
+from .audit import audit_sink
+from .audit_search import audit_pages, estimate_count, filter_events
+from .cache import user_cache
 from .dependencies import JWTAuth, require_role
+from .hashing import PoolSaturatedError, ahash_password, averify_password, hashing_pool
 from .models import AuthAuditLog, RefreshToken, User
+from .revocation import access_denylist
+from .rotation import RotationError, hash_token, rotate_refresh_token
 from .schemas import (
+    AdminRevokeSessionsRequest,
     LoginRequest,
     LoginResponse,
     RefreshResponse,
     RegisterRequest,
+    RevokeSessionsRequest,
     UserResponse,
 )
-from .tokens import create_access_token
-from .utils import get_client_ip, get_user_agent, log_event, split_full_name
+from .sessions import active_sessions, revoke_sessions
+from .throttle import login_throttle
+from .tokens import create_access_token, validate_access_token
+from .utils import alog_event, get_client_ip, get_user_agent, log_event, split_full_name
+
+MODEL_BACKEND = "django.contrib.auth.backends.ModelBackend"
 
 jwt_auth = JWTAuth()
 router = Router(tags=["Auth"])
 
 
+async def _authenticate(request, email: str, password: str) -> tuple[User | None, bool]:
+    """Return the active user for *email*/*password* and whether the stored hash needs upgrading.
+
+    With the default ``ModelBackend`` the password check runs on the hashing
+    pool, applying the same rules as the backend (unknown and inactive users
+    are rejected).  Any other backend configuration goes through
+    ``authenticate()`` so custom backends keep working.
+    """
+
+    if list(settings.AUTHENTICATION_BACKENDS) != [MODEL_BACKEND]:
+        return await sync_to_async(authenticate)(request, email=email, password=password), False
+    user = await User.objects.filter(email=email).afirst()
+    valid, needs_upgrade = await averify_password(password, user.password if user else None)
+    if user is None or not valid or not user.is_active:
+        # authenticate() sends this itself on the other path.
+        await user_login_failed.asend(sender=__name__, credentials={"email": email}, request=request)
+        return None, False
+    return user, needs_upgrade
+
+
 @router.get("status", summary="Authentication service heartbeat")
 def auth_status(request) -> dict[str, str]:
     return {"service": "auth", "status": "ok"}
@@ -67,6 +104,19 @@ def _clear_auth_cookies(response: Response) -> None:
     response.delete_cookie("refresh_token")
 
 
+def _revoke_presented_access_token(request) -> None:
+    access_token = request.COOKIES.get("access_token")
+    auth_value = request.headers.get("Authorization", "")
+    if auth_value.lower().startswith("bearer "):
+        access_token = auth_value[7:].strip()
+    if not access_token:
+        return
+    try:
+        access_denylist.revoke_token(validate_access_token(access_token))
+    except jwt.InvalidTokenError:
+        return
+
+
 def _user_payload(user: User) -> dict[str, str]:
     return UserResponse(
         id=str(user.pk),
@@ -77,14 +127,14 @@ def _user_payload(user: User) -> dict[str, str]:
 
 
 @router.post("register", response=UserResponse, summary="Register a new user account")
-def register(request, payload: RegisterRequest) -> Response:
+async def register(request, payload: RegisterRequest) -> Response:
     first_name, last_name = split_full_name(payload.full_name)
     first_name = first_name[:150]
     last_name = last_name[:150]
     try:
         validate_password(payload.password)
     except ValidationError as exc:
-        log_event(
+        await alog_event(
             request=request,
             action=AuthAuditLog.Action.REGISTER,
             email=payload.email,
@@ -95,14 +145,19 @@ def register(request, payload: RegisterRequest) -> Response:
         raise HttpError(400, {"password": exc.messages}) from exc
 
     try:
-        user = User.objects.create_user(
+        encoded_password = await ahash_password(payload.password)
+    except PoolSaturatedError as exc:
+        raise HttpError(503, "Authentication service is busy, please retry") from exc
+
+    try:
+        user = await sync_to_async(User.objects.create_user_with_encoded_password)(
             email=payload.email,
-            password=payload.password,
+            encoded_password=encoded_password,
             first_name=first_name,
             last_name=last_name,
         )
     except IntegrityError as exc:
-        log_event(
+        await alog_event(
             request=request,
             action=AuthAuditLog.Action.REGISTER,
             email=payload.email,
@@ -112,7 +167,7 @@ def register(request, payload: RegisterRequest) -> Response:
         )
         raise HttpError(400, {"email": ["A user with that email already exists."]}) from exc
 
-    log_event(
+    await alog_event(
         request=request,
         action=AuthAuditLog.Action.REGISTER,
         email=user.email,
@@ -124,10 +179,26 @@ def register(request, payload: RegisterRequest) -> Response:
 
 
 @router.post("login", response=LoginResponse, summary="Authenticate a user and issue tokens")
-def login(request, payload: LoginRequest) -> Response:
-    user = authenticate(request, email=payload.email, password=payload.password)
+async def login(request, payload: LoginRequest) -> Response:
+    client_ip = get_client_ip(request)
+    if settings.AUTH_THROTTLE_ENABLED:
+        retry_after = await login_throttle.acheck(client_ip, payload.email)
+        if retry_after:
+            return Response(
+                {"detail": "Too many login attempts. Try again later."},
+                status=429,
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    try:
+        user, needs_upgrade = await _authenticate(request, payload.email, payload.password)
+    except PoolSaturatedError as exc:
+        raise HttpError(503, "Authentication service is busy, please retry") from exc
+
     if user is None:
-        log_event(
+        if settings.AUTH_THROTTLE_ENABLED:
+            await login_throttle.arecord_failure(client_ip, payload.email)
+        await alog_event(
             request=request,
             action=AuthAuditLog.Action.LOGIN,
             email=payload.email,
@@ -135,30 +206,27 @@ def login(request, payload: LoginRequest) -> Response:
             successful=False,
             metadata={"reason": "invalid_credentials"},
         )
+        # Inactive accounts get the same answer as a wrong password, as ModelBackend gives.
         raise HttpError(401, "Invalid credentials")
 
-    if not user.is_active:
-        log_event(
-            request=request,
-            action=AuthAuditLog.Action.LOGIN,
-            email=user.email,
-            user=user,
-            successful=False,
-            metadata={"reason": "inactive"},
-        )
-        raise HttpError(403, "User account is inactive")
+    if settings.AUTH_THROTTLE_ENABLED:
+        await login_throttle.arecord_success(client_ip, payload.email)
+
+    if needs_upgrade:
+        user.password = await ahash_password(payload.password)
+        await user.asave(update_fields=["password"])
 
-    access_token = create_access_token(user)
-    access_expires = _access_expiration()
     refresh_lifetime = timedelta(days=settings.REFRESH_TOKEN_LIFETIME_DAYS)
-    refresh_record, refresh_token = RefreshToken.create_for_user(
+    refresh_record, refresh_token = await sync_to_async(RefreshToken.create_for_user)(
         user,
         lifetime=refresh_lifetime,
         user_agent=get_user_agent(request),
-        ip_address=get_client_ip(request),
+        ip_address=client_ip,
     )
+    access_token = create_access_token(user, session_id=refresh_record.family)
+    access_expires = _access_expiration()
 
-    log_event(
+    await alog_event(
         request=request,
         action=AuthAuditLog.Action.LOGIN,
         email=user.email,
@@ -192,6 +260,133 @@ def me(request) -> dict[str, str]:
     return _user_payload(user)
 
 
+@router.get("verify", auth=jwt_auth, summary="Validate an access token for the nginx auth_request subrequest")
+def verify(request) -> Response:
+    user: User = request.user  # type: ignore[assignment]
+    return Response(
+        None,
+        status=204,
+        headers={"X-User-Id": str(user.pk), "X-User-Role": user.role},
+    )
+
+
+@router.get("metrics", auth=jwt_auth, summary="Return authentication cache and queue metrics")
+def metrics(request) -> dict[str, dict[str, int]]:
+    admin_required(request)
+    return {
+        "userCache": user_cache.stats(),
+        "auditSink": audit_sink.stats(),
+        "hashingPool": hashing_pool.stats(),
+        "loginThrottle": login_throttle.stats(),
+        "accessDenylist": access_denylist.stats(),
+    }
+
+
+@router.get("audit", auth=jwt_auth, summary="Search authentication audit events (admin only)")
+def audit_search(
+    request,
+    action: str | None = None,
+    successful: bool | None = None,
+    email: str | None = None,
+    ip: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    count: str = "none",
+) -> dict[str, object]:
+    admin_required(request)
+    if count not in {"none", "estimate", "exact"}:
+        raise HttpError(400, "count must be one of: none, estimate, exact")
+
+    queryset = filter_events(
+        action=action,
+        successful=successful,
+        email=email,
+        ip_address=ip,
+        since=since,
+        until=until,
+    )
+    total: int | None = None
+    if count == "estimate":
+        total = estimate_count(queryset)
+    elif count == "exact":
+        total = queryset.count()
+
+    def serialize(event: AuthAuditLog) -> dict[str, object]:
+        return {
+            "id": event.pk,
+            "createdAt": event.created_at,
+            "action": event.action,
+            "successful": event.successful,
+            "email": event.email,
+            "userId": event.user_id,
+            "ipAddress": event.ip_address,
+            "userAgent": event.user_agent,
+            "metadata": event.metadata,
+        }
+
+    page = paginated_response(request, queryset, audit_pages, serialize, cursor=cursor, limit=limit)
+    return {**page, "count": total}
+
+
+@router.get("sessions", auth=jwt_auth, summary="List the current user's active sessions")
+def list_sessions(request) -> list[dict[str, object]]:
+    current = request.auth.get("sid")
+    return [
+        {
+            "id": str(token.family),
+            "createdAt": token.created_at,
+            "lastUsedAt": token.last_used_at,
+            "expiresAt": token.expires_at,
+            "userAgent": token.user_agent,
+            "ipAddress": token.ip_address,
+            "current": str(token.family) == current,
+        }
+        for token in active_sessions(request.user)
+    ]
+
+
+@router.post("sessions/revoke", auth=jwt_auth, summary="Revoke all of the current user's sessions")
+def revoke_all_sessions(request, payload: RevokeSessionsRequest) -> dict[str, int]:
+    current = request.auth.get("sid")
+    revoked = revoke_sessions(
+        [request.user.pk],
+        keep_family=uuid.UUID(current) if payload.except_current and current else None,
+        actor=request.user,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
+    )
+    return {"revoked": revoked}
+
+
+@router.post("sessions/{session_id}/revoke", auth=jwt_auth, summary="Revoke one of the current user's sessions")
+def revoke_session(request, session_id: uuid.UUID) -> dict[str, int]:
+    revoked = revoke_sessions(
+        [request.user.pk],
+        family=session_id,
+        actor=request.user,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
+    )
+    if not revoked:
+        raise HttpError(404, "Session not found")
+    return {"revoked": revoked}
+
+
+@router.post("admin/sessions/revoke", auth=jwt_auth, summary="Revoke every session for the given users (admin only)")
+def admin_revoke_sessions(request, payload: AdminRevokeSessionsRequest) -> dict[str, int]:
+    admin_required(request)
+    revoked = revoke_sessions(
+        payload.user_ids,
+        actor=request.user,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
+        reason="admin_revoked",
+    )
+    return {"revoked": revoked}
+
+
 @router.post("refresh", response=RefreshResponse, summary="Refresh access token using a valid refresh token")
 def refresh(request) -> Response:
     raw_token = request.COOKIES.get("refresh_token")
@@ -206,57 +401,41 @@ def refresh(request) -> Response:
         )
         raise HttpError(401, "Refresh token missing")
 
-    token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
     try:
-        token = RefreshToken.objects.select_related("user").get(token_hash=token_hash)
-    except RefreshToken.DoesNotExist as exc:
-        log_event(
-            request=request,
-            action=AuthAuditLog.Action.REFRESH,
-            email="",
-            user=None,
-            successful=False,
-            metadata={"reason": "unknown_token"},
+        rotation = rotate_refresh_token(
+            raw_token,
+            lifetime=timedelta(days=settings.REFRESH_TOKEN_LIFETIME_DAYS),
+            user_agent=get_user_agent(request),
+            ip_address=get_client_ip(request),
         )
-        raise HttpError(401, "Invalid refresh token") from exc
-
-    if token.revoked or token.expires_at <= timezone.now():
-        token.revoke()
-        log_event(
-            request=request,
-            action=AuthAuditLog.Action.REFRESH,
-            email=token.user.email,
-            user=token.user,
-            successful=False,
-            metadata={"reason": "expired_or_revoked"},
-        )
-        raise HttpError(401, "Refresh token expired")
-
-    user = token.user
-    if not user.is_active:
-        token.revoke()
+    except RotationError as exc:
+        token_user = exc.token.user if exc.token else None
+        metadata: dict[str, object] = {"reason": exc.reason}
+        if exc.reason == "reuse_detected":
+            metadata["revoked"] = exc.revoked
         log_event(
             request=request,
-            action=AuthAuditLog.Action.REFRESH,
-            email=user.email,
-            user=user,
+            action=(
+                AuthAuditLog.Action.TOKEN_REVOKED
+                if exc.reason == "reuse_detected"
+                else AuthAuditLog.Action.REFRESH
+            ),
+            email=token_user.email if token_user else "",
+            user=token_user,
             successful=False,
-            metadata={"reason": "inactive"},
+            metadata=metadata,
         )
-        raise HttpError(403, "User account is inactive")
+        if exc.reason == "inactive":
+            raise HttpError(403, "User account is inactive") from exc
+        if exc.reason == "unknown_token":
+            raise HttpError(401, "Invalid refresh token") from exc
+        raise HttpError(401, "Refresh token expired") from exc
 
-    token.mark_used()
-    token.revoke()
+    user = rotation.current.user
+    new_refresh, new_refresh_token = rotation.current, rotation.raw_token
 
-    access_token = create_access_token(user)
+    access_token = create_access_token(user, session_id=new_refresh.family)
     access_expires = _access_expiration()
-    refresh_lifetime = timedelta(days=settings.REFRESH_TOKEN_LIFETIME_DAYS)
-    new_refresh, new_refresh_token = RefreshToken.create_for_user(
-        user,
-        lifetime=refresh_lifetime,
-        user_agent=get_user_agent(request),
-        ip_address=get_client_ip(request),
-    )
 
     log_event(
         request=request,
@@ -291,6 +470,7 @@ def logout(request) -> Response:
     raw_token = request.COOKIES.get("refresh_token")
     response = Response(None, status=204)
     _clear_auth_cookies(response)
+    _revoke_presented_access_token(request)
 
     if not raw_token:
         log_event(
@@ -303,8 +483,7 @@ def logout(request) -> Response:
         )
         return response
 
-    token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
-    token = RefreshToken.objects.filter(token_hash=token_hash).first()
+    token = RefreshToken.objects.filter(token_hash=hash_token(raw_token)).select_related("user").first()
     if token:
         token.revoke()
         log_event(
@@ -16,6 +16,8 @@ class AuthConfig(AppConfig):
     def ready(self) -> None:  # pragma: no cover - exercised implicitly on startup
         super().ready()
 
+        from . import signals  # noqa: F401
+
         if not settings.DEBUG:
             return
 
@@ -0,0 +1,204 @@
+"""Buffered writer for authentication audit events."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.utils import DatabaseError
+
+from .models import AuthAuditLog, User
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSink:
+    """Bounded in-memory queue of audit rows flushed by a background thread.
+
+    Rows are written with ``bulk_create`` whenever ``batch_size`` events are
+    pending or ``flush_interval`` seconds have elapsed, whichever comes first.
+    Each row keeps the ``created_at`` stamped when its event was built, so
+    ordering and time filters are unaffected by flush delay.  When the queue
+    is full the overflow policy decides
+    what happens to new events:
+
+    * ``block`` waits up to ``block_timeout`` seconds for room, then drops.
+    * ``drop_oldest`` discards the oldest pending event.
+    * ``sample`` admits events with probability ``sample_rate`` once the queue is
+      three quarters full, and drops them outright when it is full.
+    """
+
+    POLICIES = ("block", "drop_oldest", "sample")
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        batch_size: int,
+        flush_interval: float,
+        policy: str = "drop_oldest",
+        block_timeout: float = 0.05,
+        sample_rate: float = 0.1,
+    ) -> None:
+        if policy not in self.POLICIES:
+            msg = f"Unknown audit overflow policy: {policy}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.sample_rate = sample_rate
+        self._queue: deque[AuthAuditLog] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._stopping = False
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def submit(self, entry: AuthAuditLog) -> bool:
+        """Queue *entry* for writing and return False when it was dropped."""
+
+        self._ensure_worker()
+        with self._cond:
+            depth = len(self._queue)
+            if self.policy == "sample" and depth >= self.maxsize * 3 // 4:
+                if depth >= self.maxsize or random.random() >= self.sample_rate:  # noqa: S311
+                    self.dropped += 1
+                    return False
+            elif depth >= self.maxsize:
+                if self.policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    self._cond.notify_all()
+                    deadline = time.monotonic() + self.block_timeout
+                    while len(self._queue) >= self.maxsize:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.dropped += 1
+                            return False
+                        self._cond.wait(remaining)
+            self._queue.append(entry)
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self) -> int:
+        """Write every pending event from the calling thread and return the count."""
+
+        total = 0
+        while True:
+            with self._cond:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._cond.notify_all()
+            if not batch:
+                return total
+            total += self._write(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+        self.flush()
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "depth": len(self._queue),
+                "maxsize": self.maxsize,
+                "dropped": self.dropped,
+                "written": self.written,
+                "failed": self.failed,
+                "flushes": self.flushes,
+            }
+
+    def _write(self, batch: list[AuthAuditLog]) -> int:
+        try:
+            AuthAuditLog.objects.bulk_create(batch, batch_size=self.batch_size)
+        except DatabaseError:
+            # Any database error (including an IntegrityError) drops this batch only; the flusher keeps running.
+            logger.warning(
+                "Dropping %d authentication audit events because the write failed.", len(batch), exc_info=True
+            )
+            with self._cond:
+                self.failed += len(batch)
+            return 0
+        with self._cond:
+            self.written += len(batch)
+            self.flushes += 1
+        return len(batch)
+
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._cond:
+            if self._thread is not None and self._pid == pid and self._thread.is_alive():
+                return
+            self._pid = pid
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="auth-audit-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._queue) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                stopping = self._stopping
+            close_old_connections()
+            self.flush()
+            if stopping:
+                return
+
+
+audit_sink = AuditSink(
+    maxsize=settings.AUTH_AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUTH_AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUTH_AUDIT_FLUSH_INTERVAL_MS / 1000,
+    policy=settings.AUTH_AUDIT_OVERFLOW_POLICY,
+    sample_rate=settings.AUTH_AUDIT_SAMPLE_PERCENT / 100,
+)
+atexit.register(audit_sink.shutdown)
+
+
+def record_event(
+    *,
+    user: User | None,
+    email: str,
+    action: AuthAuditLog.Action,
+    successful: bool,
+    ip_address: str = "",
+    user_agent: str = "",
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    """Record an audit event through the buffered sink or synchronously."""
+
+    fields: dict[str, Any] = {
+        "user": user,
+        "email": email,
+        "action": action,
+        "successful": successful,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "metadata": metadata,
+    }
+    if settings.AUTH_AUDIT_BUFFERED:
+        audit_sink.submit(AuthAuditLog.build(**fields))
+    else:
+        AuthAuditLog.log(**fields)
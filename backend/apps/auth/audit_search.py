@@ -0,0 +1,57 @@
+"""Keyset-paginated search over authentication audit events."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+from django.db import connections
+from django.db.models import QuerySet
+
+from assets_backend.pagination import KeysetPaginator
+
+from .models import AuthAuditLog
+
+
+audit_pages = KeysetPaginator("-created_at", default_limit=50, max_limit=200)
+
+
+def filter_events(
+    *,
+    action: str | None = None,
+    successful: bool | None = None,
+    email: str | None = None,
+    ip_address: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> QuerySet[AuthAuditLog]:
+    queryset = AuthAuditLog.objects.all()
+    if action:
+        queryset = queryset.filter(action=action)
+    if successful is not None:
+        queryset = queryset.filter(successful=successful)
+    if email:
+        queryset = queryset.filter(email=email)
+    if ip_address:
+        queryset = queryset.filter(ip_address=ip_address)
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+    if until:
+        queryset = queryset.filter(created_at__lt=until)
+    return queryset
+
+
+def estimate_count(queryset: QuerySet[Any]) -> int:
+    """Return the planner's row estimate on PostgreSQL, or an exact count elsewhere."""
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
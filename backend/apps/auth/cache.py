@@ -0,0 +1,137 @@
+"""Per-process cache of authenticated user snapshots."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from assets_backend.redis_client import get_redis_client
+
+from .models import User
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FIELDS: tuple[str, ...] = ("id", "email", "first_name", "last_name", "role", "is_active")
+REDIS_KEY_PREFIX = "auth:user:"
+
+
+class UserCache:
+    """Bounded LRU + TTL cache of the user fields needed by ``JWTAuth``.
+
+    Lookups hit the local dictionary first, then Redis when it is configured, and
+    finally the database.  Cached users are materialised with only the snapshot
+    fields loaded; anything else is deferred and fetched lazily on access.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, tuple[Any, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_user(self, pk: Any) -> User:
+        """Return the user with *pk*, raising ``User.DoesNotExist`` when absent."""
+
+        key = str(pk)
+        values = self._get_local(key)
+        if values is None:
+            values = self._get_remote(key)
+            if values is None:
+                with self._lock:
+                    self.misses += 1
+                values = tuple(User.objects.values_list(*SNAPSHOT_FIELDS).get(pk=pk))
+                self._set_remote(key, values)
+            self._set_local(key, values)
+        return User.from_db(DEFAULT_DB_ALIAS, list(SNAPSHOT_FIELDS), values)
+
+    def invalidate(self, pk: Any) -> None:
+        key = str(pk)
+        with self._lock:
+            self._entries.pop(key, None)
+        client = get_redis_client()
+        if client is not None:
+            try:
+                client.delete(f"{REDIS_KEY_PREFIX}{key}")
+            except Exception:  # noqa: BLE001 - Redis is best effort
+                logger.warning("Failed to invalidate cached user %s in Redis", key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.redis_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "redisHits": self.redis_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _get_local(self, key: str) -> tuple[Any, ...] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, values = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return values
+
+    def _set_local(self, key: str, values: tuple[Any, ...]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _get_remote(self, key: str) -> tuple[Any, ...] | None:
+        client = get_redis_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(f"{REDIS_KEY_PREFIX}{key}")
+        except Exception:  # noqa: BLE001 - fall back to the database
+            logger.warning("Redis lookup for cached user %s failed", key)
+            return None
+        if raw is None:
+            return None
+        with self._lock:
+            self.redis_hits += 1
+        return tuple(json.loads(raw))
+
+    def _set_remote(self, key: str, values: tuple[Any, ...]) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.set(f"{REDIS_KEY_PREFIX}{key}", json.dumps(values), ex=max(int(self.ttl), 1))
+        except Exception:  # noqa: BLE001 - Redis is best effort
+            logger.warning("Failed to store cached user %s in Redis", key)
+
+
+user_cache = UserCache(
+    maxsize=settings.AUTH_USER_CACHE_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
@@ -7,8 +7,11 @@ from django.http import HttpRequest
 from ninja.errors import HttpError
 from ninja.security import HttpBearer
 
+from .audit import record_event
+from .cache import user_cache
 from .constants import is_auth_exempt_path
 from .models import AuthAuditLog, User
+from .revocation import access_denylist
 from .tokens import validate_access_token
 from .utils import get_client_ip, get_user_agent
 
@@ -41,8 +44,12 @@ class JWTAuth(HttpBearer):
             _record_denied(request, None, "Invalid token")
             raise HttpError(401, "Invalid authentication token") from exc
 
+        if access_denylist.is_revoked(payload):
+            _record_denied(request, None, "Revoked token")
+            raise HttpError(401, "Token has been revoked")
+
         try:
-            user = User.objects.get(pk=payload["sub"])
+            user = user_cache.get_user(payload["sub"])
         except User.DoesNotExist as exc:
             _record_denied(request, None, "Unknown user")
             raise HttpError(401, "User not found") from exc
@@ -71,7 +78,7 @@ def require_role(role: User.Role) -> Callable[[HttpRequest], User]:
 
 
 def _record_denied(request: HttpRequest, user: User | None, reason: str) -> None:
-    AuthAuditLog.log(
+    record_event(
         user=user,
         email=user.email if user else "",
         action=AuthAuditLog.Action.ACCESS_DENIED,
@@ -0,0 +1,117 @@
+"""Bounded worker pool for password hashing in async views."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+
+T = TypeVar("T")
+
+
+class PoolSaturatedError(Exception):
+    """Raised when too many hashing jobs are already waiting for a worker."""
+
+
+class HashingPool:
+    """Thread pool that runs PBKDF2 off the event loop.
+
+    ``hashlib.pbkdf2_hmac`` releases the GIL, so a handful of threads keep the
+    CPU busy without blocking request handling.  Jobs beyond ``max_pending`` are
+    rejected rather than queued so a login burst cannot grow latency unbounded.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.running = 0
+        self.peak = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_pending:
+                self.rejected += 1
+                msg = "Password hashing pool is saturated"
+                raise PoolSaturatedError(msg)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._call, func, args)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "maxWorkers": self.max_workers,
+                "maxPending": self.max_pending,
+                "running": self.running,
+                "queued": self.in_flight - self.running,
+                "peak": self.peak,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def _call(self, func: Callable[..., T], args: tuple[Any, ...]) -> T:
+        with self._lock:
+            self.running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="auth-hashing",
+                    )
+        return self._executor
+
+
+hashing_pool = HashingPool(
+    max_workers=settings.AUTH_HASHING_WORKERS,
+    max_pending=settings.AUTH_HASHING_MAX_PENDING,
+)
+
+
+async def averify_password(password: str, encoded: str | None) -> tuple[bool, bool]:
+    """Check *password* against *encoded* in the pool.
+
+    Returns ``(valid, needs_upgrade)``.  A missing hash still runs the default
+    hasher once so unknown emails take as long as wrong passwords.
+    """
+
+    if encoded is None:
+        await hashing_pool.run(make_password, password)
+        return False, False
+    valid = await hashing_pool.run(check_password, password, encoded)
+    return valid, valid and needs_upgrade(encoded)
+
+
+def needs_upgrade(encoded: str) -> bool:
+    """Apply Django's rehash rule: a different preferred algorithm, or stale parameters."""
+
+    hasher = identify_hasher(encoded)
+    return hasher.algorithm != get_hasher().algorithm or hasher.must_update(encoded)
+
+
+async def ahash_password(password: str) -> str:
+    return await hashing_pool.run(make_password, password)
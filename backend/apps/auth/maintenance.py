@@ -0,0 +1,86 @@
+"""Housekeeping jobs for authentication tables."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import RefreshToken
+
+
+@dataclass
+class PurgeResult:
+    scanned: int = 0
+    deleted: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def purge_refresh_tokens(
+    *,
+    batch_size: int = 1000,
+    max_rows_per_second: float = 0,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> PurgeResult:
+    """Delete expired tokens, and revoked tokens past their retention window.
+
+    Rows are visited in ``(expires_at, id)`` order using keyset pagination over
+    the ``expires_at`` index, and each batch is removed with one short
+    ``DELETE ... WHERE id IN (...)`` so lookups by ``token_hash`` never wait
+    behind a long-running statement.  Revoked tokens are kept for
+    ``REFRESH_TOKEN_REVOKED_RETENTION_HOURS`` so refresh reuse detection still
+    recognises recently rotated tokens.  The window runs from ``rotated_at``;
+    tokens revoked without rotating (logout, family revocation) fall back to
+    their issue time.
+    """
+
+    now = now or timezone.now()
+    lifetime = timedelta(days=settings.REFRESH_TOKEN_LIFETIME_DAYS)
+    retention = timedelta(hours=settings.REFRESH_TOKEN_REVOKED_RETENTION_HOURS)
+    # A token expiring before this horizon was issued at least ``retention`` ago.
+    horizon = max(now, now + lifetime - retention)
+
+    candidates = RefreshToken.objects.filter(
+        Q(expires_at__lte=now)
+        | Q(revoked=True, rotated_at__lte=now - retention)
+        | Q(revoked=True, rotated_at__isnull=True, expires_at__lte=horizon)
+    )
+    result = PurgeResult()
+    started = time.monotonic()
+    cursor: tuple[datetime, int] | None = None
+
+    while True:
+        page = candidates
+        if cursor is not None:
+            page = page.filter(
+                Q(expires_at__gt=cursor[0]) | Q(expires_at=cursor[0], pk__gt=cursor[1])
+            )
+        rows = list(page.order_by("expires_at", "pk").values_list("expires_at", "pk")[:batch_size])
+        if not rows:
+            break
+
+        cursor = rows[-1]
+        result.scanned += len(rows)
+        result.batches += 1
+        if not dry_run:
+            deleted, _ = RefreshToken.objects.filter(pk__in=[pk for _, pk in rows]).delete()
+            result.deleted += deleted
+
+        if max_rows_per_second > 0:
+            budget = result.scanned / max_rows_per_second
+            delay = budget - (time.monotonic() - started)
+            if delay > 0:
+                time.sleep(delay)
+
+    result.elapsed = time.monotonic() - started
+    return result
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.test import Client
+
+from apps.auth.models import User
+from apps.auth.tokens import create_access_token
+
+
+class Command(BaseCommand):
+    help = "Measure /api/auth/verify latency in-process and report p50/p95/p99."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=2000, help="Number of timed requests.")
+        parser.add_argument("--warmup", type=int, default=100, help="Untimed requests sent first.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        client = Client()
+        with transaction.atomic():
+            user = User.objects.create_user(email="bench-verify@example.invalid", password=None)
+            headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(user)}"}
+
+            for _ in range(options["warmup"]):
+                client.get("/api/auth/verify", **headers)
+
+            samples = []
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                response = client.get("/api/auth/verify", **headers)
+                samples.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 204:
+                    msg = f"Unexpected status {response.status_code} from /api/auth/verify"
+                    raise CommandError(msg)
+
+            transaction.set_rollback(True)
+
+        quantiles = statistics.quantiles(samples, n=100)
+        self.stdout.write(
+            f"{len(samples)} requests: p50={quantiles[49]:.3f}ms p95={quantiles[94]:.3f}ms "
+            f"p99={quantiles[98]:.3f}ms max={max(samples):.3f}ms"
+        )
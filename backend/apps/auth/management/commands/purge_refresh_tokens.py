@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.auth.maintenance import purge_refresh_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired and revoked refresh tokens in small keyset batches."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per statement.")
+        parser.add_argument(
+            "--max-rate",
+            type=float,
+            default=0,
+            help="Maximum rows processed per second (0 disables throttling).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Count matching rows without deleting.")
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Repeat every N seconds instead of running once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            result = purge_refresh_tokens(
+                batch_size=options["batch_size"],
+                max_rows_per_second=options["max_rate"],
+                dry_run=options["dry_run"],
+            )
+            if options["dry_run"]:
+                self.stdout.write(f"{result.scanned} refresh tokens would be deleted.")
+            else:
+                self.stdout.write(
+                    f"Deleted {result.deleted} refresh tokens in {result.batches} batches "
+                    f"({result.elapsed:.2f}s, {result.rate:.0f} rows/s)."
+                )
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
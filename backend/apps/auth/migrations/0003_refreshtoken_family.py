@@ -0,0 +1,48 @@
+"""Track refresh-token families so token reuse can revoke a whole login."""
+
+import uuid
+
+from django.db import migrations, models
+
+
+def assign_families(apps, schema_editor):
+    RefreshToken = apps.get_model("assets_auth", "RefreshToken")
+    batch = []
+    for token in RefreshToken.objects.only("pk").iterator(chunk_size=2000):
+        token.family = uuid.uuid4()
+        batch.append(token)
+        if len(batch) >= 2000:
+            RefreshToken.objects.bulk_update(batch, ["family"])
+            batch = []
+    if batch:
+        RefreshToken.objects.bulk_update(batch, ["family"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_auth", "0002_alter_authauditlog_action"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="refreshtoken",
+            name="family",
+            field=models.UUIDField(null=True),
+        ),
+        migrations.RunPython(assign_families, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="refreshtoken",
+            name="family",
+            field=models.UUIDField(default=uuid.uuid4),
+        ),
+        migrations.AddField(
+            model_name="refreshtoken",
+            name="rotated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="refreshtoken",
+            index=models.Index(fields=["family"], name="assets_auth_family_92de15_idx"),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-18 04:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_auth", "0003_refreshtoken_family"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="authauditlog",
+            index=models.Index(fields=["created_at", "id"], name="idx_auditlog_created"),
+        ),
+        migrations.AddIndex(
+            model_name="authauditlog",
+            index=models.Index(fields=["action", "created_at"], name="idx_auditlog_action_created"),
+        ),
+        migrations.AddIndex(
+            model_name="authauditlog",
+            index=models.Index(fields=["email", "created_at"], name="idx_auditlog_email_created"),
+        ),
+        migrations.AddIndex(
+            model_name="authauditlog",
+            index=models.Index(fields=["ip_address", "created_at"], name="idx_auditlog_ip_created"),
+        ),
+    ]
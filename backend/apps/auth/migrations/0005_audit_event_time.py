@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-18 06:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_auth", "0004_authauditlog_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="authauditlog",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import secrets
+import uuid
 from datetime import timedelta
 from typing import Any
 
@@ -14,6 +15,8 @@ from django.db import models
 from django.db.utils import OperationalError, ProgrammingError
 from django.utils import timezone
 
+from .revocation import access_denylist
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +26,23 @@ class UserManager(BaseUserManager):
 
     use_in_migrations = True
 
-    def _create_user(self, email: str, password: str | None, **extra_fields: Any) -> "User":
+    def _create_user(
+        self,
+        email: str,
+        password: str | None,
+        *,
+        encoded_password: str | None = None,
+        **extra_fields: Any,
+    ) -> "User":
         if not email:
             msg = "The email address must be set"
             raise ValueError(msg)
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        if encoded_password is not None:
+            user.password = encoded_password
+        else:
+            user.set_password(password)
         user.save(using=self._db)
         return user
 
@@ -39,6 +52,16 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("role", User.Role.USER)
         return self._create_user(email, password, **extra_fields)
 
+    def create_user_with_encoded_password(
+        self, email: str, encoded_password: str, **extra_fields: Any
+    ) -> "User":
+        """Create a user from a password hash computed elsewhere, e.g. in a worker pool."""
+
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        extra_fields.setdefault("role", User.Role.USER)
+        return self._create_user(email, None, encoded_password=encoded_password, **extra_fields)
+
     def create_superuser(self, email: str, password: str | None, **extra_fields: Any) -> "User":
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
@@ -101,11 +124,14 @@ class RefreshToken(models.Model):
     last_used_at = models.DateTimeField(null=True, blank=True)
     user_agent = models.TextField(blank=True)
     ip_address = models.CharField(max_length=64, blank=True)
+    family = models.UUIDField(default=uuid.uuid4)
+    rotated_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         indexes = [
             models.Index(fields=["user", "revoked"]),
             models.Index(fields=["expires_at"]),
+            models.Index(fields=["family"]),
         ]
 
     @staticmethod
@@ -122,6 +148,7 @@ class RefreshToken(models.Model):
         lifetime: timedelta,
         user_agent: str = "",
         ip_address: str = "",
+        family: uuid.UUID | None = None,
     ) -> tuple["RefreshToken", str]:
         raw_token, token_hash = cls.build_token()
         expires_at = timezone.now() + lifetime
@@ -131,6 +158,7 @@ class RefreshToken(models.Model):
             expires_at=expires_at,
             user_agent=user_agent[:500],
             ip_address=ip_address[:64],
+            family=family or uuid.uuid4(),
         )
         return token, raw_token
 
@@ -142,6 +170,7 @@ class RefreshToken(models.Model):
         if not self.revoked:
             self.revoked = True
             self.save(update_fields=["revoked"])
+        access_denylist.revoke_session(self.family)
 
 
 class AuthAuditLog(models.Model):
@@ -162,10 +191,40 @@ class AuthAuditLog(models.Model):
     ip_address = models.CharField(max_length=64, blank=True)
     user_agent = models.TextField(blank=True)
     metadata = models.JSONField(default=dict, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="idx_auditlog_created"),
+            models.Index(fields=["action", "created_at"], name="idx_auditlog_action_created"),
+            models.Index(fields=["email", "created_at"], name="idx_auditlog_email_created"),
+            models.Index(fields=["ip_address", "created_at"], name="idx_auditlog_ip_created"),
+        ]
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        user: User | None,
+        email: str,
+        action: "AuthAuditLog.Action",
+        successful: bool,
+        ip_address: str = "",
+        user_agent: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> "AuthAuditLog":
+        return cls(
+            user=user,
+            email=email,
+            action=action,
+            successful=successful,
+            ip_address=ip_address[:64],
+            user_agent=user_agent[:500],
+            metadata=metadata or {},
+            # Stamped now: buffered rows are inserted later, at flush time.
+            created_at=timezone.now(),
+        )
 
     @classmethod
     def log(
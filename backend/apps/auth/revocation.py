@@ -0,0 +1,175 @@
+"""Access-token revocation backed by a Bloom filter and Redis."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+
+from assets_backend.redis_client import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "auth:revoked"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class AccessTokenDenylist:
+    """Revoked ``jti`` and session (``sid``) claims, checked on every request.
+
+    A negative Bloom lookup answers most requests without any I/O.  Positives
+    are confirmed against the exact local entries, then the Redis sorted set
+    (scored by expiry) that is the source of truth across processes.  Each
+    process rebuilds its filter from Redis every ``sync_interval`` seconds,
+    which also forgets entries whose tokens have expired.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        error_rate: float = 0.001,
+        sync_interval: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.clock = clock
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._entries: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._last_sync = 0.0
+        self.checks = 0
+        self.bloom_positives = 0
+        self.false_positives = 0
+
+    def revoke(self, key: str, expires_at: float) -> None:
+        if expires_at <= self.clock():
+            return
+        with self._lock:
+            self._entries[key] = expires_at
+            self._bloom.add(key)
+        client = get_redis_client()
+        if client is not None:
+            try:
+                client.zadd(REDIS_KEY, {key: expires_at})
+            except Exception:  # noqa: BLE001 - the local filter still applies
+                logger.warning("Failed to publish revoked token %s to Redis", key)
+
+    def revoke_token(self, payload: dict[str, Any]) -> None:
+        if jti := payload.get("jti"):
+            self.revoke(f"jti:{jti}", float(payload.get("exp", 0)))
+
+    def revoke_session(self, session_id: Any) -> None:
+        """Revoke every access token issued for the refresh-token family *session_id*."""
+
+        lifetime = settings.ACCESS_TOKEN_LIFETIME_MINUTES * 60
+        self.revoke(f"sid:{session_id}", self.clock() + lifetime)
+
+    def is_revoked(self, payload: dict[str, Any]) -> bool:
+        self._maybe_sync()
+        keys = [f"jti:{payload['jti']}"] if payload.get("jti") else []
+        if payload.get("sid"):
+            keys.append(f"sid:{payload['sid']}")
+        with self._lock:
+            self.checks += 1
+            candidates = [key for key in keys if key in self._bloom]
+            if not candidates:
+                return False
+            self.bloom_positives += 1
+            now = self.clock()
+            if any(self._entries.get(key, 0) > now for key in candidates):
+                return True
+        if self._confirm_remote(candidates):
+            return True
+        with self._lock:
+            self.false_positives += 1
+        return False
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "checks": self.checks,
+                "bloomPositives": self.bloom_positives,
+                "falsePositives": self.false_positives,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._entries.clear()
+
+    def _confirm_remote(self, keys: list[str]) -> bool:
+        client = get_redis_client()
+        if client is None:
+            return False
+        try:
+            pipe = client.pipeline()
+            for key in keys:
+                pipe.zscore(REDIS_KEY, key)
+            scores = pipe.execute()
+        except Exception:  # noqa: BLE001 - fall back to the local view
+            logger.warning("Redis revocation lookup failed")
+            return False
+        now = self.clock()
+        return any(score is not None and score > now for score in scores)
+
+    def _maybe_sync(self) -> None:
+        now = self.clock()
+        if now - self._last_sync < self.sync_interval:
+            return
+        self._last_sync = now
+        entries: dict[str, float] = {}
+        client = get_redis_client()
+        if client is not None:
+            try:
+                client.zremrangebyscore(REDIS_KEY, "-inf", now)
+                for key, expiry in client.zrangebyscore(REDIS_KEY, now, "+inf", withscores=True):
+                    entries[key.decode() if isinstance(key, bytes) else key] = expiry
+            except Exception:  # noqa: BLE001 - keep serving from the local view
+                logger.warning("Failed to sync revoked tokens from Redis")
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        with self._lock:
+            for key, expiry in self._entries.items():
+                if expiry > now:
+                    entries.setdefault(key, expiry)
+            for key in entries:
+                bloom.add(key)
+            self._entries = entries
+            self._bloom = bloom
+
+
+access_denylist = AccessTokenDenylist(
+    capacity=settings.AUTH_DENYLIST_CAPACITY,
+    sync_interval=settings.AUTH_DENYLIST_SYNC_SECONDS,
+)
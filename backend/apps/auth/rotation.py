@@ -0,0 +1,110 @@
+"""Atomic refresh-token rotation with reuse detection."""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import RefreshToken
+from .revocation import access_denylist
+
+
+@dataclass(frozen=True)
+class Rotation:
+    previous: RefreshToken
+    current: RefreshToken
+    raw_token: str
+
+
+class RotationError(Exception):
+    """Raised when a refresh token cannot be rotated.
+
+    ``reason`` is one of ``unknown_token``, ``expired_or_revoked``, ``inactive``,
+    ``concurrent_rotation`` or ``reuse_detected``.
+    """
+
+    def __init__(self, reason: str, *, token: RefreshToken | None = None, revoked: int = 0) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.token = token
+        self.revoked = revoked
+
+
+def hash_token(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+
+
+def revoke_family(family: uuid.UUID) -> int:
+    """Revoke every live token descended from the same login."""
+
+    revoked = RefreshToken.objects.filter(family=family, revoked=False).update(revoked=True)
+    access_denylist.revoke_session(family)
+    return revoked
+
+
+def rotate_refresh_token(
+    raw_token: str,
+    *,
+    lifetime: timedelta,
+    user_agent: str = "",
+    ip_address: str = "",
+) -> Rotation:
+    """Exchange *raw_token* for a successor in a single transaction.
+
+    The old token is claimed with one conditional ``UPDATE`` so that only one of
+    several concurrent callers wins.  Presenting a token that was already rotated
+    outside ``REFRESH_TOKEN_REUSE_GRACE_SECONDS`` is treated as theft and revokes
+    the whole family.
+    """
+
+    try:
+        token = RefreshToken.objects.select_related("user").get(token_hash=hash_token(raw_token))
+    except RefreshToken.DoesNotExist as exc:
+        msg = "unknown_token"
+        raise RotationError(msg) from exc
+
+    if not token.user.is_active:
+        token.revoke()
+        msg = "inactive"
+        raise RotationError(msg, token=token)
+
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = RefreshToken.objects.filter(pk=token.pk, revoked=False, expires_at__gt=now).update(
+            revoked=True,
+            last_used_at=now,
+            rotated_at=now,
+        )
+        if claimed:
+            successor, successor_raw = RefreshToken.create_for_user(
+                token.user,
+                lifetime=lifetime,
+                user_agent=user_agent,
+                ip_address=ip_address,
+                family=token.family,
+            )
+
+    if claimed:
+        token.revoked = True
+        token.last_used_at = token.rotated_at = now
+        return Rotation(previous=token, current=successor, raw_token=successor_raw)
+
+    token.refresh_from_db(fields=["revoked", "rotated_at"])
+    if token.rotated_at is None:
+        token.revoke()
+        msg = "expired_or_revoked"
+        raise RotationError(msg, token=token)
+
+    grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+    if now - token.rotated_at <= grace:
+        msg = "concurrent_rotation"
+        raise RotationError(msg, token=token)
+
+    msg = "reuse_detected"
+    raise RotationError(msg, token=token, revoked=revoke_family(token.family))
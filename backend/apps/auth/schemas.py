@@ -46,3 +46,12 @@ class UserResponse(Schema):
     email: str
     full_name: str = Field(alias="fullName")
     role: str
+
+
+class RevokeSessionsRequest(Schema):
+    except_current: bool = Field(False, alias="exceptCurrent")
+
+
+class AdminRevokeSessionsRequest(Schema):
+    user_ids: list[int] = Field(alias="userIds")
+
@@ -3,14 +3,13 @@ from __future__ import annotations
 import logging
 import os
 from datetime import timedelta
-from decimal import Decimal
 from typing import Iterable
 
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import DEFAULT_DB_ALIAS, connections
-from django.db.models import Q, Sum
+from django.db.models import Sum
 from django.db.models.functions import Coalesce
 from django.db.utils import OperationalError, ProgrammingError
 from django.utils import timezone
@@ -78,23 +77,20 @@ def seed_dev_data() -> None:
             role=user_model.Role.USER,
         )
 
+    # Balances enter through the ledger so it stays the source of truth.
+    from apps.wallet.ledger import append_entry
+
     wallet_model = apps.get_model("assets_wallet", "Wallet")
-    admin_wallet, _ = wallet_model.objects.get_or_create(
-        user=admin,
-        defaults={
-            "balance": Decimal("12450000.00"),
-            "currency": "IRR",
-            "status": wallet_model.Status.ACTIVE,
-        },
-    )
-    borrower_wallet, _ = wallet_model.objects.get_or_create(
-        user=borrower,
-        defaults={
-            "balance": Decimal("3620000.00"),
-            "currency": "IRR",
-            "status": wallet_model.Status.ACTIVE,
-        },
-    )
+    entry_model = apps.get_model("assets_wallet", "LedgerEntry")
+    seeded_wallets = []
+    for owner, opening_balance in ((admin, 12_450_000), (borrower, 3_620_000)):
+        wallet, created = wallet_model.objects.get_or_create(
+            user=owner,
+            defaults={"currency": "IRR", "status": wallet_model.Status.ACTIVE},
+        )
+        if created:
+            append_entry(wallet, opening_balance, entry_model.Kind.TOP_UP, "seed")
+            seeded_wallets.append(wallet)
 
     ticket_model = apps.get_model("assets_tickets", "Ticket")
     ticket_defaults = [
@@ -102,7 +98,7 @@ def seed_dev_data() -> None:
             "asset_name": "Dell XPS 15",
             "borrower": borrower,
             "lender": admin,
-            "price": Decimal("550000.00"),
+            "price": 550_000,
             "duration_days": 14,
             "status": ticket_model.Status.ACTIVE,
         },
@@ -110,7 +106,7 @@ def seed_dev_data() -> None:
             "asset_name": "Canon EOS R6",
             "borrower": borrower,
             "lender": admin,
-            "price": Decimal("820000.00"),
+            "price": 820_000,
             "duration_days": 7,
             "status": ticket_model.Status.ACCEPTED,
         },
@@ -118,7 +114,7 @@ def seed_dev_data() -> None:
             "asset_name": "MacBook Pro 14",
             "borrower": admin,
             "lender": borrower,
-            "price": Decimal("960000.00"),
+            "price": 960_000,
             "duration_days": 10,
             "status": ticket_model.Status.PENDING,
         },
@@ -140,7 +136,7 @@ def seed_dev_data() -> None:
             "ticket": tickets[0],
             "authority": "AUTH-0001",
             "ref_id": 8834210011,
-            "amount": Decimal("550000.00"),
+            "amount": 550_000,
             "status": payment_model.Status.VERIFIED,
             "verified_at": timezone.now() - timedelta(days=1),
         },
@@ -148,7 +144,7 @@ def seed_dev_data() -> None:
             "ticket": tickets[1],
             "authority": "AUTH-0002",
             "ref_id": None,
-            "amount": Decimal("820000.00"),
+            "amount": 820_000,
             "status": payment_model.Status.INITIATED,
             "verified_at": None,
         },
@@ -156,7 +152,7 @@ def seed_dev_data() -> None:
             "ticket": tickets[2],
             "authority": "AUTH-0003",
             "ref_id": None,
-            "amount": Decimal("960000.00"),
+            "amount": 960_000,
             "status": payment_model.Status.FAILED,
             "verified_at": None,
         },
@@ -199,17 +195,16 @@ def seed_dev_data() -> None:
             defaults={key: value for key, value in payload.items() if key not in {"user", "message"}},
         )
 
-    # Keep wallet balances roughly aligned with payment activity
-    for wallet in (admin_wallet, borrower_wallet):
+    # Keep new wallet balances roughly aligned with payment activity
+    for wallet in seeded_wallets:
         total_outgoing = (
             payment_model.objects.filter(
-                Q(ticket__borrower=wallet.user) | Q(ticket__lender=wallet.user),
+                ticket__participants__user=wallet.user,
                 status=payment_model.Status.INITIATED,
-            ).aggregate(total=Coalesce(Sum("amount"), Decimal("0")))["total"]
+            ).aggregate(total=Coalesce(Sum("amount"), 0))["total"]
         )
         if total_outgoing:
-            wallet.balance = Decimal(wallet.balance) - total_outgoing / Decimal("20")
-            wallet.save(update_fields=["balance"])
+            append_entry(wallet, -(total_outgoing // 20), entry_model.Kind.ADJUSTMENT, "seed")
 
     logger.info(
         "Seeded development data for wallets, tickets, payments, and notifications (admin id=%s, user id=%s)",
@@ -0,0 +1,76 @@
+"""Listing and bulk revocation of refresh-token sessions."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .models import AuthAuditLog, RefreshToken, User
+from .revocation import access_denylist
+
+
+def active_sessions(user: User) -> QuerySet[RefreshToken]:
+    """Live refresh tokens for *user*; each token family is one session."""
+
+    return RefreshToken.objects.filter(user=user, revoked=False, expires_at__gt=timezone.now()).order_by(
+        "-last_used_at", "-created_at"
+    )
+
+
+def revoke_sessions(
+    user_ids: Iterable[int],
+    *,
+    family: uuid.UUID | None = None,
+    keep_family: uuid.UUID | None = None,
+    actor: User | None = None,
+    ip_address: str = "",
+    user_agent: str = "",
+    reason: str = "session_revoked",
+) -> int:
+    """Revoke sessions with one ``UPDATE`` and bulk-insert one audit row per user.
+
+    Families are read first so live access tokens can be denylisted; a session
+    created between that read and the update is still revoked, and its access
+    token expires with the normal lifetime.
+    """
+
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return 0
+
+    queryset = RefreshToken.objects.filter(user_id__in=user_ids, revoked=False)
+    if family is not None:
+        queryset = queryset.filter(family=family)
+    if keep_family is not None:
+        queryset = queryset.exclude(family=keep_family)
+
+    families = list(queryset.values_list("user_id", "family"))
+    revoked = queryset.update(revoked=True)
+    for _, session_family in families:
+        access_denylist.revoke_session(session_family)
+
+    per_user: dict[int, int] = {}
+    for user_id, _ in families:
+        per_user[user_id] = per_user.get(user_id, 0) + 1
+    metadata: dict[str, Any] = {"reason": reason}
+    if actor is not None:
+        metadata["actor"] = actor.pk
+    AuthAuditLog.objects.bulk_create(
+        [
+            AuthAuditLog.build(
+                user=user,
+                email=user.email,
+                action=AuthAuditLog.Action.TOKEN_REVOKED,
+                successful=True,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                metadata={**metadata, "sessions": per_user.get(user.pk, 0)},
+            )
+            for user in User.objects.filter(pk__in=user_ids).only("pk", "email")
+        ]
+    )
+    return revoked
@@ -0,0 +1,17 @@
+"""Signal handlers that keep auth caches consistent with the database."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import user_cache
+from .models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid="assets_auth_user_cache_save")
+@receiver(post_delete, sender=User, dispatch_uid="assets_auth_user_cache_delete")
+def invalidate_cached_user(sender: type[User], instance: User, **kwargs: Any) -> None:  # noqa: ARG001
+    user_cache.invalidate(instance.pk)
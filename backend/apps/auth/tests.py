@@ -1,14 +1,36 @@
+import asyncio
 import hashlib
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+from io import StringIO
+from typing import Any
 from unittest.mock import patch
 
-from django.test import Client, RequestFactory, TestCase
-from django.db.utils import ProgrammingError
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.db.utils import IntegrityError, ProgrammingError
+from django.utils import timezone
 from ninja.errors import HttpError
 
+from assets_backend import redis_client
+from assets_backend.redis_client import get_redis_client
+
 from .api import admin_required, jwt_auth, user_required
+from .audit import AuditSink
+from .cache import user_cache
 from .constants import is_auth_exempt_path
+from .hashing import HashingPool, PoolSaturatedError, averify_password, hashing_pool
+from .maintenance import purge_refresh_tokens
 from .models import AuthAuditLog, RefreshToken, User
+from .revocation import AccessTokenDenylist, BloomFilter, access_denylist
+from .rotation import RotationError, rotate_refresh_token
+from .throttle import LoginThrottle, MemoryThrottleBackend, RedisThrottleBackend
 from .tokens import create_access_token
+from .utils import get_client_ip
 
 
 class AuthApiTests(TestCase):
@@ -44,6 +66,41 @@ class AuthApiTests(TestCase):
         )
         self.assertEqual(response.status_code, 401)
 
+    def test_login_inactive_account_looks_like_bad_credentials(self) -> None:
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        failures = []
+
+        def on_failure(sender, credentials, **kwargs) -> None:
+            failures.append(credentials)
+
+        user_login_failed.connect(on_failure)
+        self.addCleanup(user_login_failed.disconnect, on_failure)
+        response = self.client.post(
+            "/api/auth/login",
+            {"email": self.user.email, "password": self.password},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["detail"], "Invalid credentials")
+        self.assertEqual(failures, [{"email": self.user.email}])
+
+    @override_settings(AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.AllowAllUsersModelBackend"])
+    def test_login_defers_to_configured_backends(self) -> None:
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with patch("apps.auth.api.averify_password") as verify:
+            response = self.client.post(
+                "/api/auth/login",
+                {"email": self.user.email, "password": self.password},
+                content_type="application/json",
+            )
+
+        verify.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+
     def test_register_creates_user_and_returns_profile(self) -> None:
         payload = {
             "fullName": "Alice Example",
@@ -117,6 +174,15 @@ class AuthApiTests(TestCase):
         self.assertEqual(payload["email"], self.user.email)
         self.assertEqual(payload["role"], self.user.role)
 
+    def test_verify_returns_identity_headers(self) -> None:
+        token = create_access_token(self.user)
+        response = self.client.get("/api/auth/verify", HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response["X-User-Id"], str(self.user.pk))
+        self.assertEqual(response["X-User-Role"], User.Role.ADMIN)
+
+        self.assertEqual(self.client.get("/api/auth/verify").status_code, 401)
+
     def test_auth_exempt_paths_cover_refresh_and_logout(self) -> None:
         self.assertTrue(is_auth_exempt_path("/api/auth/refresh"))
         self.assertTrue(is_auth_exempt_path("/api/auth/logout"))
@@ -169,3 +235,605 @@ class AuthAuditLogTests(TestCase):
 
         self.assertIsNone(result)
         self.assertTrue(any("Skipping authentication audit log write" in msg for msg in logs.output))
+
+
+class UserCacheTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(
+            email="cached@example.com",
+            password="Passw0rd!",
+            first_name="Cached",
+            last_name="User",
+        )
+
+    def test_repeat_authentication_skips_database(self) -> None:
+        token = create_access_token(self.user)
+        jwt_auth.authenticate(self.factory.get("/protected"), token)
+
+        request = self.factory.get("/protected")
+        with self.assertNumQueries(0):
+            jwt_auth.authenticate(request, token)
+
+        self.assertEqual(request.user.pk, self.user.pk)
+        self.assertEqual(request.user.full_name, "Cached User")
+        stats = user_cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_user_save_invalidates_cached_snapshot(self) -> None:
+        token = create_access_token(self.user)
+        jwt_auth.authenticate(self.factory.get("/protected"), token)
+
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(HttpError) as ctx:
+            jwt_auth.authenticate(self.factory.get("/protected"), token)
+        self.assertEqual(ctx.exception.status_code, 403)
+
+    def test_user_delete_invalidates_cached_snapshot(self) -> None:
+        token = create_access_token(self.user)
+        jwt_auth.authenticate(self.factory.get("/protected"), token)
+
+        self.user.delete()
+
+        with self.assertRaises(HttpError) as ctx:
+            jwt_auth.authenticate(self.factory.get("/protected"), token)
+        self.assertEqual(ctx.exception.status_code, 401)
+
+    def test_redis_url_without_client_library_fails_loudly(self) -> None:
+        get_redis_client.cache_clear()
+        self.addCleanup(get_redis_client.cache_clear)
+        with (
+            override_settings(REDIS_URL="redis://localhost:6379/0"),
+            patch.object(redis_client, "redis", None),
+            self.assertRaises(ImproperlyConfigured),
+        ):
+            get_redis_client()
+
+
+class AuditSinkTests(TestCase):
+    def _entry(self, email: str) -> AuthAuditLog:
+        return AuthAuditLog.build(
+            user=None,
+            email=email,
+            action=AuthAuditLog.Action.ACCESS_DENIED,
+            successful=False,
+        )
+
+    def test_flush_bulk_writes_pending_events(self) -> None:
+        sink = AuditSink(maxsize=10, batch_size=2, flush_interval=60)
+        with patch.object(sink, "_ensure_worker"):
+            for index in range(3):
+                sink.submit(self._entry(f"user{index}@example.com"))
+
+        with self.assertNumQueries(2):
+            written = sink.flush()
+
+        self.assertEqual(written, 3)
+        self.assertEqual(AuthAuditLog.objects.count(), 3)
+        self.assertEqual(sink.stats()["depth"], 0)
+        self.assertEqual(sink.stats()["flushes"], 2)
+
+    def test_rows_keep_the_event_time_not_the_flush_time(self) -> None:
+        sink = AuditSink(maxsize=10, batch_size=10, flush_interval=60)
+        event_time = timezone.now() - timedelta(seconds=30)
+        with patch("apps.auth.models.timezone.now", return_value=event_time):
+            entry = self._entry("early@example.com")
+        with patch.object(sink, "_ensure_worker"):
+            sink.submit(entry)
+
+        sink.flush()
+
+        self.assertEqual(AuthAuditLog.objects.get().created_at, event_time)
+
+    def test_drop_oldest_policy_discards_head_of_queue(self) -> None:
+        sink = AuditSink(maxsize=2, batch_size=10, flush_interval=60, policy="drop_oldest")
+        with patch.object(sink, "_ensure_worker"):
+            for index in range(3):
+                sink.submit(self._entry(f"user{index}@example.com"))
+
+        sink.flush()
+        emails = set(AuthAuditLog.objects.values_list("email", flat=True))
+        self.assertEqual(emails, {"user1@example.com", "user2@example.com"})
+        self.assertEqual(sink.stats()["dropped"], 1)
+
+    def test_block_policy_drops_after_timeout(self) -> None:
+        sink = AuditSink(maxsize=1, batch_size=10, flush_interval=60, policy="block", block_timeout=0.01)
+        with patch.object(sink, "_ensure_worker"):
+            self.assertTrue(sink.submit(self._entry("first@example.com")))
+            self.assertFalse(sink.submit(self._entry("second@example.com")))
+
+        self.assertEqual(sink.stats()["dropped"], 1)
+
+    def test_sample_policy_rejects_events_when_full(self) -> None:
+        sink = AuditSink(maxsize=4, batch_size=10, flush_interval=60, policy="sample", sample_rate=0)
+        with patch.object(sink, "_ensure_worker"):
+            results = [sink.submit(self._entry(f"user{index}@example.com")) for index in range(5)]
+
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(sink.stats()["depth"], 3)
+
+    def test_failed_batch_is_counted_and_later_batches_still_write(self) -> None:
+        sink = AuditSink(maxsize=10, batch_size=2, flush_interval=60)
+        with patch.object(sink, "_ensure_worker"):
+            for index in range(3):
+                sink.submit(self._entry(f"user{index}@example.com"))
+
+        real_bulk_create = AuthAuditLog.objects.bulk_create
+        calls = []
+
+        def fail_first(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise IntegrityError("duplicate key")
+            return real_bulk_create(*args, **kwargs)
+
+        with (
+            patch.object(AuthAuditLog.objects, "bulk_create", side_effect=fail_first),
+            self.assertLogs("apps.auth.audit", "WARNING"),
+        ):
+            written = sink.flush()
+
+        self.assertEqual(written, 1)
+        self.assertEqual(sink.stats()["failed"], 2)
+        self.assertEqual(sink.stats()["written"], 1)
+
+
+class RefreshRotationTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="rotate@example.com", password="Passw0rd!")
+        self.lifetime = timedelta(days=1)
+        self.token, self.raw_token = RefreshToken.create_for_user(self.user, lifetime=self.lifetime)
+
+    def test_rotation_claims_token_and_keeps_family(self) -> None:
+        rotation = rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+
+        self.token.refresh_from_db()
+        self.assertTrue(self.token.revoked)
+        self.assertIsNotNone(self.token.rotated_at)
+        self.assertEqual(rotation.current.family, self.token.family)
+        self.assertFalse(rotation.current.revoked)
+
+    def test_concurrent_reuse_within_grace_is_rejected_without_revoking_family(self) -> None:
+        rotation = rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+
+        with self.assertRaises(RotationError) as ctx:
+            rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+
+        self.assertEqual(ctx.exception.reason, "concurrent_rotation")
+        rotation.current.refresh_from_db()
+        self.assertFalse(rotation.current.revoked)
+
+    def test_reuse_after_grace_revokes_whole_family(self) -> None:
+        rotation = rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+        RefreshToken.objects.filter(pk=self.token.pk).update(
+            rotated_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        with self.assertRaises(RotationError) as ctx:
+            rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+
+        self.assertEqual(ctx.exception.reason, "reuse_detected")
+        self.assertEqual(ctx.exception.revoked, 1)
+        rotation.current.refresh_from_db()
+        self.assertTrue(rotation.current.revoked)
+
+    def test_expired_token_is_rejected(self) -> None:
+        RefreshToken.objects.filter(pk=self.token.pk).update(expires_at=timezone.now())
+
+        with self.assertRaises(RotationError) as ctx:
+            rotate_refresh_token(self.raw_token, lifetime=self.lifetime)
+
+        self.assertEqual(ctx.exception.reason, "expired_or_revoked")
+
+
+class PurgeRefreshTokensTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="purge@example.com", password="Passw0rd!")
+        lifetime = timedelta(days=14)
+        self.live, _ = RefreshToken.create_for_user(self.user, lifetime=lifetime)
+        self.recently_revoked, _ = RefreshToken.create_for_user(self.user, lifetime=lifetime)
+        self.recently_revoked.revoke()
+        self.old_revoked, _ = RefreshToken.create_for_user(self.user, lifetime=lifetime)
+        RefreshToken.objects.filter(pk=self.old_revoked.pk).update(
+            revoked=True, expires_at=timezone.now() + timedelta(days=3)
+        )
+        self.expired = []
+        for _ in range(5):
+            token, _ = RefreshToken.create_for_user(self.user, lifetime=lifetime)
+            self.expired.append(token.pk)
+        RefreshToken.objects.filter(pk__in=self.expired).update(expires_at=timezone.now() - timedelta(days=1))
+
+    def test_purge_deletes_expired_and_old_revoked_tokens_in_batches(self) -> None:
+        result = purge_refresh_tokens(batch_size=2)
+
+        self.assertEqual(result.deleted, 6)
+        self.assertEqual(result.batches, 3)
+        remaining = set(RefreshToken.objects.values_list("pk", flat=True))
+        self.assertEqual(remaining, {self.live.pk, self.recently_revoked.pk})
+
+    def test_retention_runs_from_rotation_not_issue_time(self) -> None:
+        now = timezone.now()
+        # Issued long ago, rotated a minute ago: reuse detection still needs it.
+        rotated_recently, _ = RefreshToken.create_for_user(self.user, lifetime=timedelta(days=14))
+        RefreshToken.objects.filter(pk=rotated_recently.pk).update(
+            revoked=True, rotated_at=now - timedelta(minutes=1), expires_at=now + timedelta(hours=1)
+        )
+        rotated_long_ago, _ = RefreshToken.create_for_user(self.user, lifetime=timedelta(days=14))
+        RefreshToken.objects.filter(pk=rotated_long_ago.pk).update(
+            revoked=True, rotated_at=now - timedelta(days=2), expires_at=now + timedelta(days=12)
+        )
+
+        purge_refresh_tokens(now=now)
+
+        remaining = set(RefreshToken.objects.values_list("pk", flat=True))
+        self.assertEqual(remaining, {self.live.pk, self.recently_revoked.pk, rotated_recently.pk})
+
+    def test_dry_run_command_leaves_rows_in_place(self) -> None:
+        out = StringIO()
+        call_command("purge_refresh_tokens", "--dry-run", stdout=out)
+
+        self.assertIn("6 refresh tokens would be deleted", out.getvalue())
+        self.assertEqual(RefreshToken.objects.count(), 8)
+
+
+class HashingPoolTests(TestCase):
+    async def test_pool_rejects_jobs_beyond_pending_limit(self) -> None:
+        pool = HashingPool(max_workers=1, max_pending=0)
+        release = threading.Event()
+
+        blocked = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        with self.assertRaises(PoolSaturatedError):
+            await pool.run(sum, [1, 2])
+        release.set()
+        await blocked
+
+        stats = pool.stats()
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["peak"], 1)
+
+    async def test_hash_from_a_demoted_algorithm_needs_upgrade(self) -> None:
+        current = make_password("Passw0rd!")
+        legacy = make_password("Passw0rd!", hasher="pbkdf2_sha1")
+
+        self.assertEqual(await averify_password("Passw0rd!", current), (True, False))
+        self.assertEqual(await averify_password("Passw0rd!", legacy), (True, True))
+        self.assertEqual(await averify_password("wrong", legacy), (False, False))
+
+    def test_login_returns_503_when_pool_is_saturated(self) -> None:
+        User.objects.create_user(email="busy@example.com", password="Passw0rd!")
+
+        with patch.object(hashing_pool, "run", side_effect=PoolSaturatedError("busy")):
+            response = Client().post(
+                "/api/auth/login",
+                {"email": "busy@example.com", "password": "Passw0rd!"},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 503)
+
+
+class FakeRedis:
+    """The handful of Redis commands ``RedisThrottleBackend`` uses, on a caller-supplied clock."""
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self.clock = clock
+        self.values: dict[str, int] = {}
+        self.expiry: dict[str, float] = {}
+
+    def _live(self, key: str) -> bool:
+        if key in self.expiry and self.expiry[key] <= self.clock():
+            self.values.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.values
+
+    def pipeline(self) -> "FakeRedis.Pipeline":
+        return self.Pipeline(self)
+
+    def incr(self, key: str) -> int:
+        self.values[key] = self.values[key] + 1 if self._live(key) else 1
+        return self.values[key]
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.expiry[key] = self.clock() + seconds
+        return self._live(key)
+
+    def get(self, key: str) -> int | None:
+        return self.values[key] if self._live(key) else None
+
+    def set(self, key: str, value: int, ex: int) -> None:
+        self.values[key] = value
+        self.expiry[key] = self.clock() + ex
+
+    def pttl(self, key: str) -> int:
+        return int((self.expiry[key] - self.clock()) * 1000) if self._live(key) else -2
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+            self.expiry.pop(key, None)
+
+    class Pipeline:
+        def __init__(self, client: "FakeRedis") -> None:
+            self.client = client
+            self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+        def __getattr__(self, name: str) -> Callable[..., None]:
+            return lambda *args: self.calls.append((name, args))
+
+        def execute(self) -> list[Any]:
+            return [getattr(self.client, name)(*args) for name, args in self.calls]
+
+
+class LoginThrottleTests(TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000_000.0
+        self.throttle = self.build_throttle(MemoryThrottleBackend(clock=lambda: self.now))
+
+    def build_throttle(self, backend: MemoryThrottleBackend | RedisThrottleBackend) -> LoginThrottle:
+        return LoginThrottle(
+            backend,
+            window=60,
+            limits={"ip": 100, "email": 100, "ip_email": 3},
+            lockout=10,
+            max_lockout=40,
+        )
+
+    def test_lockout_doubles_on_repeat_offences(self) -> None:
+        for _ in range(3):
+            self.assertEqual(self.throttle.check("10.0.0.1", "victim@example.com"), 0)
+            self.throttle.record_failure("10.0.0.1", "victim@example.com")
+        self.assertEqual(self.throttle.check("10.0.0.1", "Victim@example.com"), 10)
+
+        self.now += 11
+        self.assertEqual(self.throttle.check("10.0.0.1", "victim@example.com"), 0)
+        self.throttle.record_failure("10.0.0.1", "victim@example.com")
+        self.assertEqual(self.throttle.check("10.0.0.1", "victim@example.com"), 20)
+
+        stats = self.throttle.stats()
+        self.assertEqual(stats["lockouts"], 2)
+        self.assertEqual(stats["rejected"], 2)
+
+    def test_success_clears_email_counters(self) -> None:
+        backends = {
+            "memory": MemoryThrottleBackend(clock=lambda: self.now),
+            "redis": RedisThrottleBackend(FakeRedis(lambda: self.now), clock=lambda: self.now),
+        }
+        for name, backend in backends.items():
+            with self.subTest(name):
+                throttle = self.build_throttle(backend)
+                for _ in range(2):
+                    throttle.record_failure("10.0.0.1", "user@example.com")
+                throttle.record_success("10.0.0.1", "user@example.com")
+                throttle.record_failure("10.0.0.1", "user@example.com")
+
+                self.assertEqual(throttle.check("10.0.0.1", "user@example.com"), 0)
+
+    def test_locked_login_is_rejected_before_password_check(self) -> None:
+        User.objects.create_user(email="locked@example.com", password="Passw0rd!")
+        for _ in range(3):
+            self.throttle.record_failure("127.0.0.1", "locked@example.com")
+
+        with patch("apps.auth.api.login_throttle", self.throttle), patch(
+            "apps.auth.api.averify_password"
+        ) as verify:
+            response = Client().post(
+                "/api/auth/login",
+                {"email": "locked@example.com", "password": "Passw0rd!"},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "10")
+        verify.assert_not_called()
+
+    def test_forwarded_for_is_ignored_unless_proxies_are_trusted(self) -> None:
+        request = RequestFactory().get("/", HTTP_X_FORWARDED_FOR="1.2.3.4, 10.0.0.9", REMOTE_ADDR="172.16.0.2")
+
+        self.assertEqual(get_client_ip(request), "172.16.0.2")
+        with override_settings(TRUSTED_PROXY_COUNT=1):
+            self.assertEqual(get_client_ip(request), "10.0.0.9")
+        with override_settings(TRUSTED_PROXY_COUNT=5):
+            self.assertEqual(get_client_ip(request), "1.2.3.4")
+
+    def test_lock_tables_stay_bounded(self) -> None:
+        backend = MemoryThrottleBackend(max_keys=3, clock=lambda: self.now)
+        for index in range(10):
+            backend.lock(f"ip:10.0.0.{index}", 10, 40)
+
+        self.assertEqual(len(backend._locks), 3)
+        self.assertEqual(len(backend._strikes), 3)
+        self.assertGreater(backend.lock_remaining("ip:10.0.0.9"), 0)
+
+        self.now += 100
+        backend.lock("ip:10.0.1.1", 10, 40)
+        self.assertEqual(list(backend._locks), ["ip:10.0.1.1"])
+        self.assertEqual(list(backend._strikes), ["ip:10.0.1.1"])
+
+
+class AccessTokenRevocationTests(TestCase):
+    def setUp(self) -> None:
+        access_denylist.clear()
+        self.client = Client()
+        self.password = "Passw0rd!"
+        self.user = User.objects.create_user(email="revoke@example.com", password=self.password)
+
+    def test_bloom_filter_has_no_false_negatives(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for index in range(1000):
+            bloom.add(f"jti:{index}")
+
+        self.assertTrue(all(f"jti:{index}" in bloom for index in range(1000)))
+        false_positives = sum(f"other:{index}" in bloom for index in range(1000))
+        self.assertLess(false_positives, 50)
+
+    def test_denylist_forgets_entries_after_expiry(self) -> None:
+        now = [1000.0]
+        denylist = AccessTokenDenylist(capacity=100, sync_interval=1, clock=lambda: now[0])
+        denylist.revoke("jti:abc", expires_at=1010.0)
+
+        self.assertTrue(denylist.is_revoked({"jti": "abc"}))
+        self.assertFalse(denylist.is_revoked({"jti": "other"}))
+        now[0] = 1011.0
+        self.assertFalse(denylist.is_revoked({"jti": "abc"}))
+        self.assertEqual(denylist.stats()["entries"], 0)
+
+    def test_logout_revokes_live_access_token(self) -> None:
+        login_response = self.client.post(
+            "/api/auth/login",
+            {"email": self.user.email, "password": self.password},
+            content_type="application/json",
+        )
+        access_token = login_response.json()["access_token"]
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {access_token}"}
+        self.assertEqual(Client().get("/api/auth/me", **headers).status_code, 200)
+
+        self.client.post("/api/auth/logout")
+
+        self.assertEqual(Client().get("/api/auth/me", **headers).status_code, 401)
+
+    def test_refresh_token_revoke_invalidates_its_session(self) -> None:
+        token, _ = RefreshToken.create_for_user(self.user, lifetime=timedelta(days=1))
+        access_token = create_access_token(self.user, session_id=token.family)
+
+        token.revoke()
+
+        with self.assertRaises(HttpError) as ctx:
+            jwt_auth.authenticate(RequestFactory().get("/protected"), access_token)
+        self.assertEqual(ctx.exception.status_code, 401)
+
+
+class AuditSearchTests(TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.admin = User.objects.create_user(
+            email="auditor@example.com",
+            password="Passw0rd!",
+            role=User.Role.ADMIN,
+            is_staff=True,
+        )
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.admin)}"}
+        for index in range(5):
+            AuthAuditLog.log(
+                user=None,
+                email="target@example.com",
+                action=AuthAuditLog.Action.LOGIN,
+                successful=index % 2 == 0,
+                ip_address="10.0.0.9",
+            )
+        AuthAuditLog.log(
+            user=None,
+            email="other@example.com",
+            action=AuthAuditLog.Action.LOGOUT,
+            successful=True,
+        )
+
+    def test_cursor_pagination_walks_filtered_results(self) -> None:
+        seen: list[int] = []
+        response = self.client.get(
+            "/api/auth/audit", {"email": "target@example.com", "limit": 2, "count": "exact"}, **self.headers
+        )
+        while True:
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            self.assertEqual(payload["count"], 5)
+            seen.extend(item["id"] for item in payload["items"])
+            if not payload["next"]:
+                break
+            # Links keep the filters, so following them is enough.
+            response = self.client.get(payload["next"], **self.headers)
+        self.assertIsNotNone(payload["prev"])
+
+        expected = list(
+            AuthAuditLog.objects.filter(email="target@example.com")
+            .order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_filters_and_estimate_mode(self) -> None:
+        response = self.client.get(
+            "/api/auth/audit",
+            {"action": "login", "successful": "false", "count": "estimate"},
+            **self.headers,
+        )
+        payload = response.json()
+        self.assertEqual(len(payload["items"]), 2)
+        self.assertEqual(payload["count"], 2)
+
+    def test_search_requires_admin(self) -> None:
+        user = User.objects.create_user(email="plain@example.com", password="Passw0rd!")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(user)}"}
+        self.assertEqual(self.client.get("/api/auth/audit", **headers).status_code, 403)
+
+    def test_invalid_cursor_is_rejected(self) -> None:
+        response = self.client.get("/api/auth/audit", {"cursor": "not-a-cursor"}, **self.headers)
+        self.assertEqual(response.status_code, 400)
+
+
+class SessionManagementTests(TestCase):
+    def setUp(self) -> None:
+        access_denylist.clear()
+        self.password = "Passw0rd!"
+        self.user = User.objects.create_user(email="sessions@example.com", password=self.password)
+        self.client = Client()
+        self.other_device = Client()
+        for client in (self.client, self.other_device):
+            client.post(
+                "/api/auth/login",
+                {"email": self.user.email, "password": self.password},
+                content_type="application/json",
+            )
+
+    def test_list_marks_current_session(self) -> None:
+        sessions = self.client.get("/api/auth/sessions").json()
+
+        self.assertEqual(len(sessions), 2)
+        self.assertEqual(sum(session["current"] for session in sessions), 1)
+
+    def test_revoke_all_except_current_keeps_caller_signed_in(self) -> None:
+        response = self.client.post(
+            "/api/auth/sessions/revoke", {"exceptCurrent": True}, content_type="application/json"
+        )
+
+        self.assertEqual(response.json(), {"revoked": 1})
+        self.assertEqual(self.client.get("/api/auth/me").status_code, 200)
+        self.assertEqual(self.other_device.get("/api/auth/me").status_code, 401)
+        self.assertTrue(
+            AuthAuditLog.objects.filter(user=self.user, action=AuthAuditLog.Action.TOKEN_REVOKED).exists()
+        )
+
+    def test_revoke_single_session(self) -> None:
+        sessions = self.client.get("/api/auth/sessions").json()
+        other = next(session for session in sessions if not session["current"])
+
+        response = self.client.post(f"/api/auth/sessions/{other['id']}/revoke")
+        self.assertEqual(response.json(), {"revoked": 1})
+        again = self.client.post(f"/api/auth/sessions/{other['id']}/revoke")
+        self.assertEqual(again.status_code, 404)
+
+    def test_admin_bulk_revoke_covers_every_user(self) -> None:
+        second = User.objects.create_user(email="second@example.com", password=self.password)
+        RefreshToken.create_for_user(second, lifetime=timedelta(days=1))
+        admin = User.objects.create_user(
+            email="incident@example.com", password=self.password, role=User.Role.ADMIN
+        )
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(admin)}"}
+
+        response = Client().post(
+            "/api/auth/admin/sessions/revoke",
+            {"userIds": [self.user.pk, second.pk]},
+            content_type="application/json",
+            **headers,
+        )
+
+        self.assertEqual(response.json(), {"revoked": 3})
+        self.assertFalse(RefreshToken.objects.filter(revoked=False).exists())
+        self.assertEqual(
+            AuthAuditLog.objects.filter(action=AuthAuditLog.Action.TOKEN_REVOKED).count(), 2
+        )
@@ -0,0 +1,263 @@
+"""Sliding-window login throttle with exponential lockout."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from assets_backend.redis_client import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], float]
+
+
+class MemoryThrottleBackend:
+    """Per-process counters; adequate for a single node or development."""
+
+    blocking = False
+
+    def __init__(self, *, max_keys: int = 100_000, clock: Clock = time.time) -> None:
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._locks: OrderedDict[str, float] = OrderedDict()
+        self._strikes: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._mutex = threading.Lock()
+
+    def _counts(self, key: str, window: int) -> tuple[int, int, float]:
+        now = self.clock()
+        bucket = int(now // window)
+        start, current, previous = self._buckets.get(key, (bucket, 0, 0))
+        if start == bucket - 1:
+            start, current, previous = bucket, 0, current
+        elif start != bucket:
+            start, current, previous = bucket, 0, 0
+        self._buckets[key] = (start, current, previous)
+        self._buckets.move_to_end(key)
+        return current, previous, (now % window) / window
+
+    def increment(self, key: str, window: int) -> float:
+        with self._mutex:
+            current, previous, elapsed = self._counts(key, window)
+            current += 1
+            self._buckets[key] = (self._buckets[key][0], current, previous)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return previous * (1 - elapsed) + current
+
+    def lock_remaining(self, key: str) -> float:
+        with self._mutex:
+            until = self._locks.get(key)
+            if until is None:
+                return 0.0
+            remaining = until - self.clock()
+            if remaining <= 0:
+                del self._locks[key]
+                return 0.0
+            return remaining
+
+    def lock(self, key: str, base: int, ceiling: int) -> int:
+        with self._mutex:
+            now = self.clock()
+            strikes, expires = self._strikes.get(key, (0, now))
+            strikes = strikes + 1 if expires > now else 1
+            seconds = min(base * 2 ** (strikes - 1), ceiling)
+            self._strikes[key] = (strikes, now + ceiling * 2)
+            self._strikes.move_to_end(key)
+            self._locks[key] = now + seconds
+            self._locks.move_to_end(key)
+            self._prune(now)
+            return seconds
+
+    def _prune(self, now: float) -> None:
+        # Oldest first: drop expired entries, then anything beyond max_keys.
+        while self._locks:
+            key, until = next(iter(self._locks.items()))
+            if until > now and len(self._locks) <= self.max_keys:
+                break
+            del self._locks[key]
+        while self._strikes:
+            key, (_, expires) = next(iter(self._strikes.items()))
+            if expires > now and len(self._strikes) <= self.max_keys:
+                break
+            del self._strikes[key]
+
+    def reset(self, key: str, window: int) -> None:  # noqa: ARG002 - one bucket entry per key
+        with self._mutex:
+            self._buckets.pop(key, None)
+            self._locks.pop(key, None)
+            self._strikes.pop(key, None)
+
+
+class RedisThrottleBackend:
+    """Counters shared across processes through Redis."""
+
+    blocking = True
+
+    def __init__(self, client: Any, *, prefix: str = "auth:throttle:", clock: Clock = time.time) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+
+    def increment(self, key: str, window: int) -> float:
+        now = self.clock()
+        bucket = int(now // window)
+        base = f"{self.prefix}count:{key}"
+        pipe = self.client.pipeline()
+        pipe.incr(f"{base}:{bucket}")
+        pipe.expire(f"{base}:{bucket}", window * 2)
+        pipe.get(f"{base}:{bucket - 1}")
+        current, _, previous = pipe.execute()
+        elapsed = (now % window) / window
+        return int(previous or 0) * (1 - elapsed) + int(current)
+
+    def lock_remaining(self, key: str) -> float:
+        ttl = self.client.pttl(f"{self.prefix}lock:{key}")
+        return max(ttl, 0) / 1000
+
+    def lock(self, key: str, base: int, ceiling: int) -> int:
+        strikes_key = f"{self.prefix}strikes:{key}"
+        pipe = self.client.pipeline()
+        pipe.incr(strikes_key)
+        pipe.expire(strikes_key, ceiling * 2)
+        strikes, _ = pipe.execute()
+        seconds = min(base * 2 ** (int(strikes) - 1), ceiling)
+        self.client.set(f"{self.prefix}lock:{key}", 1, ex=seconds)
+        return seconds
+
+    def reset(self, key: str, window: int) -> None:
+        bucket = int(self.clock() // window)
+        base = f"{self.prefix}count:{key}"
+        self.client.delete(
+            f"{self.prefix}lock:{key}",
+            f"{self.prefix}strikes:{key}",
+            f"{base}:{bucket}",
+            f"{base}:{bucket - 1}",
+        )
+
+
+class LoginThrottle:
+    """Reject login attempts for locked IPs, emails and IP/email pairs.
+
+    Only failed attempts are counted.  When a key's sliding-window count
+    reaches its limit it is locked for ``lockout`` seconds, doubling with each
+    repeated lockout up to ``max_lockout``.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryThrottleBackend | RedisThrottleBackend,
+        *,
+        window: int,
+        limits: dict[str, int],
+        lockout: int,
+        max_lockout: int,
+    ) -> None:
+        self.backend = backend
+        self.window = window
+        self.limits = limits
+        self.lockout = lockout
+        self.max_lockout = max_lockout
+        self._mutex = threading.Lock()
+        self.checked = 0
+        self.rejected = 0
+        self.failures = 0
+        self.lockouts = 0
+
+    @staticmethod
+    def keys(ip_address: str, email: str) -> dict[str, str]:
+        email = email.strip().lower()
+        return {
+            "ip": f"ip:{ip_address}",
+            "email": f"email:{email}",
+            "ip_email": f"ip_email:{ip_address}:{email}",
+        }
+
+    def check(self, ip_address: str, email: str) -> int:
+        """Return seconds until the caller may retry, or 0 when allowed."""
+
+        try:
+            retry_after = max(
+                self.backend.lock_remaining(key) for key in self.keys(ip_address, email).values()
+            )
+        except Exception:  # noqa: BLE001 - fail open when the backend is unavailable
+            logger.warning("Login throttle backend unavailable; allowing attempt")
+            retry_after = 0.0
+        with self._mutex:
+            self.checked += 1
+            if retry_after > 0:
+                self.rejected += 1
+        return math.ceil(retry_after)
+
+    def record_failure(self, ip_address: str, email: str) -> None:
+        with self._mutex:
+            self.failures += 1
+        try:
+            for scope, key in self.keys(ip_address, email).items():
+                if self.backend.increment(key, self.window) >= self.limits[scope]:
+                    self.backend.lock(key, self.lockout, self.max_lockout)
+                    with self._mutex:
+                        self.lockouts += 1
+        except Exception:  # noqa: BLE001 - counting is best effort
+            logger.warning("Login throttle backend unavailable; failure not recorded")
+
+    def record_success(self, ip_address: str, email: str) -> None:
+        keys = self.keys(ip_address, email)
+        try:
+            self.backend.reset(keys["email"], self.window)
+            self.backend.reset(keys["ip_email"], self.window)
+        except Exception:  # noqa: BLE001 - counting is best effort
+            logger.warning("Login throttle backend unavailable; counters not reset")
+
+    async def acheck(self, ip_address: str, email: str) -> int:
+        return await self._call(self.check, ip_address, email)
+
+    async def arecord_failure(self, ip_address: str, email: str) -> None:
+        await self._call(self.record_failure, ip_address, email)
+
+    async def arecord_success(self, ip_address: str, email: str) -> None:
+        await self._call(self.record_success, ip_address, email)
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.backend.blocking:
+            return await sync_to_async(func, thread_sensitive=False)(*args)
+        return func(*args)
+
+    def stats(self) -> dict[str, int]:
+        with self._mutex:
+            return {
+                "checked": self.checked,
+                "rejected": self.rejected,
+                "failures": self.failures,
+                "lockouts": self.lockouts,
+            }
+
+
+def _build_backend() -> MemoryThrottleBackend | RedisThrottleBackend:
+    client = get_redis_client()
+    if client is not None:
+        return RedisThrottleBackend(client)
+    return MemoryThrottleBackend()
+
+
+login_throttle = LoginThrottle(
+    _build_backend(),
+    window=settings.AUTH_THROTTLE_WINDOW_SECONDS,
+    limits={
+        "ip": settings.AUTH_THROTTLE_IP_LIMIT,
+        "email": settings.AUTH_THROTTLE_EMAIL_LIMIT,
+        "ip_email": settings.AUTH_THROTTLE_IP_EMAIL_LIMIT,
+    },
+    lockout=settings.AUTH_THROTTLE_LOCKOUT_SECONDS,
+    max_lockout=settings.AUTH_THROTTLE_MAX_LOCKOUT_SECONDS,
+)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from datetime import timedelta
 from typing import Any
 
@@ -17,14 +18,17 @@ def _expiration(delta: timedelta) -> int:
     return int(expires_at.timestamp())
 
 
-def create_access_token(user: User) -> str:
+def create_access_token(user: User, *, session_id: Any = None) -> str:
     payload: dict[str, Any] = {
         "sub": str(user.pk),
         "type": "access",
         "role": user.role,
         "email": user.email,
+        "jti": uuid.uuid4().hex,
         "exp": _expiration(timedelta(minutes=settings.ACCESS_TOKEN_LIFETIME_MINUTES)),
     }
+    if session_id is not None:
+        payload["sid"] = str(session_id)
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -2,15 +2,28 @@ from __future__ import annotations
 
 from typing import Any
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.http import HttpRequest
 
+from .audit import record_event
 from .models import AuthAuditLog, User
 
 
 def get_client_ip(request: HttpRequest) -> str:
+    """Return the client address, trusting ``X-Forwarded-For`` only as far as ``TRUSTED_PROXY_COUNT``.
+
+    Each trusted proxy appends the address it received the request from, so
+    the client is the entry that many places from the right; anything to its
+    left was supplied by the client and is ignored.
+    """
+
+    proxies = settings.TRUSTED_PROXY_COUNT
     header = request.META.get("HTTP_X_FORWARDED_FOR")
-    if header:
-        return header.split(",")[0].strip()
+    if proxies > 0 and header:
+        entries = [entry.strip() for entry in header.split(",") if entry.strip()]
+        if entries:
+            return entries[max(len(entries) - proxies, 0)]
     return request.META.get("REMOTE_ADDR", "")
 
 
@@ -27,7 +40,7 @@ def log_event(
     successful: bool,
     metadata: dict[str, Any] | None = None,
 ) -> None:
-    AuthAuditLog.log(
+    record_event(
         user=user,
         email=email,
         action=action,
@@ -38,6 +51,10 @@ def log_event(
     )
 
 
+async def alog_event(**kwargs: Any) -> None:
+    await sync_to_async(log_event)(**kwargs)
+
+
 def split_full_name(full_name: str) -> tuple[str, str]:
     parts = full_name.strip().split()
     if not parts:
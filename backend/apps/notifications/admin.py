@@ -1,3 +1,10 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import NotificationTemplate
+
+
+@admin.register(NotificationTemplate)
+class NotificationTemplateAdmin(admin.ModelAdmin):
+    list_display = ("key", "description", "version", "updated_at")
+    search_fields = ("key", "description")
+    readonly_fields = ("version", "updated_at")
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from ninja import Router
+from ninja.errors import HttpError
 
 from apps.auth.dependencies import JWTAuth
+from assets_backend.pagination import KeysetPaginator, paginated_response
 
 from .models import Notification
+from .unread import mark_all_read, mark_read, unread_count
 
 
 jwt_auth = JWTAuth()
 router = Router(tags=["Notifications"])
+notification_pages = KeysetPaginator("-created_at", default_limit=10)
 
 
 @router.get("status", summary="Notifications service heartbeat")
@@ -16,12 +20,10 @@ def notifications_status(request):
     return {"service": "notifications", "status": "ok"}
 
 
-@router.get("recent", auth=jwt_auth, summary="Return the latest notifications for the current user")
-def recent_notifications(request):
-    notifications = Notification.objects.filter(user=request.user).order_by("-created_at")[:10]
-
-    return [
-        {
+@router.get("recent", auth=jwt_auth, summary="Page through the current user's notifications, newest first")
+def recent_notifications(request, cursor: str | None = None, limit: int | None = None):
+    def serialize(notification: Notification) -> dict[str, object]:
+        return {
             "id": notification.id,
             "channel": notification.channel,
             "channelLabel": notification.get_channel_display(),
@@ -29,6 +31,27 @@ def recent_notifications(request):
             "statusLabel": notification.get_status_display(),
             "message": notification.message,
             "createdAt": notification.created_at,
+            "readAt": notification.read_at,
         }
-        for notification in notifications
-    ]
+
+    notifications = Notification.objects.filter(user=request.user, is_digest=False)
+    return paginated_response(request, notifications, notification_pages, serialize, cursor=cursor, limit=limit)
+
+
+@router.get("unread-count", auth=jwt_auth, summary="Number of unread notifications for the current user")
+def get_unread_count(request):
+    return {"unread": unread_count(request.user)}
+
+
+@router.post("read-all", auth=jwt_auth, summary="Mark all of the current user's notifications as read")
+def read_all(request):
+    updated = mark_all_read(request.user)
+    return {"updated": updated, "unread": unread_count(request.user)}
+
+
+@router.post("{notification_id}/read", auth=jwt_auth, summary="Mark one notification as read")
+def read_one(request, notification_id: int):
+    if not Notification.objects.filter(pk=notification_id, user=request.user, is_digest=False).exists():
+        raise HttpError(404, "Notification not found")
+    updated = mark_read(request.user, [notification_id])
+    return {"updated": updated, "unread": unread_count(request.user)}
@@ -6,3 +6,8 @@ class NotificationsConfig(AppConfig):
     name = "apps.notifications"
     label = "assets_notifications"
     verbose_name = "Notifications"
+
+    def ready(self) -> None:
+        super().ready()
+
+        from . import signals  # noqa: F401
@@ -0,0 +1,158 @@
+"""Per-channel delivery adapters.
+
+Adapters run on worker threads and must not touch the database: everything
+they need (message, recipient, the user's email) is loaded when the batch is
+claimed.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import smtplib
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+from .models import Notification
+
+
+class DeliveryError(Exception):
+    """A send failed; ``retryable`` says whether another attempt may succeed."""
+
+    def __init__(self, message: str, *, retryable: bool = True) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class ChannelAdapter:
+    channel: str
+
+    def send(self, notification: Notification) -> None:
+        raise NotImplementedError
+
+
+class EmailAdapter(ChannelAdapter):
+    """Send through Django's configured ``EMAIL_BACKEND``."""
+
+    channel = Notification.Channel.EMAIL
+
+    def send(self, notification: Notification) -> None:
+        recipient = notification.recipient or notification.user.email
+        try:
+            send_mail(settings.NOTIFICATION_EMAIL_SUBJECT, notification.message, None, [recipient])
+        except (smtplib.SMTPException, OSError) as exc:
+            raise DeliveryError(str(exc)) from exc
+
+
+class HttpAdapter(ChannelAdapter):
+    """POST a JSON payload to a provider; 4xx responses other than 429 are permanent."""
+
+    url = ""
+
+    def headers(self) -> dict[str, str]:
+        return {}
+
+    def payload(self, notification: Notification) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def send(self, notification: Notification) -> None:
+        if not notification.recipient:
+            msg = f"No {notification.channel} recipient"
+            raise DeliveryError(msg, retryable=False)
+        request = urllib.request.Request(  # noqa: S310 - fixed https provider URL
+            self.url,
+            data=json.dumps(self.payload(notification)).encode("utf-8"),
+            headers={"Content-Type": "application/json", **self.headers()},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=settings.NOTIFICATION_HTTP_TIMEOUT_SECONDS):  # noqa: S310
+                return
+        except urllib.error.HTTPError as exc:
+            msg = f"HTTP {exc.code}: {exc.read(500).decode('utf-8', 'replace')}"
+            raise DeliveryError(msg, retryable=exc.code >= 500 or exc.code == 429) from exc
+        except (urllib.error.URLError, OSError) as exc:
+            raise DeliveryError(str(exc)) from exc
+
+
+class SmsIrAdapter(HttpAdapter):
+    channel = Notification.Channel.SMS
+    url = "https://api.sms.ir/v1/send/bulk"
+
+    def headers(self) -> dict[str, str]:
+        return {"x-api-key": settings.SMS_IR_API_KEY}
+
+    def payload(self, notification: Notification) -> dict[str, Any]:
+        return {
+            "lineNumber": settings.SMS_IR_LINE_NUMBER,
+            "messageText": notification.message,
+            "mobiles": [notification.recipient],
+        }
+
+
+class WhatsAppAdapter(HttpAdapter):
+    channel = Notification.Channel.WHATSAPP
+
+    def __init__(self) -> None:
+        self.url = f"https://graph.facebook.com/v17.0/{settings.WHATSAPP_PHONE_NUMBER_ID}/messages"
+
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {settings.WHATSAPP_ACCESS_TOKEN}"}
+
+    def payload(self, notification: Notification) -> dict[str, Any]:
+        return {
+            "messaging_product": "whatsapp",
+            "to": notification.recipient,
+            "type": "text",
+            "text": {"body": notification.message},
+        }
+
+
+class FakeAdapter(ChannelAdapter):
+    """Offline stand-in that sleeps for ``latency`` and fails at ``failure_rate``."""
+
+    def __init__(self, channel: str, *, latency: float = 0.0, failure_rate: float = 0.0) -> None:
+        self.channel = channel
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent: list[int] = []
+        self._lock = threading.Lock()
+
+    def send(self, notification: Notification) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        if random.random() < self.failure_rate:  # noqa: S311
+            msg = "Fake provider failure"
+            raise DeliveryError(msg)
+        with self._lock:
+            self.sent.append(notification.pk)
+
+
+def build_adapters(provider: str | None = None) -> dict[str, ChannelAdapter]:
+    """Return the adapter for each channel; ``provider`` is ``live`` or ``fake``."""
+
+    provider = provider or settings.NOTIFICATION_PROVIDER
+    if provider == "fake":
+        return {
+            channel: FakeAdapter(
+                channel,
+                latency=settings.NOTIFICATION_FAKE_LATENCY_MS / 1000,
+                failure_rate=settings.NOTIFICATION_FAKE_FAILURE_PERCENT / 100,
+            )
+            for channel in Notification.Channel.values
+        }
+    if provider != "live":
+        msg = f"Unknown notification provider: {provider}"
+        raise ValueError(msg)
+    adapters: dict[str, ChannelAdapter] = {Notification.Channel.EMAIL: EmailAdapter()}
+    if settings.SMS_IR_API_KEY:
+        adapters[Notification.Channel.SMS] = SmsIrAdapter()
+    if settings.WHATSAPP_ACCESS_TOKEN:
+        adapters[Notification.Channel.WHATSAPP] = WhatsAppAdapter()
+    return adapters
@@ -0,0 +1,146 @@
+"""Merge bursts of queued notifications into per-user digests before delivery.
+
+Queued first-attempt rows for the same user, channel and recipient whose
+``created_at`` fall within ``NOTIFICATION_COALESCE_WINDOW_SECONDS`` of each
+other are replaced by one digest row, as long as the digest fits the
+channel's maximum message length.  Source rows stay in the table with
+``status=merged`` and ``merged_into`` pointing at the digest.
+
+A run is merged only once its window has closed, and the worker holds
+first-attempt rows back for the same window (``claim_batch(hold=...)``),
+so a burst that spans several polls still ends up in one digest.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from .models import Notification
+
+
+@dataclass
+class CoalesceResult:
+    digests: int = 0
+    merged: int = 0
+
+
+def max_message_length(channel: str) -> int:
+    return {
+        Notification.Channel.SMS: settings.NOTIFICATION_SMS_MAX_LENGTH,
+        Notification.Channel.WHATSAPP: settings.NOTIFICATION_WHATSAPP_MAX_LENGTH,
+        Notification.Channel.EMAIL: settings.NOTIFICATION_EMAIL_MAX_LENGTH,
+    }[channel]
+
+
+def digest_message(messages: list[str]) -> str:
+    return "\n".join([f"{len(messages)} updates:", *(f"- {message}" for message in messages)])
+
+
+def _runs(rows: list[Notification], window: timedelta, closed_by: datetime) -> list[list[Notification]]:
+    """Split one group's rows (oldest first) into mergeable runs of two or more.
+
+    Runs starting after *closed_by* may still grow and are left for a later pass.
+    """
+
+    runs: list[list[Notification]] = []
+    current: list[Notification] = []
+    limit = max_message_length(rows[0].channel) if rows else 0
+
+    def close(run: list[Notification]) -> None:
+        if len(run) > 1 and run[0].created_at <= closed_by:
+            runs.append(run)
+
+    for row in rows:
+        candidate = [*current, row]
+        if (
+            current
+            and row.created_at - current[0].created_at <= window
+            and len(digest_message([item.message for item in candidate])) <= limit
+        ):
+            current = candidate
+            continue
+        close(current)
+        current = [row]
+    close(current)
+    return runs
+
+
+def coalesce_notifications(
+    *,
+    window: timedelta | None = None,
+    max_groups: int = 500,
+    now: datetime | None = None,
+) -> CoalesceResult:
+    """Replace bursts of queued notifications with digests; return what was merged.
+
+    Only rows no worker has claimed yet are considered, and they are locked
+    with ``SKIP LOCKED`` so a concurrent claim simply wins the row.  Only
+    runs whose first row is at least *window* old are merged.
+    """
+
+    now = now or timezone.now()
+    if window is None:
+        window = timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS)
+    closed_by = now - window
+    pending = Notification.objects.filter(
+        status=Notification.Status.QUEUED,
+        attempts=0,
+        is_digest=False,
+    )
+    groups = list(
+        pending.values("user_id", "channel", "recipient")
+        .annotate(count=Count("id"), oldest=Min("created_at"))
+        .filter(count__gt=1, oldest__lte=closed_by)
+        .order_by()
+        .values_list("user_id", "channel", "recipient")[:max_groups]
+    )
+    result = CoalesceResult()
+    if not groups:
+        return result
+
+    with transaction.atomic():
+        rows = list(
+            pending.select_for_update(skip_locked=True)
+            .filter(user_id__in={user_id for user_id, _, _ in groups})
+            .order_by("user_id", "channel", "recipient", "created_at", "id")
+        )
+        grouped: dict[tuple[int, str, str], list[Notification]] = {}
+        wanted = set(groups)
+        for row in rows:
+            key = (row.user_id, row.channel, row.recipient)
+            if key in wanted:
+                grouped.setdefault(key, []).append(row)
+
+        runs = [run for group in grouped.values() for run in _runs(group, window, closed_by)]
+        if not runs:
+            return result
+        digests = Notification.objects.bulk_create(
+            [
+                Notification(
+                    user_id=run[0].user_id,
+                    channel=run[0].channel,
+                    recipient=run[0].recipient,
+                    message=digest_message([row.message for row in run]),
+                    is_digest=True,
+                    next_attempt_at=now,
+                )
+                for run in runs
+            ]
+        )
+        sources = []
+        for digest, run in zip(digests, runs, strict=True):
+            for row in run:
+                row.status = Notification.Status.MERGED
+                row.merged_into_id = digest.pk
+                sources.append(row)
+        Notification.objects.bulk_update(sources, ["status", "merged_into"])
+
+    result.digests = len(digests)
+    result.merged = len(sources)
+    return result
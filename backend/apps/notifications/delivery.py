@@ -0,0 +1,163 @@
+"""Claim queued notifications and deliver them through channel adapters.
+
+Workers claim rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` and mark them
+``sending`` with a lease in a short transaction, then send outside any
+transaction.  Concurrent workers therefore never block on or double-claim
+each other's rows, and a worker that dies mid-batch only delays its rows
+until the lease runs out.  Delivery is at-least-once: set the lease well
+above the provider timeout.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .channels import ChannelAdapter, DeliveryError
+from .models import Notification
+
+
+@dataclass
+class DeliveryResult:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def extend(self, other: DeliveryResult) -> None:
+        self.claimed += other.claimed
+        self.sent += other.sent
+        self.retried += other.retried
+        self.failed += other.failed
+        self.batches += other.batches
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff with jitter after the *attempts*-th failed try."""
+
+    ceiling = min(
+        settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.NOTIFICATION_RETRY_MAX_SECONDS,
+    )
+    # Spread retries over the upper half of the window so a provider outage
+    # does not bring every failed row back in the same second.
+    return timedelta(seconds=ceiling * (0.5 + random.random() / 2))  # noqa: S311
+
+
+def claim_batch(
+    batch_size: int,
+    *,
+    now: datetime | None = None,
+    hold: timedelta | None = None,
+) -> list[Notification]:
+    """Lease up to *batch_size* due notifications to this worker.
+
+    With *hold*, a row on its first attempt waits until *hold* after it was
+    created, so the coalescing window can close before anything is sent.
+    """
+
+    now = now or timezone.now()
+    due = Notification.objects.filter(
+        status__in=[Notification.Status.QUEUED, Notification.Status.SENDING],
+        next_attempt_at__lte=now,
+    )
+    if hold:
+        due = due.exclude(attempts=0, is_digest=False, created_at__gt=now - hold)
+    with transaction.atomic():
+        batch = list(
+            due.select_for_update(skip_locked=True, of=("self",))
+            .select_related("user")
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if batch:
+            Notification.objects.filter(pk__in=[notification.pk for notification in batch]).update(
+                status=Notification.Status.SENDING,
+                attempts=F("attempts") + 1,
+                next_attempt_at=now + timedelta(seconds=settings.NOTIFICATION_LEASE_SECONDS),
+            )
+    for notification in batch:
+        notification.status = Notification.Status.SENDING
+        notification.attempts += 1
+    return batch
+
+
+def _send(adapters: dict[str, ChannelAdapter], notification: Notification) -> DeliveryError | None:
+    adapter = adapters.get(notification.channel)
+    if adapter is None:
+        return DeliveryError(f"No adapter configured for {notification.channel}")
+    try:
+        adapter.send(notification)
+    except DeliveryError as exc:
+        return exc
+    except Exception as exc:  # noqa: BLE001 - an adapter bug must not stop the batch
+        return DeliveryError(f"{type(exc).__name__}: {exc}")
+    return None
+
+
+def record_results(
+    outcomes: list[tuple[Notification, DeliveryError | None]],
+    *,
+    now: datetime | None = None,
+) -> DeliveryResult:
+    """Write a batch's outcomes: one UPDATE for the sent rows, one bulk update for the rest."""
+
+    now = now or timezone.now()
+    result = DeliveryResult(claimed=len(outcomes), batches=1)
+    sent_ids = [notification.pk for notification, error in outcomes if error is None]
+    unsent = []
+    for notification, error in outcomes:
+        if error is None:
+            continue
+        notification.error_log = f"attempt {notification.attempts}: {error}"
+        if error.retryable and notification.attempts < settings.NOTIFICATION_MAX_ATTEMPTS:
+            notification.status = Notification.Status.QUEUED
+            notification.next_attempt_at = now + retry_delay(notification.attempts)
+            result.retried += 1
+        else:
+            notification.status = Notification.Status.FAILED
+            result.failed += 1
+        unsent.append(notification)
+
+    with transaction.atomic():
+        if sent_ids:
+            Notification.objects.filter(pk__in=sent_ids).update(
+                status=Notification.Status.SENT, sent_at=now, error_log=""
+            )
+        if unsent:
+            Notification.objects.bulk_update(unsent, ["status", "error_log", "next_attempt_at"])
+    result.sent = len(sent_ids)
+    return result
+
+
+def deliver_batch(
+    adapters: dict[str, ChannelAdapter],
+    executor: Executor,
+    *,
+    batch_size: int,
+    now: datetime | None = None,
+    hold: timedelta | None = None,
+) -> DeliveryResult:
+    """Claim one batch, send it concurrently on *executor*, and record the outcomes."""
+
+    started = time.monotonic()
+    batch = claim_batch(batch_size, now=now, hold=hold)
+    if not batch:
+        return DeliveryResult()
+    errors = executor.map(lambda notification: _send(adapters, notification), batch)
+    result = record_results(list(zip(batch, errors, strict=True)))
+    result.elapsed = time.monotonic() - started
+    return result
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from apps.auth.models import User
+from apps.auth.tokens import create_access_token
+from assets_backend.events import publish_many, transport
+
+
+class Command(BaseCommand):
+    help = (
+        "Open many idle SSE connections to a running ASGI server, publish events and report delivery latency. "
+        "Raise the open-file limit (ulimit -n) on both ends before trying 10k connections."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--url", default="http://127.0.0.1:8000/api/events", help="Event stream URL.")
+        parser.add_argument("--connections", type=int, default=10_000, help="Concurrent streams to hold open.")
+        parser.add_argument("--users", type=int, default=1000, help="Synthetic users to spread streams over.")
+        parser.add_argument("--events", type=int, default=200, help="Events published once every stream is open.")
+        parser.add_argument("--hold", type=float, default=30.0, help="Seconds to keep idle streams open.")
+        parser.add_argument("--ramp", type=int, default=500, help="Connections opened per second.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if transport() == "local":
+            msg = "Set REDIS_URL or use PostgreSQL so events reach the server process."
+            raise CommandError(msg)
+        users = User.objects.bulk_create(
+            [User(email=f"bench-events-{index}@example.invalid", password="!") for index in range(options["users"])]
+        )
+        try:
+            tokens = {user.pk: create_access_token(user) for user in users}
+            asyncio.run(self._run(tokens, options))
+        finally:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+    async def _run(self, tokens: dict[int, str], options: dict[str, Any]) -> None:
+        url = urlsplit(options["url"])
+        user_ids = list(tokens)
+        latencies: list[float] = []
+        opened = asyncio.Event()
+        state = {"open": 0, "failed": 0}
+
+        def settle(outcome: str) -> None:
+            state[outcome] += 1
+            if state["open"] + state["failed"] == options["connections"]:
+                opened.set()
+
+        async def client(index: int) -> None:
+            user_id = user_ids[index % len(user_ids)]
+            try:
+                reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+                writer.write(
+                    (
+                        f"GET {url.path} HTTP/1.1\r\nHost: {url.netloc}\r\nAccept: text/event-stream\r\n"
+                        f"Authorization: Bearer {tokens[user_id]}\r\n\r\n"
+                    ).encode()
+                )
+                status = await reader.readline()
+                if b" 200 " not in status:
+                    raise ConnectionError(status.decode(errors="replace").strip())
+            except (OSError, ConnectionError):
+                settle("failed")
+                return
+            settle("open")
+            try:
+                while line := await reader.readline():
+                    if line.startswith(b"data: "):
+                        sent_at = json.loads(line[6:]).get("sentAt")
+                        if sent_at:
+                            latencies.append((time.time() - sent_at) * 1000)
+            except OSError:
+                pass
+            finally:
+                writer.close()
+
+        started = time.perf_counter()
+        tasks = []
+        for index in range(options["connections"]):
+            tasks.append(asyncio.create_task(client(index)))
+            if (index + 1) % options["ramp"] == 0:
+                await asyncio.sleep(1)
+        await asyncio.wait_for(opened.wait(), timeout=options["connections"] / options["ramp"] + 60)
+        self.stdout.write(
+            f"{state['open']} streams open, {state['failed']} failed, in {time.perf_counter() - started:.1f}s"
+        )
+
+        await asyncio.sleep(1)
+        for index in range(options["events"]):
+            user_id = user_ids[index % len(user_ids)]
+            await asyncio.to_thread(self._publish, user_id, index)
+        await asyncio.sleep(min(options["hold"], 5))
+        streams = [
+            options["connections"] // len(user_ids) + (position < options["connections"] % len(user_ids))
+            for position in range(len(user_ids))
+        ]
+        expected = sum(streams[index % len(user_ids)] for index in range(options["events"]))
+        if latencies:
+            quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            self.stdout.write(
+                f"{len(latencies)}/{expected} events delivered: "
+                f"p50={quantiles[49]:.1f}ms p95={quantiles[94]:.1f}ms max={max(latencies):.1f}ms"
+            )
+        else:
+            self.stdout.write(f"0/{expected} events delivered")
+        await asyncio.sleep(max(options["hold"] - 5, 0))
+        self.stdout.write(f"{sum(not task.done() for task in tasks)} streams still open after {options['hold']:.0f}s")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _publish(user_id: int, index: int) -> None:
+        with transaction.atomic():
+            publish_many([([user_id], "bench", {"index": index, "sentAt": time.time()})])
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.template import Context
+
+from apps.auth.models import User
+from apps.notifications.models import NotificationTemplate
+from apps.notifications.templating import clear_compiled, engine, render_batch
+
+
+BODY = (
+    "Hello {{ user.first_name|default:user.email }},\n"
+    'Your request for "{{ asset }}" was {{ status|lower }}.\n'
+    "{% if price %}Amount: {{ price }} IRR{% endif %}"
+)
+
+
+class Command(BaseCommand):
+    help = "Measure notification template renders per second, per-message versus compiled and batched."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=10_000, help="Recipients per fan-out.")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs per mode; the best run is reported.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Nothing is saved: the benchmark measures template work only.
+        template = NotificationTemplate(pk=0, key="bench", sms_body=BODY)
+        users = [
+            User(pk=index, email=f"user{index}@example.invalid", first_name=f"User {index}")
+            for index in range(options["users"])
+        ]
+        shared = {"asset": "Camera", "status": "Accepted", "price": 1_500_000}
+
+        def per_message() -> None:
+            for user in users:
+                engine.from_string(BODY).render(Context({**shared, "user": user}, autoescape=False))
+
+        def compiled() -> None:
+            for user in users:
+                render_batch(template, "sms", [{"user": user}], shared=shared)
+
+        def batched() -> None:
+            render_batch(template, "sms", ({"user": user} for user in users), shared=shared)
+
+        clear_compiled()
+        modes = (
+            ("per-message compile", per_message),
+            ("compiled, one render per call", compiled),
+            ("compiled and batched", batched),
+        )
+        for label, run in modes:
+            elapsed = self._best(run, options["repeat"])
+            self.stdout.write(f"{label}: {len(users)} renders in {elapsed:.3f}s ({len(users) / elapsed:.0f}/s)")
+        clear_compiled()
+
+    @staticmethod
+    def _best(run: Callable[[], None], repeat: int) -> float:
+        timings = []
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
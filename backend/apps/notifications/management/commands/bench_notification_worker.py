@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from apps.auth.models import User
+from apps.notifications.models import Notification
+
+
+class Command(BaseCommand):
+    help = "Queue synthetic notifications and drain them with N fake-provider worker processes."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=20_000, help="Notifications to queue.")
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker process counts to try.")
+        parser.add_argument("--concurrency", type=int, default=16, help="Sends in flight per worker.")
+        parser.add_argument("--latency-ms", type=int, default=20, help="Simulated provider latency.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor == "sqlite":
+            msg = "SQLite has no SKIP LOCKED; point DATABASE_URL at PostgreSQL to run this benchmark."
+            raise CommandError(msg)
+        user = User.objects.create_user(email="bench-notifications@example.invalid", password=None)
+        try:
+            channels = Notification.Channel.values
+            for workers in options["workers"]:
+                Notification.objects.bulk_create(
+                    [
+                        Notification(
+                            user=user,
+                            channel=channels[index % len(channels)],
+                            recipient="+989000000000",
+                            message=f"Benchmark message {index}",
+                        )
+                        for index in range(options["rows"])
+                    ],
+                    batch_size=5000,
+                )
+                elapsed = self._drain(workers, options)
+                sent = Notification.objects.filter(user=user, status=Notification.Status.SENT).count()
+                if sent != options["rows"]:
+                    msg = f"{sent} of {options['rows']} notifications were sent"
+                    raise CommandError(msg)
+                self.stdout.write(f"workers={workers}: {sent} sent in {elapsed:.2f}s ({sent / elapsed:.0f}/s)")
+                Notification.objects.filter(user=user).delete()
+        finally:
+            user.delete()
+
+    def _drain(self, workers: int, options: dict[str, Any]) -> float:
+        command = [
+            sys.executable,
+            str(settings.BASE_DIR / "manage.py"),
+            "notification_worker",
+            "--provider=fake",
+            "--drain",
+            "--coalesce-window=0",
+            f"--concurrency={options['concurrency']}",
+        ]
+        env = {
+            **os.environ,
+            "NOTIFICATION_FAKE_LATENCY_MS": str(options["latency_ms"]),
+            "NOTIFICATION_FAKE_FAILURE_PERCENT": "0",
+        }
+        started = time.perf_counter()
+        processes = [
+            subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)  # noqa: S603 - fixed argv
+            for _ in range(workers)
+        ]
+        failed = [process.args for process in processes if process.wait() != 0]
+        elapsed = time.perf_counter() - started
+        if failed:
+            msg = f"{len(failed)} workers exited with an error"
+            raise CommandError(msg)
+        return elapsed
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.notifications.unread import rebuild_unread_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's unread notification count from the notifications table."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows inserted per statement.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = rebuild_unread_counts(batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt unread counters for {count} users.")
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_notifications", "0003_delivery_worker"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="is_digest",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="merged_into",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="merged",
+                to="assets_notifications.notification",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                    ("merged", "Merged"),
+                ],
+                default="queued",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Notification = apps.get_model("assets_notifications", "Notification")
+    NotificationCounter = apps.get_model("assets_notifications", "NotificationCounter")
+    counts = (
+        Notification.objects.filter(is_digest=False)
+        .values("user_id")
+        .annotate(unread=Count("pk"))
+        .order_by()
+        .values_list("user_id", "unread")
+    )
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, unread=unread) for user_id, unread in counts],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_auth", "0004_authauditlog_indexes"),
+        ("assets_notifications", "0004_coalescing"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCounter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="notification_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("unread", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Notification counter",
+                "verbose_name_plural": "Notification counters",
+            },
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="read_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_digest", False), ("read_at__isnull", True)),
+                fields=["user", "created_at", "id"],
+                name="idx_notifications_unread",
+            ),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
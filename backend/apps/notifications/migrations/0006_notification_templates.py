@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_notifications", "0005_read_receipts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.SlugField(max_length=100, unique=True)),
+                ("description", models.CharField(blank=True, max_length=255)),
+                ("sms_body", models.TextField(blank=True)),
+                ("whatsapp_body", models.TextField(blank=True)),
+                ("email_body", models.TextField(blank=True)),
+                ("version", models.PositiveIntegerField(default=1, editable=False)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Notification template",
+                "verbose_name_plural": "Notification templates",
+            },
+        ),
+    ]
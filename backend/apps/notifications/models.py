@@ -1,5 +1,8 @@
+from typing import Any
+
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Notification(models.Model):
@@ -12,8 +15,10 @@ class Notification(models.Model):
 
     class Status(models.TextChoices):
         QUEUED = "queued", "Queued"
+        SENDING = "sending", "Sending"
         SENT = "sent", "Sent"
         FAILED = "failed", "Failed"
+        MERGED = "merged", "Merged"
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -21,19 +26,98 @@ class Notification(models.Model):
         related_name="notifications",
     )
     channel = models.CharField(max_length=20, choices=Channel.choices)
+    recipient = models.CharField(max_length=255, blank=True)
     message = models.TextField()
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
     created_at = models.DateTimeField(auto_now_add=True)
     sent_at = models.DateTimeField(null=True, blank=True)
+    read_at = models.DateTimeField(null=True, blank=True)
     error_log = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    # Earliest time a worker may claim the row: the retry time while queued,
+    # the lease expiry while sending.
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Digests are delivery-only rows built by ``apps.notifications.coalesce``;
+    # each merged source row points at the digest that carried it.
+    is_digest = models.BooleanField(default=False)
+    merged_into = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="merged",
+    )
 
     class Meta:
         indexes = [
-            models.Index(fields=["user"], name="idx_notifications_user"),
+            models.Index(fields=["user", "created_at", "id"], name="idx_notifications_user_created"),
             models.Index(fields=["status"], name="idx_notifications_status"),
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                name="idx_notifications_due",
+                condition=models.Q(status__in=["queued", "sending"]),
+            ),
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="idx_notifications_unread",
+                condition=models.Q(read_at__isnull=True, is_digest=False),
+            ),
         ]
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return f"Notification<{self.pk}>"
+
+
+class NotificationCounter(models.Model):
+    """Per-user unread notification count maintained by ``apps.notifications.unread``."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_counter",
+    )
+    unread = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Notification counter"
+        verbose_name_plural = "Notification counters"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"NotificationCounter<{self.user_id}>"
+
+
+class NotificationTemplate(models.Model):
+    """Per-channel message bodies in Django template syntax, rendered by ``apps.notifications.templating``."""
+
+    key = models.SlugField(max_length=100, unique=True)
+    description = models.CharField(max_length=255, blank=True)
+    sms_body = models.TextField(blank=True)
+    whatsapp_body = models.TextField(blank=True)
+    email_body = models.TextField(blank=True)
+    # Bumped on every save; each process recompiles a template whose version moved.
+    version = models.PositiveIntegerField(default=1, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Notification template"
+        verbose_name_plural = "Notification templates"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"NotificationTemplate<{self.key}>"
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+        # Incremented in SQL so concurrent edits never end up sharing a version.
+        self.version = models.F("version") + 1
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+        super().save(*args, **kwargs)
+        self.refresh_from_db(fields=["version"])
+
+    def body(self, channel: str) -> str:
+        return getattr(self, f"{channel}_body")
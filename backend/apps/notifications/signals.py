@@ -0,0 +1,36 @@
+"""Keep unread counters current and push live events for ``Notification`` writes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from assets_backend.events import publish
+
+from .models import Notification
+from .unread import adjust_unread
+
+
+@receiver(post_save, sender=Notification, dispatch_uid="notifications_publish_event")
+def publish_notification_event(
+    sender: type[Notification],  # noqa: ARG001
+    instance: Notification,
+    created: bool,
+    **kwargs: Any,  # noqa: ARG001
+) -> None:
+    if created and not instance.is_digest:
+        publish([instance.user_id], "notification", {"id": instance.pk, "channel": instance.channel})
+
+
+@receiver(post_save, sender=Notification, dispatch_uid="notifications_count_unread")
+def count_unread(sender: type[Notification], instance: Notification, created: bool, **kwargs: Any) -> None:  # noqa: ARG001
+    if created and not instance.is_digest and instance.read_at is None:
+        adjust_unread(instance.user_id, 1)
+
+
+@receiver(post_delete, sender=Notification, dispatch_uid="notifications_uncount_unread")
+def uncount_unread(sender: type[Notification], instance: Notification, **kwargs: Any) -> None:  # noqa: ARG001
+    if not instance.is_digest and instance.read_at is None:
+        adjust_unread(instance.user_id, -1)
@@ -1,3 +1,389 @@
-from django.test import TestCase
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.core import mail
+from asgiref.sync import sync_to_async
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from apps.auth.cache import user_cache
+from apps.auth.models import User
+from apps.auth.revocation import access_denylist
+from apps.auth.tokens import create_access_token, decode_token
+from assets_backend.events import event_hub
+from assets_backend.sse import EventStreamApp, format_event
+
+from .channels import DeliveryError, EmailAdapter, FakeAdapter
+from .coalesce import coalesce_notifications, digest_message
+from .delivery import claim_batch, deliver_batch, retry_delay
+from .models import Notification, NotificationCounter, NotificationTemplate
+from .templating import clear_compiled, get_compiled, render_batch, send_template
+from .unread import rebuild_unread_counts
+
+
+class FlakyAdapter(FakeAdapter):
+    def __init__(self, channel: str, error: DeliveryError) -> None:
+        super().__init__(channel)
+        self.error = error
+
+    def send(self, notification: Notification) -> None:
+        raise self.error
+
+
+@override_settings(
+    NOTIFICATION_MAX_ATTEMPTS=3,
+    NOTIFICATION_RETRY_BASE_SECONDS=10,
+    NOTIFICATION_RETRY_MAX_SECONDS=60,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+class NotificationWorkerTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="recipient@example.com", password="Passw0rd!")
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+
+    def queue(self, channel: str, count: int = 1) -> list[Notification]:
+        # Email falls back to the user's address; the phone channels need a recipient.
+        recipient = "" if channel == Notification.Channel.EMAIL else "+989120000000"
+        return Notification.objects.bulk_create(
+            [
+                Notification(user=self.user, channel=channel, recipient=recipient, message=f"Hello {index}")
+                for index in range(count)
+            ]
+        )
+
+    def test_batch_is_sent_through_channel_adapters(self) -> None:
+        self.queue(Notification.Channel.SMS, 3)
+        self.queue(Notification.Channel.EMAIL)
+        sms = FakeAdapter(Notification.Channel.SMS)
+        adapters = {Notification.Channel.SMS: sms, Notification.Channel.EMAIL: EmailAdapter()}
+
+        result = deliver_batch(adapters, self.executor, batch_size=10)
+
+        self.assertEqual((result.claimed, result.sent, result.retried, result.failed), (4, 4, 0, 0))
+        self.assertEqual(len(sms.sent), 3)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertFalse(Notification.objects.exclude(status=Notification.Status.SENT).exists())
+        self.assertFalse(Notification.objects.filter(sent_at__isnull=True).exists())
+        self.assertEqual(deliver_batch(adapters, self.executor, batch_size=10).claimed, 0)
+
+    def test_retryable_failures_back_off_then_fail(self) -> None:
+        (notification,) = self.queue(Notification.Channel.WHATSAPP)
+        adapters = {Notification.Channel.WHATSAPP: FlakyAdapter("whatsapp", DeliveryError("HTTP 503"))}
+
+        for attempt in range(1, 4):
+            Notification.objects.filter(pk=notification.pk).update(next_attempt_at=timezone.now())
+            result = deliver_batch(adapters, self.executor, batch_size=10)
+            notification.refresh_from_db()
+            self.assertEqual(notification.attempts, attempt)
+            self.assertEqual(notification.error_log, f"attempt {attempt}: HTTP 503")
+
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(notification.status, Notification.Status.FAILED)
+
+    def test_permanent_failure_is_not_retried(self) -> None:
+        (notification,) = self.queue(Notification.Channel.SMS)
+        adapters = {Notification.Channel.SMS: FlakyAdapter("sms", DeliveryError("HTTP 400", retryable=False))}
+
+        deliver_batch(adapters, self.executor, batch_size=10)
+
+        notification.refresh_from_db()
+        self.assertEqual((notification.status, notification.attempts), (Notification.Status.FAILED, 1))
+
+    def test_claim_leases_rows_and_reclaims_after_expiry(self) -> None:
+        self.queue(Notification.Channel.EMAIL, 2)
+
+        self.assertEqual(len(claim_batch(10)), 2)
+        self.assertEqual(claim_batch(10), [])
+        later = timezone.now() + timedelta(hours=1)
+        reclaimed = claim_batch(10, now=later)
+        self.assertEqual([notification.attempts for notification in reclaimed], [2, 2])
+
+    def test_retry_delay_grows_exponentially_up_to_the_cap(self) -> None:
+        for attempts, ceiling in ((1, 10), (2, 20), (3, 40), (6, 60)):
+            delay = retry_delay(attempts).total_seconds()
+            self.assertGreaterEqual(delay, ceiling / 2)
+            self.assertLessEqual(delay, ceiling)
+
+
+@override_settings(NOTIFICATION_SMS_MAX_LENGTH=70)
+class NotificationCoalescingTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(email="busy@example.com", password="Passw0rd!")
+        self.now = timezone.now()
+
+    def queue(self, message: str, *, seconds_ago: int = 0, channel: str = Notification.Channel.SMS, **fields):
+        notification = Notification.objects.create(
+            user=self.user, channel=channel, recipient="+989120000000", message=message, **fields
+        )
+        Notification.objects.filter(pk=notification.pk).update(created_at=self.now - timedelta(seconds=seconds_ago))
+        return notification
+
+    def test_burst_is_merged_into_one_digest(self) -> None:
+        sources = [self.queue(f"Ticket {index} moved", seconds_ago=30 - index) for index in range(3)]
+        lone = self.queue("Other channel", channel=Notification.Channel.WHATSAPP)
+        retry = self.queue("Second try", attempts=1)
+
+        self.assertEqual(coalesce_notifications(window=timedelta(seconds=60), now=self.now).digests, 0)
+        result = coalesce_notifications(window=timedelta(seconds=60), now=self.now + timedelta(seconds=30))
+
+        self.assertEqual((result.digests, result.merged), (1, 3))
+        digest = Notification.objects.get(is_digest=True)
+        self.assertEqual(digest.message, digest_message(["Ticket 0 moved", "Ticket 1 moved", "Ticket 2 moved"]))
+        self.assertEqual((digest.status, digest.recipient), (Notification.Status.QUEUED, "+989120000000"))
+        self.assertEqual(
+            set(digest.merged.values_list("pk", flat=True)), {notification.pk for notification in sources}
+        )
+        self.assertEqual(set(digest.merged.values_list("status", flat=True)), {Notification.Status.MERGED})
+        lone.refresh_from_db()
+        retry.refresh_from_db()
+        self.assertEqual((lone.status, retry.status), (Notification.Status.QUEUED, Notification.Status.QUEUED))
+
+    def test_window_and_length_limits_split_digests(self) -> None:
+        self.queue("Early", seconds_ago=600)
+        for index in range(4):
+            self.queue(f"Update number {index}", seconds_ago=10)
+
+        result = coalesce_notifications(window=timedelta(seconds=60), now=self.now + timedelta(seconds=50))
+
+        # "Early" is outside the window, and 70 characters fit three updates per digest.
+        self.assertEqual((result.digests, result.merged), (1, 3))
+        digest = Notification.objects.get(is_digest=True)
+        self.assertLessEqual(len(digest.message), 70)
+        self.assertEqual(Notification.objects.filter(status=Notification.Status.QUEUED, is_digest=False).count(), 2)
+
+    def test_burst_spanning_several_polls_becomes_one_digest(self) -> None:
+        window = timedelta(seconds=60)
+
+        def poll(seconds: int) -> list[Notification]:
+            now = self.now + timedelta(seconds=seconds)
+            coalesce_notifications(window=window, now=now)
+            return claim_batch(10, now=now, hold=window)
+
+        self.queue("Ticket 1 accepted")
+        self.assertEqual(poll(5), [])
+        self.queue("Ticket 1 active", seconds_ago=-20)
+        self.assertEqual(poll(25), [])
+        self.queue("Ticket 1 done", seconds_ago=-50)
+        self.assertEqual(poll(55), [])
+
+        claimed = poll(60)
+
+        self.assertEqual([notification.is_digest for notification in claimed], [True])
+        self.assertEqual(
+            claimed[0].message, digest_message(["Ticket 1 accepted", "Ticket 1 active", "Ticket 1 done"])
+        )
+        self.assertEqual(Notification.objects.filter(status=Notification.Status.MERGED).count(), 3)
+
+    def test_lone_notification_is_sent_once_its_window_closes(self) -> None:
+        window = timedelta(seconds=60)
+        self.queue("Only one")
+
+        self.assertEqual(claim_batch(10, now=self.now + timedelta(seconds=59), hold=window), [])
+        self.assertEqual(len(claim_batch(10, now=self.now + timedelta(seconds=60), hold=window)), 1)
+
+
+class LiveEventStreamTests(TransactionTestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.user = User.objects.create_user(email="live@example.com", password="Passw0rd!")
+        self.other = User.objects.create_user(email="elsewhere@example.com", password="Passw0rd!")
+
+    def stream(self, headers: list[tuple[bytes, bytes]], while_open=None) -> list[dict[str, object]]:
+        """Run one stream request, calling *while_open* once it is subscribed."""
+
+        app = EventStreamApp(event_hub, heartbeat=0.05)
+        sent: list[dict[str, object]] = []
+
+        async def scenario() -> None:
+            incoming: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+
+            async def send(message: dict[str, object]) -> None:
+                sent.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": "/api/events", "headers": headers}
+            task = asyncio.ensure_future(app(scope, incoming.get, send))
+            if while_open is not None:
+                while not event_hub.stats()["streams"]:
+                    await asyncio.sleep(0.01)
+                await sync_to_async(while_open, thread_sensitive=False)()
+                await asyncio.sleep(0.2)
+            await incoming.put({"type": "http.disconnect"})
+            await task
+
+        asyncio.run(scenario())
+        return sent
+
+    def test_stream_pushes_the_users_events(self) -> None:
+        def create_notifications() -> None:
+            Notification.objects.create(user=self.other, channel=Notification.Channel.SMS, message="Not yours")
+            Notification.objects.create(user=self.user, channel=Notification.Channel.EMAIL, message="Yours")
+
+        token = create_access_token(self.user).encode()
+        sent = self.stream([(b"authorization", b"Bearer " + token)], create_notifications)
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertIn((b"content-type", b"text/event-stream"), sent[0]["headers"])
+        body = b"".join(message.get("body", b"") for message in sent[1:])
+        mine = Notification.objects.get(user=self.user)
+        self.assertIn(f'event: notification\ndata: {{"id": {mine.pk}, "channel": "email"}}'.encode(), body)
+        self.assertEqual(body.count(b"event: "), 1)
+        self.assertIn(b": keepalive", body)
+        self.assertEqual(event_hub.stats()["streams"], 0)
+
+    def test_cookie_token_is_accepted_and_missing_token_rejected(self) -> None:
+        token = create_access_token(self.user)
+        self.assertEqual(self.stream([(b"cookie", f"access_token={token}".encode())])[0]["status"], 200)
+        self.assertEqual(self.stream([])[0]["status"], 401)
+        self.assertEqual(self.stream([(b"authorization", b"Bearer nonsense")])[0]["status"], 401)
+
+    def test_stream_ends_when_the_token_expires(self) -> None:
+        token = create_access_token(self.user)
+        expires_at = decode_token(token)["exp"]
+
+        # The token has a tenth of a second left when the stream opens.
+        with patch("assets_backend.sse.time") as clock:
+            clock.time.return_value = expires_at - 0.1
+            sent = self.stream([(b"authorization", f"Bearer {token}".encode())], lambda: None)
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(
+            sent[-1],
+            {
+                "type": "http.response.body",
+                "body": format_event("reauthenticate", {"reason": "expired"}),
+                "more_body": False,
+            },
+        )
+        self.assertEqual(event_hub.stats()["streams"], 0)
+
+    def test_heartbeat_closes_revoked_and_deactivated_streams(self) -> None:
+        def revoke() -> None:
+            access_denylist.revoke_token(decode_token(token))
+
+        def deactivate() -> None:
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+            user_cache.invalidate(self.user.pk)
+
+        self.addCleanup(access_denylist.clear)
+        for close in (revoke, deactivate):
+            with self.subTest(close.__name__):
+                token = create_access_token(self.user)
+                sent = self.stream([(b"authorization", f"Bearer {token}".encode())], close)
+
+                self.assertEqual(sent[0]["status"], 200)
+                self.assertEqual(sent[-1], {"type": "http.response.body", "body": b"", "more_body": False})
+                self.assertEqual(event_hub.stats()["streams"], 0)
+
+
+class UnreadNotificationTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(email="reader@example.com", password="Passw0rd!")
+        self.other = User.objects.create_user(email="bystander@example.com", password="Passw0rd!")
+        self.notifications = [
+            Notification.objects.create(user=self.user, channel=Notification.Channel.SMS, message=f"Update {index}")
+            for index in range(4)
+        ]
+        Notification.objects.create(user=self.other, channel=Notification.Channel.SMS, message="Not yours")
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def unread(self) -> int:
+        return self.client.get("/api/notifications/unread-count", **self.headers).json()["unread"]
+
+    def test_counter_follows_reads_and_deletes(self) -> None:
+        self.assertEqual(self.unread(), 4)
+
+        first = self.notifications[0]
+        response = self.client.post(f"/api/notifications/{first.pk}/read", **self.headers)
+        self.assertEqual(response.json(), {"updated": 1, "unread": 3})
+        # Reading twice is a no-op.
+        self.assertEqual(self.client.post(f"/api/notifications/{first.pk}/read", **self.headers).json()["unread"], 3)
+        other = Notification.objects.get(user=self.other)
+        self.assertEqual(self.client.post(f"/api/notifications/{other.pk}/read", **self.headers).status_code, 404)
+
+        self.notifications[1].delete()
+        Notification.objects.get(pk=first.pk).delete()
+        self.assertEqual(self.unread(), 2)
+
+    def test_mark_all_read_is_one_update(self) -> None:
+        # User lookup, savepoint, the notifications UPDATE, the counter UPDATE, release, counter read.
+        with self.assertNumQueries(6):
+            response = self.client.post("/api/notifications/read-all", **self.headers)
+
+        self.assertEqual(response.json(), {"updated": 4, "unread": 0})
+        self.assertFalse(Notification.objects.filter(user=self.user, read_at__isnull=True).exists())
+        self.assertEqual(Notification.objects.filter(user=self.other, read_at__isnull=True).count(), 1)
+        recent = self.client.get("/api/notifications/recent", **self.headers).json()
+        self.assertTrue(all(item["readAt"] for item in recent["items"]))
+
+    def test_rebuild_repairs_drift(self) -> None:
+        NotificationCounter.objects.filter(user=self.user).update(unread=99)
+
+        rebuild_unread_counts()
+
+        self.assertEqual(self.unread(), 4)
+        self.assertEqual(NotificationCounter.objects.get(user=self.other).unread, 1)
+
+
+class NotificationTemplateTests(TestCase):
+    def setUp(self) -> None:
+        clear_compiled()
+        self.addCleanup(clear_compiled)
+        self.template = NotificationTemplate.objects.create(
+            key="ticket-accepted",
+            sms_body="Hi {{ user.first_name }}, {{ asset }} & co. was accepted.",
+            email_body="Hello {{ user.email }}",
+        )
+        self.users = [
+            User.objects.create_user(email=f"fan{index}@example.com", password=None, first_name=f"Fan{index}")
+            for index in range(5)
+        ]
+
+    def test_compiled_once_until_the_version_changes(self) -> None:
+        compiled = get_compiled(self.template)
+        self.assertIs(get_compiled(NotificationTemplate.objects.get(pk=self.template.pk)), compiled)
+
+        self.template.sms_body = "Updated {{ asset }}"
+        self.template.save()
+
+        self.assertEqual(self.template.version, 2)
+        fresh = NotificationTemplate.objects.get(pk=self.template.pk)
+        self.assertIsNot(get_compiled(fresh), compiled)
+        self.assertEqual(render_batch(fresh, "sms", [{}], shared={"asset": "Camera"}), ["Updated Camera"])
+
+    def test_render_batch_isolates_each_context(self) -> None:
+        messages = render_batch(
+            self.template, "sms", [{"user": user} for user in self.users[:2]], shared={"asset": "<Camera>"}
+        )
+
+        self.assertEqual(
+            messages,
+            ["Hi Fan0, <Camera> & co. was accepted.", "Hi Fan1, <Camera> & co. was accepted."],
+        )
+        with self.assertRaises(ValueError):
+            render_batch(self.template, "whatsapp", [{}])
+
+    def test_send_template_fans_out_in_batches(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            queued = send_template(
+                "ticket-accepted",
+                Notification.Channel.SMS,
+                User.objects.filter(pk__in=[user.pk for user in self.users]).order_by("pk"),
+                context={"asset": "Camera"},
+                recipients={self.users[0].pk: "+989120000000"},
+                batch_size=2,
+            )
+
+        self.assertEqual(queued, 5)
+        rows = Notification.objects.filter(user__in=self.users).order_by("user_id")
+        self.assertEqual(
+            [row.message for row in rows], [f"Hi Fan{index}, Camera & co. was accepted." for index in range(5)]
+        )
+        self.assertEqual(rows[0].recipient, "+989120000000")
+        self.assertEqual(
+            set(NotificationCounter.objects.filter(user__in=self.users).values_list("unread", flat=True)), {1}
+        )
@@ -0,0 +1,96 @@
+"""Read receipts and the per-user unread count kept in ``NotificationCounter``.
+
+Unread notifications are the non-digest rows with no ``read_at``.  The
+counter is adjusted in the same transaction as every change to that set, so
+``GET /notifications/unread-count`` is a primary-key lookup instead of a
+count over the user's backlog.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.auth.models import User
+
+from .models import Notification, NotificationCounter
+
+
+def adjust_unread(user_id: int, delta: int) -> None:
+    """Shift *user_id*'s unread count by *delta*, never below zero."""
+
+    if not delta:
+        return
+    updated = NotificationCounter.objects.filter(user_id=user_id).update(unread=Greatest(F("unread") + delta, 0))
+    if updated or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            NotificationCounter.objects.create(user_id=user_id, unread=delta)
+    except IntegrityError:
+        NotificationCounter.objects.filter(user_id=user_id).update(unread=F("unread") + delta)
+
+
+def increment_unread(counts: Mapping[int, int]) -> None:
+    """Add ``counts[user_id]`` to each user's unread count with a few set-based statements."""
+
+    counts = {user_id: delta for user_id, delta in counts.items() if delta > 0}
+    if not counts:
+        return
+    # Create missing counters at zero first so the increments below never race an insert.
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id, unread=0) for user_id in counts], ignore_conflicts=True
+    )
+    by_delta: dict[int, list[int]] = defaultdict(list)
+    for user_id, delta in counts.items():
+        by_delta[delta].append(user_id)
+    for delta, user_ids in by_delta.items():
+        NotificationCounter.objects.filter(user_id__in=user_ids).update(unread=F("unread") + delta)
+
+
+def unread_count(user: User) -> int:
+    return NotificationCounter.objects.filter(user=user).values_list("unread", flat=True).first() or 0
+
+
+def _mark(user: User, notifications: Any) -> int:
+    with transaction.atomic():
+        updated = notifications.filter(user=user, read_at__isnull=True, is_digest=False).update(read_at=timezone.now())
+        adjust_unread(user.pk, -updated)
+    return updated
+
+
+def mark_read(user: User, notification_ids: Iterable[int]) -> int:
+    """Mark the given notifications read; return how many were unread."""
+
+    return _mark(user, Notification.objects.filter(pk__in=list(notification_ids)))
+
+
+def mark_all_read(user: User) -> int:
+    """Mark every unread notification read with a single UPDATE."""
+
+    return _mark(user, Notification.objects.all())
+
+
+def rebuild_unread_counts(*, batch_size: int = 1000) -> int:
+    """Replace every counter with a fresh count over the unread index."""
+
+    counts = (
+        Notification.objects.filter(read_at__isnull=True, is_digest=False)
+        .values("user_id")
+        .annotate(unread=Count("pk"))
+        .order_by()
+        .values_list("user_id", "unread")
+    )
+    with transaction.atomic():
+        NotificationCounter.objects.all().delete()
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, unread=unread) for user_id, unread in counts],
+            batch_size=batch_size,
+        )
+    return NotificationCounter.objects.count()
@@ -6,3 +6,8 @@ class PaymentsConfig(AppConfig):
     name = "apps.payments"
     label = "assets_payments"
     verbose_name = "Payments"
+
+    def ready(self) -> None:
+        super().ready()
+
+        from . import signals  # noqa: F401
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_payments", "0002_minor_units"),
+        ("assets_tickets", "0003_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["created_at", "id"], name="idx_payments_created"
+            ),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from assets_backend.money import MoneyField
+
 
 class Payment(models.Model):
     """Zarinpal payment associated with a ticket."""
@@ -16,7 +18,7 @@ class Payment(models.Model):
     )
     authority = models.CharField(max_length=64)
     ref_id = models.BigIntegerField(null=True, blank=True)
-    amount = models.DecimalField(max_digits=18, decimal_places=2)
+    amount = MoneyField()
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.INITIATED)
     created_at = models.DateTimeField(auto_now_add=True)
     verified_at = models.DateTimeField(null=True, blank=True)
@@ -27,6 +29,7 @@ class Payment(models.Model):
         ]
         indexes = [
             models.Index(fields=["ref_id"], name="idx_payments_ref"),
+            models.Index(fields=["created_at", "id"], name="idx_payments_created"),
         ]
         verbose_name = "Payment"
         verbose_name_plural = "Payments"
@@ -0,0 +1,22 @@
+"""Push live events for ``Payment`` writes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.tickets.models import Ticket
+from assets_backend.events import publish
+
+from .models import Payment
+
+
+@receiver(post_save, sender=Payment, dispatch_uid="payments_publish_event")
+def publish_payment_event(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:  # noqa: ARG001
+    if Payment.ticket.is_cached(instance):
+        users = [instance.ticket.borrower_id, instance.ticket.lender_id]
+    else:
+        users = Ticket.objects.filter(pk=instance.ticket_id).values_list("borrower_id", "lender_id").first() or []
+    publish(users, "payment", {"id": instance.pk, "ticketId": instance.ticket_id, "status": instance.status})
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from decimal import Decimal
 
-from django.db.models import Q, Sum
+from django.db.models import Sum
 from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 from ninja import Router
@@ -11,8 +10,9 @@ from ninja import Router
 from apps.auth.dependencies import JWTAuth
 from apps.notifications.models import Notification
 from apps.payments.models import Payment
-from apps.tickets.models import Ticket
-from apps.wallet.models import Wallet
+from apps.tickets.models import Ticket, TicketParticipant
+from apps.wallet.ledger import with_balance
+from apps.wallet.models import Wallet, WalletStats
 
 
 jwt_auth = JWTAuth()
@@ -26,28 +26,26 @@ def reports_status(request):
 
 @router.get("dashboard", auth=jwt_auth, summary="Dashboard snapshot for the current user")
 def dashboard_snapshot(request):
-    wallet = Wallet.objects.filter(user=request.user).first()
+    wallet = with_balance(Wallet.objects.filter(user=request.user)).first()
     currency = wallet.currency if wallet else "IRR"
-    wallet_balance = float(wallet.balance) if wallet else 0.0
+    balance = wallet.current_balance if wallet else 0
 
-    ticket_qs = Ticket.objects.filter(Q(borrower=request.user) | Q(lender=request.user))
-    active_tickets = ticket_qs.filter(status=Ticket.Status.ACTIVE).count()
+    participations = TicketParticipant.objects.filter(user=request.user)
+    active_tickets = participations.filter(status=Ticket.Status.ACTIVE).count()
 
-    pending_payouts = Payment.objects.filter(
-        Q(ticket__borrower=request.user) | Q(ticket__lender=request.user),
-        status=Payment.Status.INITIATED,
-    ).aggregate(total=Coalesce(Sum("amount"), Decimal("0")))["total"]
+    stats = WalletStats.objects.filter(user=request.user).only("initiated_sum").first()
+    pending_payouts = stats.initiated_sum if stats else 0
 
     metrics = [
         {"label": "Active Tickets", "value": active_tickets, "unit": None},
         {
             "label": "Wallet Balance",
-            "value": wallet_balance,
+            "value": balance,
             "unit": currency,
         },
         {
             "label": "Pending Payouts",
-            "value": float(pending_payouts or Decimal("0")),
+            "value": pending_payouts,
             "unit": currency,
         },
     ]
@@ -57,28 +55,29 @@ def dashboard_snapshot(request):
     start_date = today - timedelta(days=days_back)
 
     verified_payments = Payment.objects.filter(
-        Q(ticket__borrower=request.user) | Q(ticket__lender=request.user),
+        ticket__participants__user=request.user,
         status=Payment.Status.VERIFIED,
         created_at__date__gte=start_date,
     )
 
     daily_totals = {
-        entry["day"]: float(entry["total"])
+        entry["day"]: entry["total"]
         for entry in (
             verified_payments.annotate(day=TruncDate("created_at"))
             .values("day")
-            .annotate(total=Coalesce(Sum("amount"), Decimal("0")))
+            .annotate(total=Coalesce(Sum("amount"), 0))
         )
     }
 
     performance = []
     for offset in range(days_back, -1, -1):
         day = today - timedelta(days=offset)
-        performance.append({"label": day.strftime("%a"), "value": daily_totals.get(day, 0.0)})
+        performance.append({"label": day.strftime("%a"), "value": daily_totals.get(day, 0)})
 
     activities: list[tuple[datetime, dict[str, object]]] = []
 
-    for ticket in ticket_qs.order_by("-updated_at")[:3]:
+    for participation in participations.select_related("ticket").order_by("-updated_at", "-id")[:3]:
+        ticket = participation.ticket
         activities.append(
             (
                 ticket.updated_at,
@@ -92,7 +91,7 @@ def dashboard_snapshot(request):
         )
 
     for payment in (
-        Payment.objects.filter(Q(ticket__borrower=request.user) | Q(ticket__lender=request.user))
+        Payment.objects.filter(ticket__participants__user=request.user)
         .select_related("ticket")
         .order_by("-created_at")
         [:3]
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
-from django.db.models import Q
 from ninja import Router
+from ninja.errors import HttpError
 
-from apps.auth.dependencies import JWTAuth
+from apps.auth.dependencies import JWTAuth, require_role
+from apps.auth.models import User
+from assets_backend.pagination import KeysetPaginator, Page, paginated_response
 
-from .models import Ticket
+from .models import Ticket, TicketParticipant
+from .schemas import BulkTransitionRequest, TransitionRequest
+from .search import search_tickets
+from .transitions import role_allows, transition_tickets
 
 
 jwt_auth = JWTAuth()
 router = Router(tags=["Tickets"])
+ticket_pages = KeysetPaginator("-updated_at")
+admin_required = require_role(User.Role.ADMIN)
+
+
+def _serialize_ticket(ticket: Ticket) -> dict[str, object]:
+    return {
+        "id": ticket.id,
+        "assetName": ticket.asset_name,
+        "status": ticket.status,
+        "statusLabel": ticket.get_status_display(),
+        "borrower": ticket.borrower.full_name or ticket.borrower.email,
+        "lender": ticket.lender.full_name or ticket.lender.email,
+        "updatedAt": ticket.updated_at,
+    }
 
 
 @router.get("status", summary="Tickets service heartbeat")
@@ -17,23 +36,76 @@ def tickets_status(request):
     return {"service": "tickets", "status": "ok"}
 
 
-@router.get("", auth=jwt_auth, summary="List tickets associated with the current user")
-def list_tickets(request):
-    tickets = (
-        Ticket.objects.filter(Q(borrower=request.user) | Q(lender=request.user))
-        .select_related("borrower", "lender")
-        .order_by("-updated_at")
+@router.get("", auth=jwt_auth, summary="List tickets associated with the current user, most recently updated first")
+def list_tickets(request, cursor: str | None = None, limit: int | None = None):
+    participations = TicketParticipant.objects.filter(user=request.user).select_related(
+        "ticket__borrower", "ticket__lender"
     )
 
-    return [
-        {
-            "id": ticket.id,
-            "assetName": ticket.asset_name,
-            "status": ticket.status,
-            "statusLabel": ticket.get_status_display(),
-            "borrower": ticket.borrower.full_name or ticket.borrower.email,
-            "lender": ticket.lender.full_name or ticket.lender.email,
-            "updatedAt": ticket.updated_at,
+    def serialize(participation: TicketParticipant) -> dict[str, object]:
+        return _serialize_ticket(participation.ticket)
+
+    return paginated_response(request, participations, ticket_pages, serialize, cursor=cursor, limit=limit)
+
+
+@router.get("search", auth=jwt_auth, summary="Search the current user's tickets by asset name, best match first")
+def search(request, q: str, cursor: str | None = None, limit: int = 20):
+    limit = max(1, min(limit, ticket_pages.max_limit))
+    # Ranked results are paged by offset; the cursor is the offset of the page.
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError as exc:
+        raise HttpError(400, "Invalid cursor") from exc
+    if offset < 0:
+        raise HttpError(400, "Invalid cursor")
+
+    rows = search_tickets(request.user, q, offset=offset, limit=limit + 1)
+    page = Page(
+        rows[:limit],
+        next_cursor=str(offset + limit) if len(rows) > limit else None,
+        prev_cursor=str(max(offset - limit, 0)) if offset else None,
+    )
+    return {"items": [_serialize_ticket(ticket) for ticket in page.items], **page.links(request)}
+
+
+@router.post("{ticket_id}/transition", auth=jwt_auth, summary="Move one of the current user's tickets to a new status")
+def transition(request, ticket_id: int, payload: TransitionRequest):
+    is_admin = request.user.role == User.Role.ADMIN
+    roles = set()
+    if not is_admin:
+        parties = Ticket.objects.filter(pk=ticket_id).values_list("borrower_id", "lender_id").first() or ()
+        roles = {
+            role
+            for role, user_id in zip((TicketParticipant.Role.BORROWER, TicketParticipant.Role.LENDER), parties)
+            if user_id == request.user.pk
         }
-        for ticket in tickets
-    ]
+        if not roles:
+            raise HttpError(404, "Ticket not found")
+    if payload.status not in Ticket.Status.values:
+        raise HttpError(400, "Unknown status")
+    if not is_admin and not role_allows(roles, payload.status):
+        raise HttpError(403, "Your role on this ticket cannot set that status")
+
+    result = transition_tickets([ticket_id], payload.status, expected=payload.expected, actor=request.user)
+    reason = result.conflicts.get(ticket_id)
+    if reason == "not_found":
+        raise HttpError(404, "Ticket not found")
+    if reason == "invalid_transition":
+        raise HttpError(400, "Transition not allowed from the current status")
+    if reason == "status_changed":
+        raise HttpError(409, "Ticket status changed; reload and retry")
+    ticket = Ticket.objects.select_related("borrower", "lender").get(pk=ticket_id)
+    return _serialize_ticket(ticket)
+
+
+@router.post("transitions", auth=jwt_auth, summary="Move many tickets to a new status (admin only)")
+def bulk_transition(request, payload: BulkTransitionRequest):
+    admin_required(request)
+    if payload.status not in Ticket.Status.values:
+        raise HttpError(400, "Unknown status")
+
+    result = transition_tickets(payload.ticket_ids, payload.status, expected=payload.expected, actor=request.user)
+    return {
+        "applied": result.applied,
+        "conflicts": [{"id": ticket_id, "reason": reason} for ticket_id, reason in result.conflicts.items()],
+    }
@@ -6,3 +6,8 @@ class TicketsConfig(AppConfig):
     name = "apps.tickets"
     label = "assets_tickets"
     verbose_name = "Tickets"
+
+    def ready(self) -> None:
+        super().ready()
+
+        from . import signals  # noqa: F401
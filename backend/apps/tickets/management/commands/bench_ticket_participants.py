@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.auth.models import User
+from apps.tickets.models import Ticket, TicketParticipant
+from apps.tickets.participants import participant_rows
+
+
+ASSET_WORDS = (
+    "Canon", "Nikon", "Sony", "Dell", "Lenovo", "MacBook", "DJI", "Bosch", "Makita", "Yamaha",
+    "Garmin", "GoPro", "Epson", "Fujifilm", "Samsung", "Xiaomi", "Trek", "Coleman", "Dewalt", "Roland",
+)
+
+
+class Command(BaseCommand):
+    help = "Compare borrower-OR-lender ticket lookups with TicketParticipant range scans on synthetic data."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--tickets", type=int, default=1_000_000, help="Synthetic tickets to create.")
+        parser.add_argument("--users", type=int, default=10_000, help="Synthetic users to spread them over.")
+        parser.add_argument("--samples", type=int, default=200, help="Users queried per measurement.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows inserted per statement.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            sample = self.setup_data(options)
+            self.measure(sample, options)
+            transaction.set_rollback(True)
+
+    def setup_data(self, options: dict[str, Any]) -> list[int]:
+        """Create the synthetic users and tickets; return a sample of user ids."""
+
+        users = User.objects.bulk_create(
+            [
+                User(email=f"bench-participant-{index}@example.invalid", password="!")
+                for index in range(options["users"])
+            ],
+            batch_size=options["batch_size"],
+        )
+        user_ids = [user.pk for user in users]
+        self._populate(user_ids, options["tickets"], options["batch_size"])
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE assets_tickets_ticket")
+                cursor.execute("ANALYZE assets_tickets_ticketparticipant")
+        return random.sample(user_ids, min(options["samples"], len(user_ids)))  # noqa: S311
+
+    def measure(self, sample: list[int], options: dict[str, Any]) -> None:
+        def or_page(user_id: int) -> list[Any]:
+            return list(
+                Ticket.objects.filter(Q(borrower_id=user_id) | Q(lender_id=user_id))
+                .order_by("-updated_at", "-id")
+                .values_list("pk", flat=True)[:20]
+            )
+
+        def participant_page(user_id: int) -> list[Any]:
+            return list(
+                TicketParticipant.objects.filter(user_id=user_id)
+                .order_by("-updated_at", "-id")
+                .values_list("ticket_id", flat=True)[:20]
+            )
+
+        def or_active(user_id: int) -> int:
+            return Ticket.objects.filter(
+                Q(borrower_id=user_id) | Q(lender_id=user_id), status=Ticket.Status.ACTIVE
+            ).count()
+
+        def participant_active(user_id: int) -> int:
+            return TicketParticipant.objects.filter(user_id=user_id, status=Ticket.Status.ACTIVE).count()
+
+        self._report("page OR-join", or_page, sample)
+        self._report("page participant", participant_page, sample)
+        self._report("active OR-join", or_active, sample)
+        self._report("active participant", participant_active, sample)
+        if options["verbosity"] > 1:
+            self.stdout.write(
+                Ticket.objects.filter(Q(borrower_id=sample[0]) | Q(lender_id=sample[0]))
+                .order_by("-updated_at", "-id")[:20]
+                .explain()
+            )
+            self.stdout.write(
+                TicketParticipant.objects.filter(user_id=sample[0]).order_by("-updated_at", "-id")[:20].explain()
+            )
+
+    def _populate(self, user_ids: list[int], count: int, batch_size: int) -> None:
+        statuses = list(Ticket.Status.values)
+        created = 0
+        while created < count:
+            size = min(batch_size, count - created)
+            tickets = Ticket.objects.bulk_create(
+                [
+                    Ticket(
+                        asset_name=" ".join(random.sample(ASSET_WORDS, 2) + [str(created + index)]),  # noqa: S311
+                        borrower_id=random.choice(user_ids),  # noqa: S311
+                        lender_id=random.choice(user_ids),  # noqa: S311
+                        status=random.choice(statuses),  # noqa: S311
+                    )
+                    for index in range(size)
+                ]
+            )
+            TicketParticipant.objects.bulk_create(
+                [row for ticket in tickets for row in participant_rows(ticket)], batch_size=batch_size
+            )
+            created += size
+
+    def _report(self, label: str, func: Callable[[int], Any], user_ids: list[int]) -> None:
+        samples = []
+        for user_id in user_ids:
+            started = time.perf_counter()
+            func(user_id)
+            samples.append((time.perf_counter() - started) * 1000)
+        quantiles = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+        self.stdout.write(f"{label:<20} p50={quantiles[49]:.3f}ms p95={quantiles[94]:.3f}ms max={max(samples):.3f}ms")
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from django.db import connection
+
+from apps.auth.models import User
+from apps.tickets.search import rebuild_search_index, search_tickets, trigram_queryset
+
+from .bench_ticket_participants import ASSET_WORDS
+from .bench_ticket_participants import Command as ParticipantBenchCommand
+
+
+class Command(ParticipantBenchCommand):
+    help = "Measure /tickets/search latency for prefix and fuzzy queries on synthetic tickets."
+
+    def setup_data(self, options: dict[str, Any]) -> list[int]:
+        sample = super().setup_data(options)
+        # bulk_create skips the signals that feed the SQLite FTS table.
+        rebuild_search_index()
+        return sample
+
+    def measure(self, sample: list[int], options: dict[str, Any]) -> None:
+        users = {user.pk: user for user in User.objects.filter(pk__in=sample)}
+
+        def prefix(user_id: int) -> list[Any]:
+            return search_tickets(users[user_id], random.choice(ASSET_WORDS)[:3])  # noqa: S311
+
+        def words(user_id: int) -> list[Any]:
+            return search_tickets(users[user_id], " ".join(random.sample(ASSET_WORDS, 2)))  # noqa: S311
+
+        self._report("search prefix", prefix, sample)
+        self._report("search two words", words, sample)
+        if connection.vendor == "postgresql":
+            # The plan should show a bitmap scan on idx_tickets_asset_trgm, not a seq scan.
+            queryset = trigram_queryset(users[sample[0]], ASSET_WORDS[0][:3])[:20]
+            self.stdout.write(queryset.explain(analyze=True))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.tickets.transitions import CHUNK_SIZE, expire_stale_tickets
+
+
+class Command(BaseCommand):
+    help = "Cancel pending tickets that have not been updated for a number of days, in keyset batches."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TICKET_PENDING_EXPIRY_DAYS,
+            help="Age in days after which a pending ticket expires.",
+        )
+        parser.add_argument("--batch-size", type=int, default=CHUNK_SIZE, help="Tickets updated per statement.")
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Repeat every N seconds instead of running once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            result = expire_stale_tickets(
+                older_than=timedelta(days=options["days"]),
+                batch_size=options["batch_size"],
+            )
+            self.stdout.write(
+                f"Expired {len(result.applied)} pending tickets in {result.batches} batches "
+                f"({len(result.conflicts)} changed concurrently, {result.elapsed:.2f}s, {result.rate:.0f} rows/s)."
+            )
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
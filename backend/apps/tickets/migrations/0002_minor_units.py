@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:06
+
+import assets_backend.money
+from django.db import migrations
+from django.db.models.functions import Round
+
+
+def round_to_minor_units(apps, schema_editor):
+    # Ticket amounts carry no currency of their own; they are charged in rials,
+    # where one minor unit is one rial.  Refuse to guess for borrowers whose
+    # wallet is in another currency instead of misreading their amounts.
+    rows = apps.get_model("assets_tickets", "Ticket").objects
+    foreign = (
+        rows.filter(borrower__wallet__isnull=False)
+        .exclude(borrower__wallet__currency="IRR")
+        .exists()
+    )
+    if foreign:
+        msg = "Cannot convert ticket prices for borrowers whose wallet is not in IRR"
+        raise RuntimeError(msg)
+    rows.update(price=Round("price"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_tickets", "0001_initial"),
+        ("assets_wallet", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(round_to_minor_units, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="ticket",
+            name="price",
+            field=assets_backend.money.MoneyField(blank=True, null=True),
+        ),
+    ]
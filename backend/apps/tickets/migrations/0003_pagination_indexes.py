@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_tickets", "0002_minor_units"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["borrower", "updated_at", "id"],
+                name="idx_tickets_borrower_updated",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(
+                fields=["lender", "updated_at", "id"], name="idx_tickets_lender_updated"
+            ),
+        ),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_participants(apps, schema_editor):
+    Ticket = apps.get_model("assets_tickets", "Ticket")
+    TicketParticipant = apps.get_model("assets_tickets", "TicketParticipant")
+    batch = []
+    tickets = Ticket.objects.only(
+        "pk", "borrower_id", "lender_id", "status", "updated_at"
+    )
+    for ticket in tickets.iterator(chunk_size=2000):
+        for role, user_id in (
+            ("borrower", ticket.borrower_id),
+            ("lender", ticket.lender_id),
+        ):
+            if role == "lender" and user_id == ticket.borrower_id:
+                continue
+            batch.append(
+                TicketParticipant(
+                    user_id=user_id,
+                    ticket_id=ticket.pk,
+                    role=role,
+                    status=ticket.status,
+                    updated_at=ticket.updated_at,
+                )
+            )
+        if len(batch) >= 2000:
+            TicketParticipant.objects.bulk_create(batch)
+            batch = []
+    TicketParticipant.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_tickets", "0003_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketParticipant",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[("borrower", "Borrower"), ("lender", "Lender")],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("accepted", "Accepted"),
+                            ("active", "Active"),
+                            ("completed", "Completed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participants",
+                        to="assets_tickets.ticket",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_participations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ticket participant",
+                "verbose_name_plural": "Ticket participants",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "updated_at", "id"],
+                        name="idx_participants_user_updated",
+                    ),
+                    models.Index(
+                        fields=["user", "status"], name="idx_participants_user_status"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="ticketparticipant",
+            constraint=models.UniqueConstraint(
+                fields=("ticket", "user"), name="uniq_participant_ticket_user"
+            ),
+        ),
+        migrations.RunPython(populate_participants, migrations.RunPython.noop),
+        # Per-user listings read TicketParticipant now, so these only cost writes.
+        migrations.RemoveIndex(
+            model_name="ticket",
+            name="idx_tickets_borrower_updated",
+        ),
+        migrations.RemoveIndex(
+            model_name="ticket",
+            name="idx_tickets_lender_updated",
+        ),
+    ]
@@ -0,0 +1,41 @@
+"""Index ``Ticket.asset_name`` for search: pg_trgm on PostgreSQL, FTS5 on SQLite."""
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tickets_asset_trgm "
+            "ON assets_tickets_ticket USING gin (asset_name gin_trgm_ops)"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS assets_tickets_ticket_search "
+            "USING fts5(asset_name, prefix='2 3')"
+        )
+        schema_editor.execute(
+            "INSERT INTO assets_tickets_ticket_search (rowid, asset_name) "
+            "SELECT id, asset_name FROM assets_tickets_ticket"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS idx_tickets_asset_trgm")
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS assets_tickets_ticket_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_tickets", "0004_ticketparticipant"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
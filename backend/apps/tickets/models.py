@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import models
 
+from assets_backend.money import MoneyField
+
 
 class Ticket(models.Model):
     """Asset lending ticket linking borrowers and lenders."""
@@ -23,7 +25,7 @@ class Ticket(models.Model):
         on_delete=models.CASCADE,
         related_name="lent_tickets",
     )
-    price = models.DecimalField(max_digits=18, decimal_places=2, null=True, blank=True)
+    price = MoneyField(null=True, blank=True)
     duration_days = models.PositiveIntegerField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -32,10 +34,85 @@ class Ticket(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["borrower", "lender"], name="idx_tickets_borrower_lender"),
-            models.Index(fields=["status"], name="idx_tickets_status"),
+            models.Index(fields=["status", "updated_at", "id"], name="idx_tickets_status_updated"),
         ]
         verbose_name = "Ticket"
         verbose_name_plural = "Tickets"
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return f"Ticket<{self.pk}>"
+
+
+class TicketParticipant(models.Model):
+    """One row per user on a ticket, so per-user lookups avoid ``borrower OR lender``.
+
+    Copies ``status`` and ``updated_at`` from the ticket; kept in sync by
+    ``apps.tickets.participants``.
+    """
+
+    class Role(models.TextChoices):
+        BORROWER = "borrower", "Borrower"
+        LENDER = "lender", "Lender"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="ticket_participations",
+    )
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name="participants")
+    role = models.CharField(max_length=20, choices=Role.choices)
+    status = models.CharField(max_length=20, choices=Ticket.Status.choices)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["ticket", "user"], name="uniq_participant_ticket_user"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "updated_at", "id"], name="idx_participants_user_updated"),
+            models.Index(fields=["user", "status"], name="idx_participants_user_status"),
+        ]
+        verbose_name = "Ticket participant"
+        verbose_name_plural = "Ticket participants"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"TicketParticipant<{self.ticket_id}:{self.user_id}>"
+
+
+class TicketEvent(models.Model):
+    """Outbox row recording one batch of ticket status transitions.
+
+    Written in the same transaction as the status change; ``dispatched_at``
+    stays empty until a consumer has handled the event.
+    """
+
+    class Kind(models.TextChoices):
+        TRANSITION = "transition", "Transition"
+        EXPIRED = "expired", "Expired"
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    status = models.CharField(max_length=20, choices=Ticket.Status.choices)
+    ticket_ids = models.JSONField(default=list)
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="idx_ticketevents_pending",
+                condition=models.Q(dispatched_at__isnull=True),
+            ),
+        ]
+        verbose_name = "Ticket event"
+        verbose_name_plural = "Ticket events"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"TicketEvent<{self.pk}:{self.kind}>"
@@ -0,0 +1,71 @@
+"""Maintain ``TicketParticipant`` rows from ``Ticket`` writes."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Ticket, TicketParticipant
+
+
+def participant_rows(ticket: Any, participant_model: Any = TicketParticipant) -> list[Any]:
+    """Build the participant rows for *ticket*; a self-ticket yields one borrower row."""
+
+    rows = [
+        participant_model(
+            user_id=ticket.borrower_id,
+            ticket_id=ticket.pk,
+            role="borrower",
+            status=ticket.status,
+            updated_at=ticket.updated_at,
+        )
+    ]
+    if ticket.lender_id != ticket.borrower_id:
+        rows.append(
+            participant_model(
+                user_id=ticket.lender_id,
+                ticket_id=ticket.pk,
+                role="lender",
+                status=ticket.status,
+                updated_at=ticket.updated_at,
+            )
+        )
+    return rows
+
+
+def sync_participants(tickets: Iterable[Ticket], *, replace: bool = True) -> None:
+    """Upsert participant rows for *tickets* and drop rows for replaced users.
+
+    Call this after ``QuerySet.update()`` or ``bulk_update()`` on tickets,
+    which bypass the ``post_save`` hook.  ``replace=False`` skips the
+    cleanup for tickets that are known to be new.
+    """
+
+    tickets = list(tickets)
+    if not tickets:
+        return
+    stale = Q()
+    rows = []
+    for ticket in tickets:
+        stale |= Q(ticket_id=ticket.pk) & ~Q(user_id__in={ticket.borrower_id, ticket.lender_id})
+        rows.extend(participant_rows(ticket))
+    with transaction.atomic():
+        if replace:
+            TicketParticipant.objects.filter(stale).delete()
+        TicketParticipant.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["ticket", "user"],
+            update_fields=["role", "status", "updated_at"],
+        )
+
+
+def sync_ticket_ids(ticket_ids: Iterable[int]) -> None:
+    """Re-read *ticket_ids* and sync their participants."""
+
+    sync_participants(
+        Ticket.objects.filter(pk__in=list(ticket_ids)).only("pk", "borrower_id", "lender_id", "status", "updated_at")
+    )
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from ninja import Field, Schema
+
+
+class TransitionRequest(Schema):
+    status: str
+    expected: str | None = None
+
+
+class BulkTransitionRequest(Schema):
+    ticket_ids: list[int] = Field(alias="ticketIds")
+    status: str
+    expected: str | None = None
@@ -0,0 +1,133 @@
+"""Ranked asset-name search over a user's tickets.
+
+PostgreSQL matches with ``pg_trgm`` through a GIN index on
+``Ticket.asset_name``; SQLite (development and tests) uses an FTS5 table
+with prefix indexes that the ticket signals keep current.
+
+The PostgreSQL filters compare the raw column with ``ILIKE`` and ``%``:
+Django's ``icontains``/``istartswith`` compile to ``UPPER(col) LIKE``,
+which the ``gin_trgm_ops`` index cannot serve.
+"""
+
+from __future__ import annotations
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Case, F, IntegerField, Lookup, Q, QuerySet, Value, When, prefetch_related_objects
+
+from apps.auth.models import User
+
+from .models import Ticket, TicketParticipant
+
+
+FTS_TABLE = "assets_tickets_ticket_search"
+
+
+def _connection() -> BaseDatabaseWrapper:
+    return connections[Ticket.objects.db]
+
+
+class ILike(Lookup):
+    """``lhs ILIKE rhs`` on the raw column, so trigram indexes apply."""
+
+    lookup_name = "ilike"
+
+    def as_sql(self, compiler, connection):  # type: ignore[no-untyped-def]
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+def uses_fts() -> bool:
+    return _connection().vendor == "sqlite"
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query that prefix-matches every word."""
+
+    return " ".join('"' + token.replace('"', '""') + '"*' for token in query.split())
+
+
+def search_tickets(user: User, query: str, *, offset: int = 0, limit: int = 20) -> list[Ticket]:
+    """Return up to *limit* of *user*'s tickets matching *query*, best match first."""
+
+    query = query.strip()
+    if not query:
+        return []
+    if uses_fts():
+        return _search_fts(user, query, offset=offset, limit=limit)
+    return _search_trigram(user, query, offset=offset, limit=limit)
+
+
+def _search_trigram(user: User, query: str, *, offset: int, limit: int) -> list[Ticket]:
+    return list(trigram_queryset(user, query)[offset : offset + limit])
+
+
+def trigram_queryset(user: User, query: str) -> QuerySet[Ticket]:
+    """Return *user*'s tickets matching *query* on PostgreSQL, best match first."""
+
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    escaped = _connection().ops.prep_for_like_query(query)
+    return (
+        Ticket.objects.filter(participants__user=user)
+        .filter(Q(ILike(F("asset_name"), f"%{escaped}%")) | Q(asset_name__trigram_similar=query))
+        .annotate(
+            prefix=Case(
+                When(ILike(F("asset_name"), f"{escaped}%"), then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            similarity=TrigramSimilarity("asset_name", query),
+        )
+        .select_related("borrower", "lender")
+        .order_by("-prefix", "-similarity", "-updated_at", "-id")
+    )
+
+
+def _search_fts(user: User, query: str, *, offset: int, limit: int) -> list[Ticket]:
+    expression = match_expression(query)
+    if not expression:
+        return []
+    sql = (
+        f"SELECT t.* FROM {FTS_TABLE} "  # noqa: S608 - fixed table names
+        f"JOIN {Ticket._meta.db_table} t ON t.id = {FTS_TABLE}.rowid "
+        f"JOIN {TicketParticipant._meta.db_table} p ON p.ticket_id = t.id "
+        f"WHERE {FTS_TABLE} MATCH %s AND p.user_id = %s "
+        f"ORDER BY {FTS_TABLE}.rank, t.updated_at DESC, t.id DESC "
+        "LIMIT %s OFFSET %s"
+    )
+    tickets = list(Ticket.objects.raw(sql, [expression, user.pk, limit, offset]))
+    prefetch_related_objects(tickets, "borrower", "lender")
+    return tickets
+
+
+def index_ticket(ticket: Ticket) -> None:
+    if not uses_fts():
+        return
+    with _connection().cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [ticket.pk])  # noqa: S608
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, asset_name) VALUES (%s, %s)",  # noqa: S608
+            [ticket.pk, ticket.asset_name],
+        )
+
+
+def unindex_ticket(ticket_id: int) -> None:
+    if not uses_fts():
+        return
+    with _connection().cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [ticket_id])  # noqa: S608
+
+
+def rebuild_search_index() -> None:
+    """Repopulate the FTS5 table after bulk ticket writes; a no-op on PostgreSQL."""
+
+    if not uses_fts():
+        return
+    with _connection().cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")  # noqa: S608
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, asset_name) "  # noqa: S608
+            f"SELECT id, asset_name FROM {Ticket._meta.db_table}"
+        )
@@ -0,0 +1,38 @@
+"""Keep ``TicketParticipant`` in step with ``Ticket`` saves."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from assets_backend.events import publish
+
+from .models import Ticket
+from .participants import sync_participants
+from .search import index_ticket, unindex_ticket
+
+
+@receiver(post_save, sender=Ticket, dispatch_uid="tickets_sync_participants")
+def update_participants(sender: type[Ticket], instance: Ticket, created: bool, **kwargs: Any) -> None:  # noqa: ARG001
+    sync_participants([instance], replace=not created)
+
+
+@receiver(post_save, sender=Ticket, dispatch_uid="tickets_index_search")
+def update_search_index(sender: type[Ticket], instance: Ticket, **kwargs: Any) -> None:  # noqa: ARG001
+    index_ticket(instance)
+
+
+@receiver(post_delete, sender=Ticket, dispatch_uid="tickets_unindex_search")
+def remove_from_search_index(sender: type[Ticket], instance: Ticket, **kwargs: Any) -> None:  # noqa: ARG001
+    unindex_ticket(instance.pk)
+
+
+@receiver(post_save, sender=Ticket, dispatch_uid="tickets_publish_event")
+def publish_ticket_event(sender: type[Ticket], instance: Ticket, **kwargs: Any) -> None:  # noqa: ARG001
+    publish(
+        [instance.borrower_id, instance.lender_id],
+        "ticket",
+        {"ids": [instance.pk], "count": 1, "status": instance.status},
+    )
@@ -1,3 +1,283 @@
-from django.test import TestCase
+import base64
+import json
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.db import connection
+from django.test import Client, TestCase
+from django.utils import timezone
+
+from apps.auth.cache import user_cache
+from apps.auth.models import User
+from apps.auth.tokens import create_access_token
+
+from . import transitions
+from .models import Ticket, TicketEvent, TicketParticipant
+from .participants import sync_ticket_ids
+from .search import match_expression, trigram_queryset
+from .transitions import expire_stale_tickets, transition_tickets
+
+
+class TicketListTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(email="pager@example.com", password="Passw0rd!")
+        other = User.objects.create_user(email="other@example.com", password="Passw0rd!")
+        now = timezone.now()
+        for index in range(7):
+            ticket = Ticket.objects.create(asset_name=f"Asset {index}", borrower=self.user, lender=other)
+            # Pairs of tickets share a timestamp so the id tiebreaker is exercised.
+            Ticket.objects.filter(pk=ticket.pk).update(updated_at=now - timedelta(minutes=index // 2))
+            sync_ticket_ids([ticket.pk])
+        Ticket.objects.create(asset_name="Unrelated", borrower=other, lender=other)
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def test_cursor_pages_cover_every_ticket_once(self) -> None:
+        expected = list(
+            Ticket.objects.filter(borrower=self.user).order_by("-updated_at", "-id").values_list("id", flat=True)
+        )
+        seen = []
+        url = "/api/tickets/?limit=3"
+        pages = []
+        while url:
+            payload = self.client.get(url, **self.headers).json()
+            pages.append(payload)
+            seen.extend(item["id"] for item in payload["items"])
+            url = payload["next"]
+
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(page["items"]) for page in pages], [3, 3, 1])
+        self.assertIsNone(pages[0]["prev"])
+
+        previous = self.client.get(pages[2]["prev"], **self.headers).json()
+        self.assertEqual([item["id"] for item in previous["items"]], expected[3:6])
+        self.assertIsNotNone(previous["prev"])
+
+    def test_invalid_cursor_is_rejected(self) -> None:
+        response = self.client.get("/api/tickets/?cursor=not-a-cursor", **self.headers)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_with_a_bad_key_is_rejected(self) -> None:
+        # Well-formed base64 JSON, but "k" is not a datetime.
+        cursor = base64.urlsafe_b64encode(json.dumps({"k": "x", "id": 1}).encode()).decode().rstrip("=")
+        response = self.client.get(f"/api/tickets/?cursor={cursor}", **self.headers)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TicketParticipantTests(TestCase):
+    def setUp(self) -> None:
+        self.borrower = User.objects.create_user(email="borrower@example.com", password="Passw0rd!")
+        self.lender = User.objects.create_user(email="lender@example.com", password="Passw0rd!")
+        self.replacement = User.objects.create_user(email="replacement@example.com", password="Passw0rd!")
+
+    def participants(self, ticket: Ticket) -> set[tuple[int, str, str]]:
+        return set(ticket.participants.values_list("user_id", "role", "status"))
+
+    def test_ticket_saves_keep_participants_in_step(self) -> None:
+        ticket = Ticket.objects.create(asset_name="Drill", borrower=self.borrower, lender=self.lender)
+        self.assertEqual(
+            self.participants(ticket),
+            {(self.borrower.pk, "borrower", "pending"), (self.lender.pk, "lender", "pending")},
+        )
+
+        ticket.lender = self.replacement
+        ticket.status = Ticket.Status.ACTIVE
+        ticket.save()
+
+        self.assertEqual(
+            self.participants(ticket),
+            {(self.borrower.pk, "borrower", "active"), (self.replacement.pk, "lender", "active")},
+        )
+        participation = TicketParticipant.objects.get(ticket=ticket, user=self.borrower)
+        self.assertEqual(participation.updated_at, ticket.updated_at)
+
+        ticket.delete()
+        self.assertFalse(TicketParticipant.objects.exists())
+
+    def test_self_ticket_has_one_participant(self) -> None:
+        ticket = Ticket.objects.create(asset_name="Tent", borrower=self.borrower, lender=self.borrower)
+
+        self.assertEqual(self.participants(ticket), {(self.borrower.pk, "borrower", "pending")})
+
+
+class TicketSearchTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(email="searcher@example.com", password="Passw0rd!")
+        other = User.objects.create_user(email="stranger@example.com", password="Passw0rd!")
+        for name in ("Canon EOS R6", "Canon PowerShot", "Nikon Z6", "Old canon lens cap"):
+            Ticket.objects.create(asset_name=name, borrower=self.user, lender=other)
+        Ticket.objects.create(asset_name="Canon EOS R5", borrower=other, lender=other)
+        renamed = Ticket.objects.get(asset_name="Nikon Z6")
+        renamed.asset_name = "Nikon Zf"
+        renamed.save()
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def search(self, url: str) -> dict[str, object]:
+        return self.client.get(url, **self.headers).json()
+
+    def test_prefix_search_is_scoped_and_paginated(self) -> None:
+        first = self.search("/api/tickets/search?q=can&limit=2")
+        second = self.search(first["next"])
+
+        names = [item["assetName"] for item in first["items"] + second["items"]]
+        self.assertEqual(sorted(names), ["Canon EOS R6", "Canon PowerShot", "Old canon lens cap"])
+        self.assertIsNone(second["next"])
+        self.assertIsNotNone(second["prev"])
+
+    def test_search_index_follows_renames(self) -> None:
+        self.assertEqual(self.search("/api/tickets/search?q=z6")["items"], [])
+        self.assertEqual([item["assetName"] for item in self.search("/api/tickets/search?q=zf")["items"]], ["Nikon Zf"])
+
+    def test_trigram_filters_compare_the_raw_column(self) -> None:
+        from django.db.backends.postgresql.base import DatabaseWrapper
+
+        postgres = DatabaseWrapper({**connection.settings_dict, "ENGINE": "django.db.backends.postgresql"}, "pg")
+        sql, params = trigram_queryset(self.user, "eos_r").query.get_compiler(connection=postgres).as_sql()
+
+        # UPPER(asset_name) LIKE ... cannot use the gin_trgm_ops index; ILIKE and % can.
+        self.assertNotIn("UPPER(", sql)
+        self.assertIn('"assets_tickets_ticket"."asset_name" ILIKE', sql)
+        self.assertIn('"assets_tickets_ticket"."asset_name" %% %s', sql)
+        self.assertIn("%eos\\_r%", params)
+
+    def test_match_expression_quotes_operators(self) -> None:
+        self.assertEqual(match_expression('eos "r6 OR'), '"eos"* """r6"* "OR"*')
+
+
+class TicketTransitionTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client = Client()
+        self.borrower = User.objects.create_user(email="mover@example.com", password="Passw0rd!")
+        self.lender = User.objects.create_user(email="owner@example.com", password="Passw0rd!")
+        self.admin = User.objects.create_user(email="ops@example.com", password="Passw0rd!", role=User.Role.ADMIN)
+        self.ticket = Ticket.objects.create(asset_name="Ladder", borrower=self.borrower, lender=self.lender)
+
+    def post(self, url: str, user: User, payload: dict[str, object]):
+        return self.client.post(
+            url,
+            data=payload,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {create_access_token(user)}",
+        )
+
+    def test_participant_moves_ticket_through_allowed_states(self) -> None:
+        url = f"/api/tickets/{self.ticket.pk}/transition"
+        response = self.post(url, self.lender, {"status": "accepted", "expected": "pending"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "accepted")
+        self.assertEqual(
+            set(self.ticket.participants.values_list("status", flat=True)), {Ticket.Status.ACCEPTED}
+        )
+        event = TicketEvent.objects.get()
+        self.assertEqual((event.status, event.ticket_ids, event.actor_id), ("accepted", [self.ticket.pk], self.lender.pk))
+
+        self.assertEqual(self.post(url, self.borrower, {"status": "completed"}).status_code, 400)
+        self.assertEqual(self.post(url, self.lender, {"status": "active", "expected": "pending"}).status_code, 409)
+        self.assertEqual(self.post(url, self.admin, {"status": "bogus"}).status_code, 400)
+        stranger = User.objects.create_user(email="nosy@example.com", password="Passw0rd!")
+        self.assertEqual(self.post(url, stranger, {"status": "active"}).status_code, 404)
+        self.assertEqual(TicketEvent.objects.count(), 1)
+
+    def test_each_role_may_only_make_its_own_moves(self) -> None:
+        url = f"/api/tickets/{self.ticket.pk}/transition"
+
+        self.assertEqual(self.post(url, self.borrower, {"status": "accepted"}).status_code, 403)
+        self.assertEqual(self.post(url, self.lender, {"status": "accepted"}).status_code, 200)
+        self.assertEqual(self.post(url, self.borrower, {"status": "active"}).status_code, 403)
+        self.assertEqual(self.post(url, self.lender, {"status": "active"}).status_code, 200)
+        # Completion charges the borrower, so the lender cannot declare it.
+        self.assertEqual(self.post(url, self.lender, {"status": "completed"}).status_code, 403)
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).status, Ticket.Status.ACTIVE)
+        self.assertEqual(self.post(url, self.borrower, {"status": "completed"}).status_code, 200)
+        self.assertEqual(TicketEvent.objects.count(), 3)
+
+    def test_admin_may_make_any_allowed_move(self) -> None:
+        Ticket.objects.filter(pk=self.ticket.pk).update(status=Ticket.Status.ACTIVE)
+        response = self.post(f"/api/tickets/{self.ticket.pk}/transition", self.admin, {"status": "completed"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "completed")
+
+    def test_record_chunks_participant_queries(self) -> None:
+        tickets = [
+            Ticket.objects.create(asset_name=f"Crate {index}", borrower=self.borrower, lender=self.lender)
+            for index in range(5)
+        ]
+        ids = [ticket.pk for ticket in tickets]
+
+        with patch.object(transitions, "CHUNK_SIZE", 2), patch.object(transitions, "publish_many") as publish:
+            result = transition_tickets(ids, Ticket.Status.CANCELLED)
+
+        self.assertEqual(sorted(result.applied), ids)
+        self.assertEqual(
+            TicketParticipant.objects.filter(ticket_id__in=ids, status=Ticket.Status.CANCELLED).count(), 10
+        )
+        events = {user_ids[0]: payload for user_ids, _, payload in publish.call_args.args[0]}
+        self.assertEqual(events[self.borrower.pk]["count"], 5)
+        self.assertEqual(TicketEvent.objects.get().ticket_ids, result.applied)
+
+    def test_bulk_transition_reports_each_conflict(self) -> None:
+        accepted = Ticket.objects.create(
+            asset_name="Saw", borrower=self.borrower, lender=self.lender, status=Ticket.Status.ACCEPTED
+        )
+        completed = Ticket.objects.create(
+            asset_name="Tent", borrower=self.borrower, lender=self.lender, status=Ticket.Status.COMPLETED
+        )
+        payload = {"ticketIds": [self.ticket.pk, accepted.pk, completed.pk, 999_999], "status": "cancelled"}
+
+        self.assertEqual(self.post("/api/tickets/transitions", self.borrower, payload).status_code, 403)
+        response = self.post("/api/tickets/transitions", self.admin, payload)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(sorted(body["applied"]), sorted([self.ticket.pk, accepted.pk]))
+        self.assertEqual(
+            body["conflicts"],
+            [{"id": completed.pk, "reason": "invalid_transition"}, {"id": 999_999, "reason": "not_found"}],
+        )
+        self.assertEqual(TicketEvent.objects.get().actor_id, self.admin.pk)
+
+    def test_lost_race_is_reported_as_status_changed(self) -> None:
+        # Another writer moves the ticket after the status read; the guarded UPDATE must skip it.
+        original = transitions._conditional_update
+
+        def racing_update(*args, **kwargs):
+            Ticket.objects.filter(pk=self.ticket.pk).update(status=Ticket.Status.CANCELLED)
+            return original(*args, **kwargs)
+
+        with patch.object(transitions, "_conditional_update", side_effect=racing_update):
+            result = transition_tickets([self.ticket.pk], Ticket.Status.ACCEPTED)
+
+        self.assertEqual(result.applied, [])
+        self.assertEqual(result.conflicts, {self.ticket.pk: "status_changed"})
+        self.assertFalse(TicketEvent.objects.exists())
+
+    def test_expiry_cancels_only_stale_pending_tickets(self) -> None:
+        stale = [
+            Ticket.objects.create(asset_name=f"Old {index}", borrower=self.borrower, lender=self.lender)
+            for index in range(5)
+        ]
+        active = Ticket.objects.create(
+            asset_name="Busy", borrower=self.borrower, lender=self.lender, status=Ticket.Status.ACTIVE
+        )
+        old = timezone.now() - timedelta(days=45)
+        Ticket.objects.filter(pk__in=[ticket.pk for ticket in [*stale, active]]).update(updated_at=old)
+
+        result = expire_stale_tickets(older_than=timedelta(days=30), batch_size=2)
+
+        self.assertEqual(sorted(result.applied), [ticket.pk for ticket in stale])
+        self.assertEqual(result.batches, 3)
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).status, Ticket.Status.PENDING)
+        self.assertEqual(Ticket.objects.get(pk=active.pk).status, Ticket.Status.ACTIVE)
+        self.assertEqual(
+            TicketParticipant.objects.filter(ticket__in=stale, status=Ticket.Status.CANCELLED).count(), 10
+        )
+        self.assertEqual(list(TicketEvent.objects.values_list("kind", flat=True).distinct()), ["expired"])
+        self.assertEqual(TicketEvent.objects.count(), 3)
@@ -0,0 +1,207 @@
+"""Ticket status transitions applied with optimistic concurrency.
+
+Every transition is a conditional ``UPDATE ... WHERE status = <expected>``:
+no row is locked while the caller decides, and a ticket whose status moved
+underneath the request is simply not updated and reported as a conflict.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.auth.models import User
+from assets_backend.events import publish_many
+
+from .models import Ticket, TicketEvent, TicketParticipant
+
+
+TRANSITIONS: dict[str, frozenset[str]] = {
+    Ticket.Status.PENDING: frozenset({Ticket.Status.ACCEPTED, Ticket.Status.CANCELLED}),
+    Ticket.Status.ACCEPTED: frozenset({Ticket.Status.ACTIVE, Ticket.Status.CANCELLED}),
+    Ticket.Status.ACTIVE: frozenset({Ticket.Status.COMPLETED, Ticket.Status.CANCELLED}),
+}
+
+# Which participant may move a ticket into each status; admins may make any allowed move.
+ROLE_TARGETS: dict[str, frozenset[str]] = {
+    Ticket.Status.ACCEPTED: frozenset({TicketParticipant.Role.LENDER}),
+    Ticket.Status.ACTIVE: frozenset({TicketParticipant.Role.LENDER}),
+    # Completion settles the borrower's payment, so only the borrower confirms it.
+    Ticket.Status.COMPLETED: frozenset({TicketParticipant.Role.BORROWER}),
+    Ticket.Status.CANCELLED: frozenset({TicketParticipant.Role.BORROWER, TicketParticipant.Role.LENDER}),
+}
+
+# Ids per UPDATE statement; well under SQLite's bound-parameter limit.
+CHUNK_SIZE = 1000
+LIVE_EVENT_IDS = 100
+
+
+def can_transition(source: str, target: str) -> bool:
+    return target in TRANSITIONS.get(source, ())
+
+
+def role_allows(roles: Iterable[str], target: str) -> bool:
+    """Return whether a participant holding *roles* on a ticket may move it to *target*."""
+
+    return not ROLE_TARGETS.get(target, frozenset()).isdisjoint(roles)
+
+
+@dataclass
+class TransitionResult:
+    applied: list[int] = field(default_factory=list)
+    conflicts: dict[int, str] = field(default_factory=dict)
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return len(self.applied) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _conditional_update(
+    ticket_ids: list[int],
+    source: str,
+    target: str,
+    now: datetime,
+    *,
+    updated_before: datetime | None = None,
+) -> list[int]:
+    """Move the tickets still in *source* to *target*; return the ids that moved."""
+
+    connection = connections[Ticket.objects.db]
+    ops = connection.ops
+    table = ops.quote_name(Ticket._meta.db_table)
+    placeholders = ", ".join(["%s"] * len(ticket_ids))
+    sql = f"UPDATE {table} SET status = %s, updated_at = %s WHERE status = %s AND id IN ({placeholders})"  # noqa: S608
+    params: list[object] = [target, ops.adapt_datetimefield_value(now), source, *ticket_ids]
+    if updated_before is not None:
+        sql += " AND updated_at < %s"
+        params.append(ops.adapt_datetimefield_value(updated_before))
+    with connection.cursor() as cursor:
+        cursor.execute(f"{sql} RETURNING id", params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _record(applied: list[int], target: str, now: datetime, kind: str, actor: User | None) -> None:
+    """Mirror the change onto participant rows, write the batch's outbox event and notify live clients."""
+
+    if not applied:
+        return
+    # The raw UPDATE bypasses post_save, so participants are updated here.
+    by_user: dict[int, list[int]] = defaultdict(list)
+    for offset in range(0, len(applied), CHUNK_SIZE):
+        chunk = applied[offset : offset + CHUNK_SIZE]
+        participants = TicketParticipant.objects.filter(ticket_id__in=chunk)
+        participants.update(status=target, updated_at=now)
+        for user_id, ticket_id in participants.values_list("user_id", "ticket_id"):
+            by_user[user_id].append(ticket_id)
+    TicketEvent.objects.create(kind=kind, status=target, ticket_ids=applied, actor=actor)
+    # Ids are capped so one user's event always fits a broker message; clients refetch on a short list.
+    publish_many(
+        ([user_id], "ticket", {"ids": ids[:LIVE_EVENT_IDS], "count": len(ids), "status": target})
+        for user_id, ids in by_user.items()
+    )
+
+
+def transition_tickets(
+    ticket_ids: Iterable[int],
+    target: str,
+    *,
+    expected: str | None = None,
+    actor: User | None = None,
+) -> TransitionResult:
+    """Move *ticket_ids* to *target* in one transaction with one outbox event.
+
+    Each ticket must currently allow the move (and be in *expected*, when
+    given).  Tickets that do not are reported in ``conflicts`` as
+    ``not_found``, ``invalid_transition`` or ``status_changed``; the last also
+    covers tickets another writer moved between the read and the update.
+    """
+
+    if target not in Ticket.Status.values:
+        msg = f"Unknown ticket status {target!r}"
+        raise ValueError(msg)
+    ids = list(dict.fromkeys(ticket_ids))
+    result = TransitionResult(batches=1)
+    started = time.monotonic()
+    now = timezone.now()
+
+    with transaction.atomic():
+        for offset in range(0, len(ids), CHUNK_SIZE):
+            chunk = ids[offset : offset + CHUNK_SIZE]
+            current = dict(Ticket.objects.filter(pk__in=chunk).values_list("pk", "status"))
+            by_source: dict[str, list[int]] = defaultdict(list)
+            for ticket_id in chunk:
+                status = current.get(ticket_id)
+                if status is None:
+                    result.conflicts[ticket_id] = "not_found"
+                elif expected is not None and status != expected:
+                    result.conflicts[ticket_id] = "status_changed"
+                elif not can_transition(status, target):
+                    result.conflicts[ticket_id] = "invalid_transition"
+                else:
+                    by_source[status].append(ticket_id)
+            for source, candidates in by_source.items():
+                moved = _conditional_update(candidates, source, target, now)
+                result.applied.extend(moved)
+                for ticket_id in set(candidates).difference(moved):
+                    result.conflicts[ticket_id] = "status_changed"
+        _record(result.applied, target, now, TicketEvent.Kind.TRANSITION, actor)
+
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def expire_stale_tickets(
+    *,
+    older_than: timedelta | None = None,
+    batch_size: int = CHUNK_SIZE,
+    now: datetime | None = None,
+) -> TransitionResult:
+    """Cancel pending tickets not updated within *older_than*.
+
+    Candidates are walked in ``(updated_at, id)`` order over the
+    ``(status, updated_at, id)`` index, and each batch is one conditional
+    UPDATE plus one outbox event in its own short transaction, so the job
+    never holds locks across the whole table.  The UPDATE re-checks both the
+    status and the age, so a ticket touched since it was read is left alone.
+    """
+
+    now = now or timezone.now()
+    older_than = older_than or timedelta(days=settings.TICKET_PENDING_EXPIRY_DAYS)
+    cutoff = now - older_than
+    batch_size = min(batch_size, CHUNK_SIZE)
+    candidates = Ticket.objects.filter(status=Ticket.Status.PENDING, updated_at__lt=cutoff)
+    result = TransitionResult()
+    started = time.monotonic()
+    cursor: tuple[datetime, int] | None = None
+
+    while True:
+        page = candidates
+        if cursor is not None:
+            page = page.filter(Q(updated_at__gt=cursor[0]) | Q(updated_at=cursor[0], pk__gt=cursor[1]))
+        rows = list(page.order_by("updated_at", "pk").values_list("updated_at", "pk")[:batch_size])
+        if not rows:
+            break
+        cursor = rows[-1]
+        ids = [pk for _, pk in rows]
+        with transaction.atomic():
+            moved = _conditional_update(
+                ids, Ticket.Status.PENDING, Ticket.Status.CANCELLED, now, updated_before=cutoff
+            )
+            _record(moved, Ticket.Status.CANCELLED, now, TicketEvent.Kind.EXPIRED, None)
+        result.applied.extend(moved)
+        for ticket_id in set(ids).difference(moved):
+            result.conflicts[ticket_id] = "status_changed"
+        result.batches += 1
+
+    result.elapsed = time.monotonic() - started
+    return result
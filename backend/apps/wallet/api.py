@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-from decimal import Decimal
-
-from django.db.models import Q, Sum
-from django.db.models.functions import Coalesce
+from django.db.models import QuerySet
+from django.urls import reverse
 from ninja import Router
 from ninja.errors import HttpError
 
 from apps.auth.dependencies import JWTAuth
+from apps.auth.models import User
 from apps.payments.models import Payment
+from assets_backend.pagination import KeysetPaginator, paginated_response
 
-from .models import Wallet
+from .ledger import with_balance
+from .models import LedgerEntry, Wallet, WalletStats
 
 
 jwt_auth = JWTAuth()
 router = Router(tags=["Wallet"])
+transaction_pages = KeysetPaginator("-created_at", default_limit=10)
+ledger_pages = KeysetPaginator("-sequence", default_limit=50, max_limit=500)
 
 
 @router.get("status", summary="Wallet service heartbeat")
@@ -22,58 +25,102 @@ def wallet_status(request):
     return {"service": "wallet", "status": "ok"}
 
 
+def _transactions(user: User) -> QuerySet[Payment]:
+    return (
+        Payment.objects.filter(ticket__participants__user=user)
+        .select_related("ticket")
+        .only("id", "authority", "ticket_id", "ticket__asset_name", "amount", "status", "created_at")
+    )
+
+
+def _serialize_transaction(payment: Payment) -> dict[str, object]:
+    if payment.status == Payment.Status.INITIATED:
+        category = "Top-up"
+    elif payment.status == Payment.Status.VERIFIED:
+        category = "Settlement"
+    else:
+        category = "Payout"
+    return {
+        "id": payment.id,
+        "reference": payment.authority,
+        "ticketId": payment.ticket_id,
+        "ticketAsset": payment.ticket.asset_name,
+        "type": category,
+        "amount": payment.amount,
+        "status": payment.status,
+        "statusLabel": payment.get_status_display(),
+        "createdAt": payment.created_at,
+    }
+
+
 @router.get("overview", auth=jwt_auth, summary="Return wallet summary and transactions for the current user")
 def wallet_overview(request):
     try:
-        wallet = Wallet.objects.get(user=request.user)
+        wallet = with_balance(Wallet.objects).get(user=request.user)
     except Wallet.DoesNotExist as exc:  # pragma: no cover - defensive guard
         raise HttpError(404, "Wallet not found for user") from exc
 
-    payments = (
-        Payment.objects.filter(
-            Q(ticket__borrower=request.user) | Q(ticket__lender=request.user)
-        )
-        .select_related("ticket")
-        .order_by("-created_at")
-    )
-
-    total_payments = payments.count()
-    verified_count = payments.filter(status=Payment.Status.VERIFIED).count()
+    stats = WalletStats.objects.filter(user=request.user).first() or WalletStats(user=request.user)
+    total_payments = stats.total_count
+    verified_count = stats.verified_count
     settlement_buffer = int(round((verified_count / total_payments) * 100)) if total_payments else 0
+    upcoming_amount = stats.initiated_sum
 
-    upcoming_amount = payments.filter(status=Payment.Status.INITIATED).aggregate(
-        total=Coalesce(Sum("amount"), Decimal("0"))
-    )["total"]
-
-    def payment_category(payment: Payment) -> str:
-        if payment.status == Payment.Status.INITIATED:
-            return "Top-up"
-        if payment.status == Payment.Status.VERIFIED:
-            return "Settlement"
-        return "Payout"
-
-    transactions = [
-        {
-            "id": payment.id,
-            "reference": payment.authority,
-            "ticketId": payment.ticket_id,
-            "ticketAsset": payment.ticket.asset_name,
-            "type": payment_category(payment),
-            "amount": float(payment.amount),
-            "status": payment.status,
-            "statusLabel": payment.get_status_display(),
-            "createdAt": payment.created_at,
-        }
-        for payment in payments[:10]
-    ]
+    page = transaction_pages.paginate(_transactions(request.user))
+    transactions_path = reverse(f"{request.resolver_match.namespace}:wallet_transactions")
 
     return {
         "wallet": {
-            "balance": float(wallet.balance),
+            "balance": wallet.current_balance,
             "currency": wallet.currency,
             "status": wallet.status,
             "settlementBuffer": settlement_buffer,
-            "upcomingPayouts": float(upcoming_amount or Decimal("0")),
+            "upcomingPayouts": upcoming_amount,
         },
-        "transactions": transactions,
+        "transactions": [_serialize_transaction(payment) for payment in page.items],
+        "transactionsNext": page.links(request, transactions_path)["next"],
     }
+
+
+@router.get(
+    "transactions",
+    auth=jwt_auth,
+    url_name="wallet_transactions",
+    summary="Page through the current user's wallet transactions, newest first",
+)
+def wallet_transactions(request, cursor: str | None = None, limit: int | None = None):
+    return paginated_response(
+        request,
+        _transactions(request.user),
+        transaction_pages,
+        _serialize_transaction,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
+def _serialize_entry(entry: LedgerEntry) -> dict[str, object]:
+    return {
+        "sequence": entry.sequence,
+        "amount": entry.amount,
+        "kind": entry.kind,
+        "kindLabel": entry.get_kind_display(),
+        "reference": entry.reference,
+        "createdAt": entry.created_at,
+    }
+
+
+@router.get("ledger", auth=jwt_auth, summary="Page through the current user's wallet ledger, newest first")
+def wallet_ledger(request, cursor: str | None = None, limit: int | None = None):
+    wallet = Wallet.objects.filter(user=request.user).only("pk").first()
+    if wallet is None:
+        raise HttpError(404, "Wallet not found for user")
+
+    return paginated_response(
+        request,
+        LedgerEntry.objects.filter(wallet=wallet),
+        ledger_pages,
+        _serialize_entry,
+        cursor=cursor,
+        limit=limit,
+    )
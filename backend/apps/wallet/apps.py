@@ -6,3 +6,8 @@ class WalletConfig(AppConfig):
     name = "apps.wallet"
     label = "assets_wallet"
     verbose_name = "Wallets"
+
+    def ready(self) -> None:
+        super().ready()
+
+        from . import signals  # noqa: F401
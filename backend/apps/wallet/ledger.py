@@ -0,0 +1,145 @@
+"""Append-only wallet ledger with periodic balance checkpoints.
+
+The ledger is the source of truth for balances: ``with_balance`` reads the
+latest checkpoint plus the entries after it (plus uncompacted shard
+credits).  ``Wallet.balance`` is a running total kept in step by every
+writer so settlement can check funds under the wallet lock;
+``reconcile_wallets`` reports or repairs any wallet where the two disagree.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from assets_backend.money import MoneyField
+
+from .models import BalanceCheckpoint, LedgerEntry, Wallet, WalletBalanceShard
+
+
+OPENING_REFERENCE = "opening-balance"
+RECONCILIATION_REFERENCE = "reconciliation"
+
+
+def append_entry(wallet: Wallet, amount: int, kind: str, reference: str = "") -> LedgerEntry:
+    """Append one entry and move ``Wallet.balance`` by *amount*.
+
+    The wallet row is locked to hand out the next sequence number, so entries
+    for one wallet are totally ordered.  Every ``WALLET_CHECKPOINT_INTERVAL``
+    entries the running balance is recorded as a checkpoint.
+    """
+
+    with transaction.atomic():
+        locked = Wallet.objects.select_for_update().only("pk", "balance").get(pk=wallet.pk)
+        last = (
+            LedgerEntry.objects.filter(wallet_id=wallet.pk)
+            .order_by("-sequence")
+            .values_list("sequence", flat=True)
+            .first()
+        )
+        entry = LedgerEntry.objects.create(
+            wallet_id=wallet.pk,
+            sequence=(last or 0) + 1,
+            amount=amount,
+            kind=kind,
+            reference=reference[:64],
+        )
+        balance = locked.balance + amount
+        Wallet.objects.filter(pk=wallet.pk).update(balance=F("balance") + amount)
+        if entry.sequence % settings.WALLET_CHECKPOINT_INTERVAL == 0:
+            BalanceCheckpoint.objects.create(wallet_id=wallet.pk, sequence=entry.sequence, balance=balance)
+    wallet.balance = balance
+    return entry
+
+
+def _record_unposted(wallet_id: int, amount: int, reference: str) -> None:
+    """Append an adjustment for *amount* already reflected in ``Wallet.balance``; the caller holds the row lock."""
+
+    last = LedgerEntry.objects.filter(wallet_id=wallet_id).order_by("-sequence").values_list("sequence", flat=True)
+    sequence = (last.first() or 0) + 1
+    LedgerEntry.objects.create(
+        wallet_id=wallet_id, sequence=sequence, amount=amount, kind=LedgerEntry.Kind.ADJUSTMENT, reference=reference
+    )
+    if sequence % settings.WALLET_CHECKPOINT_INTERVAL == 0:
+        balance = Wallet.objects.filter(pk=wallet_id).values_list("balance", flat=True).get()
+        BalanceCheckpoint.objects.create(wallet_id=wallet_id, sequence=sequence, balance=balance)
+
+
+def record_opening_balance(wallet: Wallet) -> None:
+    """Give a wallet created with a non-zero balance the entry that explains it."""
+
+    if wallet.balance:
+        with transaction.atomic():
+            Wallet.objects.select_for_update().only("pk").get(pk=wallet.pk)
+            _record_unposted(wallet.pk, wallet.balance, OPENING_REFERENCE)
+
+
+def _sum(queryset: QuerySet, field: str) -> Coalesce:
+    total = queryset.order_by().values("wallet_id").annotate(total=Sum(field)).values("total")
+    return Coalesce(Subquery(total), Value(0), output_field=MoneyField())
+
+
+def _ledger_expression() -> Coalesce:
+    checkpoints = BalanceCheckpoint.objects.order_by("-sequence")
+    last_checkpoint = Coalesce(
+        Subquery(checkpoints.filter(wallet_id=OuterRef(OuterRef("pk"))).values("sequence")[:1]), Value(0)
+    )
+    checkpoint_balance = Coalesce(
+        Subquery(checkpoints.filter(wallet_id=OuterRef("pk")).values("balance")[:1]),
+        Value(0),
+        output_field=MoneyField(),
+    )
+    tail = LedgerEntry.objects.filter(wallet_id=OuterRef("pk"), sequence__gt=last_checkpoint)
+    return checkpoint_balance + _sum(tail, "amount")
+
+
+def with_balance(queryset: QuerySet[Wallet]) -> QuerySet[Wallet]:
+    """Annotate ``ledger_balance`` (checkpoint plus tail) and ``current_balance`` (plus pending shards)."""
+
+    shards = WalletBalanceShard.objects.filter(wallet_id=OuterRef("pk"))
+    return queryset.annotate(ledger_balance=_ledger_expression()).annotate(
+        current_balance=F("ledger_balance") + _sum(shards, "amount")
+    )
+
+
+def ledger_balance(wallet: Wallet) -> int:
+    """Return the balance implied by the ledger: latest checkpoint plus the tail."""
+
+    return with_balance(Wallet.objects.filter(pk=wallet.pk)).values_list("ledger_balance", flat=True).get()
+
+
+@dataclass(frozen=True)
+class Drift:
+    wallet_id: int
+    balance: int
+    ledger: int
+
+    @property
+    def difference(self) -> int:
+        return self.balance - self.ledger
+
+
+def reconcile_wallets(*, fix: bool = False) -> list[Drift]:
+    """Return every wallet whose running balance disagrees with its ledger.
+
+    With *fix*, each one gets an adjustment entry for the difference so the
+    ledger explains the balance users have been shown.
+    """
+
+    drifts = [
+        Drift(wallet_id, balance, ledger)
+        for wallet_id, balance, ledger in with_balance(Wallet.objects.order_by("pk"))
+        .filter(~Q(balance=F("ledger_balance")))
+        .values_list("pk", "balance", "ledger_balance")
+    ]
+    if fix:
+        for drift in drifts:
+            with transaction.atomic():
+                locked = with_balance(Wallet.objects.select_for_update().filter(pk=drift.wallet_id)).get()
+                if locked.balance != locked.ledger_balance:
+                    _record_unposted(locked.pk, locked.balance - locked.ledger_balance, RECONCILIATION_REFERENCE)
+    return drifts
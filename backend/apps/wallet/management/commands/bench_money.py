@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+
+
+class Command(BaseCommand):
+    help = "Compare SUM and JSON serialization cost of DECIMAL(18,2) amounts against BIGINT minor units."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=100_000, help="Rows in the scratch table.")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per measurement.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        amounts = [random.randrange(1_000, 50_000_000) for _ in range(options["rows"])]  # noqa: S311
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("CREATE TEMPORARY TABLE bench_money (major NUMERIC(18, 2), minor BIGINT)")
+            cursor.executemany(
+                "INSERT INTO bench_money (major, minor) VALUES (%s, %s)",
+                [(Decimal(amount), amount) for amount in amounts],
+            )
+
+            def total(column: str) -> Callable[[], Any]:
+                def run() -> Any:
+                    cursor.execute(f"SELECT SUM({column}) FROM bench_money")  # noqa: S608 - fixed names
+                    return cursor.fetchone()[0]
+
+                return run
+
+            cursor.execute("SELECT major, minor FROM bench_money")
+            rows = cursor.fetchall()
+            # The old responses built Decimals from the column, then called float() on each.
+            decimals = [Decimal(str(major)) for major, _ in rows]
+            minors = [minor for _, minor in rows]
+
+            self._report("SUM decimal", total("major"), options["repeat"])
+            self._report("SUM bigint", total("minor"), options["repeat"])
+            self._report(
+                "serialize decimal",
+                lambda: json.dumps([{"amount": float(value)} for value in decimals]),
+                options["repeat"],
+            )
+            self._report(
+                "serialize bigint",
+                lambda: json.dumps([{"amount": value} for value in minors]),
+                options["repeat"],
+            )
+            transaction.set_rollback(True)
+
+    def _report(self, label: str, func: Callable[[], Any], repeat: int) -> None:
+        func()
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        self.stdout.write(f"{label:<18} median={samples[len(samples) // 2]:.3f}ms min={samples[0]:.3f}ms")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from apps.auth.models import User
+from apps.wallet.models import LedgerEntry, Wallet
+from apps.wallet.sharding import compact, credit, set_shard_count, wallet_balance
+
+
+class Command(BaseCommand):
+    help = "Hammer one wallet with concurrent credits, unsharded and sharded, and report credits/s."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--threads", type=int, default=16, help="Concurrent writer threads.")
+        parser.add_argument("--credits", type=int, default=200, help="Credits sent by each thread.")
+        parser.add_argument("--shards", type=int, default=16, help="Shard count for the sharded run.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor == "sqlite":
+            msg = "SQLite serializes all writers; point DATABASE_URL at PostgreSQL to run this benchmark."
+            raise CommandError(msg)
+        user = User.objects.create_user(email="bench-wallet@example.invalid", password=None)
+        try:
+            wallet = Wallet.objects.create(user=user)
+            total = options["threads"] * options["credits"]
+            expected = 0
+            for shards in (0, options["shards"]):
+                set_shard_count(wallet, shards)
+                elapsed = self._run(wallet, options["threads"], options["credits"])
+                expected += total
+                compact(wallet)
+                wallet.refresh_from_db()
+                if (balance := wallet_balance(wallet)) != expected:
+                    msg = f"Balance {balance} does not match the {expected} credited"
+                    raise CommandError(msg)
+                self.stdout.write(
+                    f"shards={shards}: {total} credits in {elapsed:.2f}s ({total / elapsed:.0f} credits/s)"
+                )
+        finally:
+            user.delete()
+
+    def _run(self, wallet: Wallet, threads: int, credits: int) -> float:
+        errors: list[BaseException] = []
+        barrier = threading.Barrier(threads + 1)
+
+        def worker() -> None:
+            target = Wallet(pk=wallet.pk, shard_count=wallet.shard_count)
+            try:
+                barrier.wait()
+                for _ in range(credits):
+                    credit(target, 1, LedgerEntry.Kind.SETTLEMENT, "bench")
+            except BaseException as exc:  # noqa: BLE001 - reported after the run
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        if errors:
+            msg = f"{len(errors)} writers failed: {errors[0]!r}"
+            raise CommandError(msg)
+        return elapsed
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.wallet.sharding import compact_all
+
+
+class Command(BaseCommand):
+    help = "Fold sharded wallet credits back into the wallet balances."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Repeat every N seconds instead of running once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            wallets, moved = compact_all()
+            self.stdout.write(f"Compacted {wallets} wallets ({moved} moved from shards).")
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.payments.models import Payment
+from apps.wallet.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's wallet statistics from the payments table."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows inserted per statement.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = rebuild_stats(Payment, batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt wallet statistics for {count} users.")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.wallet.ledger import reconcile_wallets
+
+
+class Command(BaseCommand):
+    help = "Compare every wallet's running balance with its ledger and optionally record the difference."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Append an adjustment entry for each difference instead of failing.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        drifts = reconcile_wallets(fix=options["fix"])
+        for drift in drifts:
+            self.stdout.write(
+                f"wallet {drift.wallet_id}: balance {drift.balance}, ledger {drift.ledger} ({drift.difference:+d})"
+            )
+        if drifts and not options["fix"]:
+            msg = f"{len(drifts)} wallets disagree with their ledger; rerun with --fix to record adjustments."
+            raise CommandError(msg)
+        self.stdout.write(f"Recorded {len(drifts)} adjustments." if drifts else "Every wallet matches its ledger.")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.wallet.models import Wallet
+from apps.wallet.sharding import set_shard_count
+
+
+class Command(BaseCommand):
+    help = "Enable, resize or disable sharded balance updates for one wallet."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("email", help="Email of the wallet owner.")
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=None,
+            help="Number of shards (default WALLET_BALANCE_SHARDS, 0 disables sharding).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        wallet = Wallet.objects.filter(user__email__iexact=options["email"]).first()
+        if wallet is None:
+            msg = f"No wallet for {options['email']}"
+            raise CommandError(msg)
+        set_shard_count(wallet, options["shards"])
+        self.stdout.write(f"Wallet {wallet.pk} now uses {wallet.shard_count} shards.")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.wallet.settlement import settle_completed_tickets
+
+
+class Command(BaseCommand):
+    help = "Move payment amounts from borrowers to lenders for completed tickets, in batches."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000, help="Transfers settled per transaction.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        result = settle_completed_tickets(batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Settled {len(result.applied)} tickets in {result.batches} batches "
+            f"({result.elapsed:.2f}s, {result.rate:.0f} settlements/s)."
+        )
+        for reason, count in Counter(reason for _, reason in result.rejected).most_common():
+            self.stdout.write(f"Rejected {count}: {reason}")
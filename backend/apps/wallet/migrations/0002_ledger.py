@@ -0,0 +1,117 @@
+# Generated by Django 5.0.6 on 2026-10-18 04:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def record_opening_balances(apps, schema_editor):
+    Wallet = apps.get_model("assets_wallet", "Wallet")
+    LedgerEntry = apps.get_model("assets_wallet", "LedgerEntry")
+    BalanceCheckpoint = apps.get_model("assets_wallet", "BalanceCheckpoint")
+    wallets = Wallet.objects.exclude(balance=0).only("pk", "balance")
+    for wallet in wallets.iterator(chunk_size=2000):
+        LedgerEntry.objects.create(
+            wallet=wallet,
+            sequence=1,
+            amount=wallet.balance,
+            kind="adjustment",
+            reference="opening-balance",
+        )
+        BalanceCheckpoint.objects.create(
+            wallet=wallet, sequence=1, balance=wallet.balance
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_wallet", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sequence", models.BigIntegerField()),
+                ("balance", models.DecimalField(decimal_places=2, max_digits=18)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkpoints",
+                        to="assets_wallet.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Balance checkpoint",
+                "verbose_name_plural": "Balance checkpoints",
+            },
+        ),
+        migrations.CreateModel(
+            name="LedgerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sequence", models.BigIntegerField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=18)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("top_up", "Top-up"),
+                            ("settlement", "Settlement"),
+                            ("payout", "Payout"),
+                            ("transfer", "Transfer"),
+                            ("adjustment", "Adjustment"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("reference", models.CharField(blank=True, max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ledger_entries",
+                        to="assets_wallet.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ledger entry",
+                "verbose_name_plural": "Ledger entries",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="balancecheckpoint",
+            constraint=models.UniqueConstraint(
+                fields=("wallet", "sequence"), name="uniq_checkpoint_wallet_sequence"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="ledgerentry",
+            constraint=models.UniqueConstraint(
+                fields=("wallet", "sequence"), name="uniq_ledger_wallet_sequence"
+            ),
+        ),
+        migrations.RunPython(record_opening_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.wallet.stats import rebuild_stats
+
+
+def populate_stats(apps, schema_editor):
+    rebuild_stats(
+        apps.get_model("assets_payments", "Payment"),
+        apps.get_model("assets_wallet", "WalletStats"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_auth", "0004_authauditlog_indexes"),
+        ("assets_payments", "0001_initial"),
+        ("assets_wallet", "0002_ledger"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WalletStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="wallet_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total_count", models.PositiveIntegerField(default=0)),
+                ("verified_count", models.PositiveIntegerField(default=0)),
+                (
+                    "initiated_sum",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=18),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Wallet statistics",
+                "verbose_name_plural": "Wallet statistics",
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
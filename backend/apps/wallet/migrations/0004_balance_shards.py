@@ -0,0 +1,56 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_wallet", "0003_walletstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wallet",
+            name="shard_count",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="WalletBalanceShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("index", models.PositiveSmallIntegerField()),
+                (
+                    "amount",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=18),
+                ),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_shards",
+                        to="assets_wallet.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Wallet balance shard",
+                "verbose_name_plural": "Wallet balance shards",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="walletbalanceshard",
+            constraint=models.UniqueConstraint(
+                fields=("wallet", "index"), name="uniq_shard_wallet_index"
+            ),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:06
+
+import assets_backend.money
+from django.db import migrations
+from django.db.models import F
+from django.db.models.functions import Round
+
+# Minor-unit exponents as of this migration; later edits to
+# assets_backend.money.CURRENCY_EXPONENTS must not change how old rows convert.
+CURRENCY_EXPONENTS = {"IRR": 0, "EUR": 2, "USD": 2}
+
+
+def to_minor_units(apps, schema_editor):
+    Wallet = apps.get_model("assets_wallet", "Wallet")
+    currencies = set(Wallet.objects.values_list("currency", flat=True).distinct())
+    unknown = sorted(currencies - CURRENCY_EXPONENTS.keys())
+    if unknown:
+        msg = f"Cannot convert wallets in unsupported currencies: {', '.join(unknown)}"
+        raise RuntimeError(msg)
+
+    scaled = (
+        (Wallet, "balance", "currency"),
+        (apps.get_model("assets_wallet", "LedgerEntry"), "amount", "wallet__currency"),
+        (
+            apps.get_model("assets_wallet", "BalanceCheckpoint"),
+            "balance",
+            "wallet__currency",
+        ),
+        (
+            apps.get_model("assets_wallet", "WalletBalanceShard"),
+            "amount",
+            "wallet__currency",
+        ),
+    )
+    for currency in currencies:
+        factor = 10 ** CURRENCY_EXPONENTS[currency]
+        for model, field, lookup in scaled:
+            model.objects.filter(**{lookup: currency}).update(
+                **{field: Round(F(field) * factor)}
+            )
+    # Sums of Payment amounts, which are rials like the payments they count.
+    apps.get_model("assets_wallet", "WalletStats").objects.update(
+        initiated_sum=Round("initiated_sum")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_wallet", "0004_balance_shards"),
+    ]
+
+    operations = [
+        migrations.RunPython(to_minor_units, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="balancecheckpoint",
+            name="balance",
+            field=assets_backend.money.MoneyField(),
+        ),
+        migrations.AlterField(
+            model_name="ledgerentry",
+            name="amount",
+            field=assets_backend.money.MoneyField(),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="balance",
+            field=assets_backend.money.MoneyField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="walletbalanceshard",
+            name="amount",
+            field=assets_backend.money.MoneyField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="walletstats",
+            name="initiated_sum",
+            field=assets_backend.money.MoneyField(default=0),
+        ),
+    ]
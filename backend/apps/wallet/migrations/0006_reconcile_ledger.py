@@ -0,0 +1,52 @@
+# Generated by Django 5.0.6 on 2026-10-18 06:10
+
+from django.db import migrations
+from django.db.models import Sum
+
+
+def record_missing_entries(apps, schema_editor):
+    # Wallets seeded or edited without ledger entries get one adjustment for
+    # the difference, so the ledger explains the balance already shown.
+    Wallet = apps.get_model("assets_wallet", "Wallet")
+    LedgerEntry = apps.get_model("assets_wallet", "LedgerEntry")
+    BalanceCheckpoint = apps.get_model("assets_wallet", "BalanceCheckpoint")
+    for wallet in Wallet.objects.order_by("pk").only("pk", "balance").iterator():
+        checkpoint = (
+            BalanceCheckpoint.objects.filter(wallet_id=wallet.pk)
+            .order_by("-sequence")
+            .values_list("sequence", "balance")
+            .first()
+        )
+        sequence, ledger = checkpoint or (0, 0)
+        ledger += (
+            LedgerEntry.objects.filter(
+                wallet_id=wallet.pk, sequence__gt=sequence
+            ).aggregate(total=Sum("amount"))["total"]
+            or 0
+        )
+        if ledger == wallet.balance:
+            continue
+        last = (
+            LedgerEntry.objects.filter(wallet_id=wallet.pk)
+            .order_by("-sequence")
+            .values_list("sequence", flat=True)
+            .first()
+        )
+        LedgerEntry.objects.create(
+            wallet_id=wallet.pk,
+            sequence=(last or 0) + 1,
+            amount=wallet.balance - ledger,
+            kind="adjustment",
+            reference="reconciliation",
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_wallet", "0005_minor_units"),
+    ]
+
+    operations = [
+        migrations.RunPython(record_missing_entries, migrations.RunPython.noop),
+    ]
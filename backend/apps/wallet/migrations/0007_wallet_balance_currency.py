@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:43
+
+import assets_backend.money
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets_wallet", "0006_reconcile_ledger"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="wallet",
+            name="balance",
+            field=assets_backend.money.MoneyField(currency_field="currency", default=0),
+        ),
+    ]
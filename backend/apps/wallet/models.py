@@ -1,9 +1,11 @@
 from django.conf import settings
 from django.db import models
 
+from assets_backend.money import MoneyField
+
 
 class Wallet(models.Model):
-    """Wallet holding a user's current IRR balance."""
+    """Wallet holding a user's current balance in minor units of ``currency``."""
 
     class Status(models.TextChoices):
         ACTIVE = "active", "Active"
@@ -14,9 +16,11 @@ class Wallet(models.Model):
         on_delete=models.CASCADE,
         related_name="wallet",
     )
-    balance = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    balance = MoneyField(default=0, currency_field="currency")
     currency = models.CharField(max_length=10, default="IRR")
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE)
+    # Number of ``WalletBalanceShard`` rows taking credits; 0 keeps the balance in this row only.
+    shard_count = models.PositiveSmallIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -28,3 +32,112 @@ class Wallet(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return f"Wallet<{self.user_id}>"
+
+
+class LedgerEntryQuerySet(models.QuerySet):
+    def update(self, **kwargs):  # type: ignore[no-untyped-def]
+        msg = "Ledger entries are append-only"
+        raise TypeError(msg)
+
+    def delete(self):  # type: ignore[no-untyped-def]
+        msg = "Ledger entries are append-only"
+        raise TypeError(msg)
+
+
+class LedgerEntry(models.Model):
+    """Immutable balance movement; positive amounts credit the wallet."""
+
+    class Kind(models.TextChoices):
+        TOP_UP = "top_up", "Top-up"
+        SETTLEMENT = "settlement", "Settlement"
+        PAYOUT = "payout", "Payout"
+        TRANSFER = "transfer", "Transfer"
+        ADJUSTMENT = "adjustment", "Adjustment"
+
+    wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="ledger_entries")
+    sequence = models.BigIntegerField()
+    amount = MoneyField()
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    reference = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = LedgerEntryQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["wallet", "sequence"], name="uniq_ledger_wallet_sequence"),
+        ]
+        verbose_name = "Ledger entry"
+        verbose_name_plural = "Ledger entries"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"LedgerEntry<{self.wallet_id}:{self.sequence}>"
+
+    def save(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if not self._state.adding:
+            msg = "Ledger entries are append-only"
+            raise TypeError(msg)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        msg = "Ledger entries are append-only"
+        raise TypeError(msg)
+
+
+class BalanceCheckpoint(models.Model):
+    """Wallet balance after applying every entry up to ``sequence``."""
+
+    wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="checkpoints")
+    sequence = models.BigIntegerField()
+    balance = MoneyField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["wallet", "sequence"], name="uniq_checkpoint_wallet_sequence"),
+        ]
+        verbose_name = "Balance checkpoint"
+        verbose_name_plural = "Balance checkpoints"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"BalanceCheckpoint<{self.wallet_id}:{self.sequence}>"
+
+
+class WalletBalanceShard(models.Model):
+    """Credits collected for a sharded wallet until compaction folds them into its balance."""
+
+    wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="balance_shards")
+    index = models.PositiveSmallIntegerField()
+    amount = MoneyField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["wallet", "index"], name="uniq_shard_wallet_index"),
+        ]
+        verbose_name = "Wallet balance shard"
+        verbose_name_plural = "Wallet balance shards"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"WalletBalanceShard<{self.wallet_id}:{self.index}>"
+
+
+class WalletStats(models.Model):
+    """Per-user payment counters maintained incrementally by ``Payment`` hooks."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="wallet_stats",
+    )
+    total_count = models.PositiveIntegerField(default=0)
+    verified_count = models.PositiveIntegerField(default=0)
+    initiated_sum = MoneyField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Wallet statistics"
+        verbose_name_plural = "Wallet statistics"
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"WalletStats<{self.user_id}>"
@@ -0,0 +1,262 @@
+"""Batched wallet-to-wallet settlement."""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Sum
+from django.utils import timezone
+
+from apps.payments.models import Payment
+from apps.tickets.models import Ticket
+from assets_backend.events import publish_many
+
+from .models import BalanceCheckpoint, LedgerEntry, Wallet, WalletBalanceShard
+from .sharding import credit
+from .stats import apply_deltas, contribution
+
+
+# (pk, status, amount, borrower_id, lender_id, ticket_id)
+PaymentRow = tuple[int, str, int, int, int, int]
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """Move ``amount`` from the payer's wallet to the payee's wallet."""
+
+    payer_id: int
+    payee_id: int
+    amount: int
+    reference: str = ""
+    payment_id: int | None = None
+
+
+@dataclass
+class SettlementResult:
+    applied: list[Transfer] = field(default_factory=list)
+    rejected: list[tuple[Transfer, str]] = field(default_factory=list)
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return len(self.applied) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def extend(self, other: SettlementResult) -> None:
+        self.applied.extend(other.applied)
+        self.rejected.extend(other.rejected)
+        self.batches += other.batches
+
+
+def settle(transfers: list[Transfer]) -> SettlementResult:
+    """Apply *transfers* in one transaction, in the order given.
+
+    Every payer wallet and every unsharded payee wallet is locked up front in
+    primary-key order, so two batches touching the same wallets cannot
+    deadlock.  Payees with balance shards are credited through
+    ``sharding.credit`` (one shard update per payee per batch) without
+    locking their wallet row, which keeps hot wallets from serializing
+    settlement.  Transfers that would overdraw the payer (counting its
+    uncompacted shard credits), touch a frozen or missing wallet, or carry a
+    non-positive amount are rejected individually, as are transfers whose
+    payment is no longer ``initiated``; those payments are locked before any
+    wallet so a payment settled by an overlapping run is never paid twice.
+    The rest are written with one bulk insert per table and one bulk update
+    per table.
+    """
+
+    result = SettlementResult(batches=1)
+    started = time.monotonic()
+    if not transfers:
+        return result
+    payer_ids = {transfer.payer_id for transfer in transfers}
+    user_ids = payer_ids | {transfer.payee_id for transfer in transfers}
+    now = timezone.now()
+    sharded_ids = set(
+        Wallet.objects.filter(user_id__in=user_ids - payer_ids, shard_count__gt=0).values_list("user_id", flat=True)
+    )
+
+    with transaction.atomic():
+        pending = _lock_payments([transfer.payment_id for transfer in transfers if transfer.payment_id])
+        wallets = {
+            wallet.user_id: wallet
+            for wallet in Wallet.objects.select_for_update()
+            .filter(user_id__in=user_ids - sharded_ids)
+            .only("pk", "user_id", "balance", "status", "shard_count")
+            .order_by("pk")
+        }
+        # Credit-only hot wallets: read, not locked; their credits go to shards.
+        wallets.update(
+            (wallet.user_id, wallet)
+            for wallet in Wallet.objects.filter(user_id__in=sharded_ids).only(
+                "pk", "user_id", "balance", "status", "shard_count"
+            )
+        )
+        sequences = dict(
+            LedgerEntry.objects.filter(wallet_id__in=[wallet.pk for wallet in wallets.values()])
+            .values("wallet_id")
+            .annotate(last=Max("sequence"))
+            .values_list("wallet_id", "last")
+            .order_by()
+        )
+
+        # Spendable funds: the running balance plus credits still sitting on shards.
+        available = {wallet.user_id: wallet.balance for wallet in wallets.values()}
+        owners = {wallet.pk: wallet.user_id for wallet in wallets.values() if wallet.user_id in payer_ids}
+        for wallet_id, amount in (
+            WalletBalanceShard.objects.filter(wallet_id__in=owners)
+            .values("wallet_id")
+            .annotate(total=Sum("amount"))
+            .values_list("wallet_id", "total")
+            .order_by()
+        ):
+            available[owners[wallet_id]] += amount
+
+        settled: list[PaymentRow] = []
+        entries: list[LedgerEntry] = []
+        checkpoints: list[BalanceCheckpoint] = []
+        changed: dict[int, Wallet] = {}
+        shard_credits: dict[int, int] = defaultdict(int)
+
+        def post(wallet: Wallet, amount: int, reference: str) -> None:
+            sequence = sequences.get(wallet.pk, 0) + 1
+            sequences[wallet.pk] = sequence
+            wallet.balance += amount
+            changed[wallet.pk] = wallet
+            entries.append(
+                LedgerEntry(
+                    wallet_id=wallet.pk,
+                    sequence=sequence,
+                    amount=amount,
+                    kind=LedgerEntry.Kind.SETTLEMENT,
+                    reference=reference[:64],
+                )
+            )
+            if sequence % settings.WALLET_CHECKPOINT_INTERVAL == 0:
+                checkpoints.append(
+                    BalanceCheckpoint(wallet_id=wallet.pk, sequence=sequence, balance=wallet.balance)
+                )
+
+        for transfer in transfers:
+            payer = wallets.get(transfer.payer_id)
+            payee = wallets.get(transfer.payee_id)
+            if transfer.amount <= 0 or transfer.payer_id == transfer.payee_id:
+                reason = "invalid_transfer"
+            elif transfer.payment_id is not None and transfer.payment_id not in pending:
+                reason = "payment_not_pending"
+            elif payer is None or payee is None:
+                reason = "missing_wallet"
+            elif Wallet.Status.FROZEN in (payer.status, payee.status):
+                reason = "wallet_frozen"
+            elif available[payer.user_id] < transfer.amount:
+                reason = "insufficient_funds"
+            else:
+                available[payer.user_id] -= transfer.amount
+                post(payer, -transfer.amount, transfer.reference)
+                if payee.user_id in sharded_ids:
+                    shard_credits[payee.user_id] += transfer.amount
+                else:
+                    post(payee, transfer.amount, transfer.reference)
+                if transfer.payment_id is not None:
+                    settled.append(pending.pop(transfer.payment_id))
+                result.applied.append(transfer)
+                continue
+            result.rejected.append((transfer, reason))
+
+        LedgerEntry.objects.bulk_create(entries)
+        BalanceCheckpoint.objects.bulk_create(checkpoints)
+        Wallet.objects.bulk_update(changed.values(), ["balance"])
+        for user_id, amount in shard_credits.items():
+            credit(wallets[user_id], amount, LedgerEntry.Kind.SETTLEMENT, "settlement")
+        _verify_payments(settled, now)
+
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def _lock_payments(payment_ids: list[int]) -> dict[int, PaymentRow]:
+    """Lock the still-initiated payments among *payment_ids*, in primary-key order."""
+
+    if not payment_ids:
+        return {}
+    rows = (
+        Payment.objects.select_for_update(of=("self",))
+        .filter(pk__in=payment_ids, status=Payment.Status.INITIATED)
+        .order_by("pk")
+        .values_list("pk", "status", "amount", "ticket__borrower_id", "ticket__lender_id", "ticket_id")
+    )
+    return {row[0]: row for row in rows}
+
+
+def _verify_payments(rows: list[PaymentRow], now: datetime) -> None:
+    """Mark settled payments verified, keeping ``WalletStats`` in step."""
+
+    if not rows:
+        return
+    Payment.objects.filter(pk__in=[row[0] for row in rows]).update(
+        status=Payment.Status.VERIFIED, verified_at=now
+    )
+
+    # QuerySet.update() skips the per-row signals, so apply the stats delta here.
+    deltas: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+    for _, status, amount, borrower_id, lender_id, _ in rows:
+        before = contribution(status, amount)
+        after = contribution(Payment.Status.VERIFIED, amount)
+        for user_id in {borrower_id, lender_id}:
+            for index in range(3):
+                deltas[user_id][index] += after[index] - before[index]
+    apply_deltas({user_id: tuple(delta) for user_id, delta in deltas.items()})
+    publish_many(
+        (
+            [borrower_id, lender_id],
+            "payment",
+            {"id": pk, "ticketId": ticket_id, "status": Payment.Status.VERIFIED},
+        )
+        for pk, _, _, borrower_id, lender_id, ticket_id in rows
+    )
+
+
+def settle_completed_tickets(*, batch_size: int = 1000) -> SettlementResult:
+    """Settle every completed ticket whose payment is still outstanding.
+
+    The borrower pays the lender the payment amount.  Payments are walked in
+    primary-key order and each batch is settled in its own transaction.
+    """
+
+    pending = Payment.objects.filter(
+        ticket__status=Ticket.Status.COMPLETED,
+        status=Payment.Status.INITIATED,
+    ).order_by("pk")
+    result = SettlementResult()
+    started = time.monotonic()
+    last_pk = 0
+    while True:
+        rows = list(
+            pending.filter(pk__gt=last_pk).values_list(
+                "pk", "authority", "amount", "ticket__borrower_id", "ticket__lender_id"
+            )[:batch_size]
+        )
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+        result.extend(
+            settle(
+                [
+                    Transfer(
+                        payer_id=borrower_id,
+                        payee_id=lender_id,
+                        amount=amount,
+                        reference=authority,
+                        payment_id=pk,
+                    )
+                    for pk, authority, amount, borrower_id, lender_id in rows
+                ]
+            )
+        )
+    result.elapsed = time.monotonic() - started
+    return result
@@ -0,0 +1,67 @@
+"""Keep ``WalletStats`` in step with ``Payment`` writes and open the ledger of new wallets."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.payments.models import Payment
+from apps.tickets.models import Ticket
+
+from .ledger import record_opening_balance
+from .models import Wallet
+from .stats import ZERO, apply_delta, contribution
+
+
+def _participants(payment: Payment) -> set[int]:
+    if Payment.ticket.is_cached(payment):
+        return {payment.ticket.borrower_id, payment.ticket.lender_id}
+    row = Ticket.objects.filter(pk=payment.ticket_id).values_list("borrower_id", "lender_id").first()
+    return set(row) if row else set()
+
+
+@receiver(post_init, sender=Payment, dispatch_uid="wallet_stats_payment_init")
+def remember_payment_state(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:  # noqa: ARG001
+    if instance.pk is None:
+        instance._stats_origin = ZERO
+        return
+    # Avoid triggering deferred-field loads; pre_save fetches the state instead.
+    loaded = instance.__dict__
+    if "status" in loaded and "amount" in loaded:
+        instance._stats_origin = contribution(loaded["status"], loaded["amount"])
+    else:
+        instance._stats_origin = None
+
+
+@receiver(pre_save, sender=Payment, dispatch_uid="wallet_stats_payment_pre_save")
+def load_payment_state(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:  # noqa: ARG001
+    if getattr(instance, "_stats_origin", None) is None:
+        row = Payment.objects.filter(pk=instance.pk).values_list("status", "amount").first()
+        instance._stats_origin = contribution(*row) if row else ZERO
+
+
+@receiver(post_save, sender=Payment, dispatch_uid="wallet_stats_payment_save")
+def update_stats_on_save(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:  # noqa: ARG001
+    current = contribution(instance.status, instance.amount)
+    apply_delta(_participants(instance), instance._stats_origin, current)
+    instance._stats_origin = current
+
+
+@receiver(post_delete, sender=Payment, dispatch_uid="wallet_stats_payment_delete")
+def update_stats_on_delete(sender: type[Payment], instance: Payment, **kwargs: Any) -> None:  # noqa: ARG001
+    # The fields reflect the deleted row unless they were edited without saving.
+    loaded = instance.__dict__
+    if "status" in loaded and "amount" in loaded:
+        origin = contribution(loaded["status"], loaded["amount"])
+    else:
+        origin = instance._stats_origin or ZERO
+    apply_delta(_participants(instance), origin, ZERO)
+    instance._stats_origin = ZERO
+
+
+@receiver(post_save, sender=Wallet, dispatch_uid="wallet_opening_balance")
+def open_ledger(sender: type[Wallet], instance: Wallet, created: bool, **kwargs: Any) -> None:  # noqa: ARG001
+    if created and not kwargs.get("raw"):
+        record_opening_balance(instance)
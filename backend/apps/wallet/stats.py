@@ -0,0 +1,135 @@
+"""Incrementally maintained per-user payment statistics."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import WalletStats
+
+
+Contribution = tuple[int, int, int]
+ZERO: Contribution = (0, 0, 0)
+
+
+def contribution(status: str | None, amount: int | None) -> Contribution:
+    """Return what one payment adds to ``(total, verified, initiated_sum)``."""
+
+    if status is None:
+        return ZERO
+    return (
+        1,
+        1 if status == "verified" else 0,
+        (amount or 0) if status == "initiated" else 0,
+    )
+
+
+def apply_delta(user_ids: set[int], before: Contribution, after: Contribution) -> None:
+    """Shift the counters of *user_ids* from *before* to *after* using ``F()`` updates."""
+
+    total, verified, initiated = (after[index] - before[index] for index in range(3))
+    if not user_ids or (total, verified, initiated) == (0, 0, 0):
+        return
+    changes = {
+        "total_count": F("total_count") + total,
+        "verified_count": F("verified_count") + verified,
+        "initiated_sum": F("initiated_sum") + initiated,
+    }
+    with transaction.atomic():
+        updated = WalletStats.objects.filter(user_id__in=user_ids).update(**changes)
+        if updated == len(user_ids) or min(total, verified, initiated) < 0:
+            # A negative delta for a missing row means the stats already drifted;
+            # the rebuild command repairs that.
+            return
+        existing = set(WalletStats.objects.filter(user_id__in=user_ids).values_list("user_id", flat=True))
+        missing = user_ids - existing
+        try:
+            with transaction.atomic():
+                WalletStats.objects.bulk_create(
+                    [
+                        WalletStats(
+                            user_id=user_id,
+                            total_count=total,
+                            verified_count=verified,
+                            initiated_sum=initiated,
+                        )
+                        for user_id in missing
+                    ]
+                )
+        except IntegrityError:
+            WalletStats.objects.filter(user_id__in=missing).update(**changes)
+
+
+def apply_deltas(deltas: dict[int, Contribution]) -> None:
+    """Apply a different delta per user with one locked read and one bulk update."""
+
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta != ZERO}
+    if not deltas:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        rows = {
+            stats.user_id: stats
+            for stats in WalletStats.objects.select_for_update().filter(user_id__in=deltas).order_by("pk")
+        }
+        for user_id, row in rows.items():
+            total, verified, initiated = deltas[user_id]
+            row.total_count += total
+            row.verified_count += verified
+            row.initiated_sum += initiated
+            row.updated_at = now
+        WalletStats.objects.bulk_update(
+            rows.values(), ["total_count", "verified_count", "initiated_sum", "updated_at"]
+        )
+    for user_id in deltas.keys() - rows.keys():
+        apply_delta({user_id}, ZERO, deltas[user_id])
+
+
+def compute_stats(payment_model: Any) -> dict[int, Contribution]:
+    """Aggregate statistics for every user from scratch."""
+
+    aggregates = {
+        "total": Count("pk"),
+        "verified": Count("pk", filter=Q(status="verified")),
+        "initiated": Sum("amount", filter=Q(status="initiated"), default=0),
+    }
+    stats: dict[int, list[int]] = defaultdict(lambda: [0, 0, 0])
+    borrower_rows = payment_model.objects.values("ticket__borrower_id").annotate(**aggregates).order_by()
+    lender_rows = (
+        payment_model.objects.exclude(ticket__lender_id=F("ticket__borrower_id"))
+        .values("ticket__lender_id")
+        .annotate(**aggregates)
+        .order_by()
+    )
+    for rows, key in ((borrower_rows, "ticket__borrower_id"), (lender_rows, "ticket__lender_id")):
+        for row in rows:
+            entry = stats[row[key]]
+            entry[0] += row["total"]
+            entry[1] += row["verified"]
+            entry[2] += row["initiated"]
+    return {user_id: (total, verified, initiated) for user_id, (total, verified, initiated) in stats.items()}
+
+
+def rebuild_stats(payment_model: Any, stats_model: Any = WalletStats, *, batch_size: int = 1000) -> int:
+    """Replace every statistics row with freshly aggregated values."""
+
+    computed = compute_stats(payment_model)
+    with transaction.atomic():
+        stats_model.objects.all().delete()
+        stats_model.objects.bulk_create(
+            [
+                stats_model(
+                    user_id=user_id,
+                    total_count=total,
+                    verified_count=verified,
+                    initiated_sum=initiated,
+                )
+                for user_id, (total, verified, initiated) in computed.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(computed)
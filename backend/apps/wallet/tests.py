@@ -1,3 +1,348 @@
-from django.test import TestCase
+from decimal import Decimal
+from io import StringIO
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import Client, TestCase, override_settings
+
+from apps.auth.cache import user_cache
+from apps.auth.models import User
+from apps.auth.seed import seed_dev_data
+from apps.auth.tokens import create_access_token
+from apps.payments.models import Payment
+from apps.tickets.models import Ticket
+from assets_backend.money import Money
+
+from .ledger import append_entry, ledger_balance, reconcile_wallets
+from .models import BalanceCheckpoint, LedgerEntry, Wallet, WalletBalanceShard, WalletStats
+from .settlement import Transfer, settle, settle_completed_tickets
+from .sharding import compact, credit, set_shard_count, wallet_balance
+
+
+class WalletOverviewTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(email="wallet@example.com", password="Passw0rd!")
+        self.other = User.objects.create_user(email="lender@example.com", password="Passw0rd!")
+        Wallet.objects.create(user=self.user, balance=1000)
+        statuses = [
+            Payment.Status.VERIFIED,
+            Payment.Status.VERIFIED,
+            Payment.Status.INITIATED,
+            Payment.Status.FAILED,
+        ]
+        for index, status in enumerate(statuses):
+            ticket = Ticket.objects.create(
+                asset_name=f"Asset {index}",
+                borrower=self.user if index % 2 == 0 else self.other,
+                lender=self.other if index % 2 == 0 else self.user,
+            )
+            Payment.objects.create(
+                ticket=ticket,
+                authority=f"AUTH-{index}",
+                amount=250,
+                status=status,
+            )
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def test_overview_summary_values(self) -> None:
+        payload = self.client.get("/api/wallet/overview", **self.headers).json()
+
+        self.assertEqual(payload["wallet"]["balance"], 1000)
+        self.assertIsInstance(payload["transactions"][0]["amount"], int)
+        self.assertEqual(payload["wallet"]["settlementBuffer"], 50)
+        self.assertEqual(payload["wallet"]["upcomingPayouts"], 250)
+        self.assertEqual(len(payload["transactions"]), 4)
+        self.assertEqual(payload["transactions"][0]["ticketAsset"], "Asset 3")
+        self.assertIsNone(payload["transactionsNext"])
+
+    def test_transactions_endpoint_pages_with_cursor(self) -> None:
+        first = self.client.get("/api/wallet/transactions?limit=3", **self.headers).json()
+        second = self.client.get(first["next"], **self.headers).json()
+
+        self.assertEqual([item["ticketAsset"] for item in first["items"]], ["Asset 3", "Asset 2", "Asset 1"])
+        self.assertEqual([item["ticketAsset"] for item in second["items"]], ["Asset 0"])
+        self.assertIsNone(second["next"])
+
+    def test_overview_query_budget(self) -> None:
+        self.client.get("/api/wallet/overview", **self.headers)
+
+        # wallet row, statistics row, one page of payments
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/wallet/overview", **self.headers)
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(WALLET_CHECKPOINT_INTERVAL=3)
+class LedgerTests(TestCase):
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.user = User.objects.create_user(email="ledger@example.com", password="Passw0rd!")
+        self.wallet = Wallet.objects.create(user=self.user)
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(self.user)}"}
+
+    def test_append_updates_balance_and_writes_checkpoints(self) -> None:
+        for amount in (100, -30, 50, 25):
+            append_entry(self.wallet, amount, LedgerEntry.Kind.ADJUSTMENT)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, 145)
+        checkpoint = BalanceCheckpoint.objects.get(wallet=self.wallet)
+        self.assertEqual((checkpoint.sequence, checkpoint.balance), (3, 120))
+        with self.assertNumQueries(1):
+            self.assertEqual(ledger_balance(self.wallet), 145)
+
+    def test_opening_balance_and_direct_writes_reconcile(self) -> None:
+        other = Wallet.objects.create(user=User.objects.create_user(email="opening@example.com"), balance=700)
+        self.assertEqual(ledger_balance(other), 700)
+
+        Wallet.objects.filter(pk=other.pk).update(balance=900)
+        drifts = reconcile_wallets()
+        self.assertEqual([(drift.wallet_id, drift.difference) for drift in drifts], [(other.pk, 200)])
+        with self.assertRaises(CommandError):
+            call_command("reconcile_wallet_ledger", stdout=StringIO())
+
+        call_command("reconcile_wallet_ledger", "--fix", stdout=StringIO())
+        self.assertEqual(ledger_balance(other), 900)
+        self.assertEqual(reconcile_wallets(), [])
+
+    @override_settings(DEBUG=True)
+    def test_seeded_wallets_agree_with_their_ledger(self) -> None:
+        seed_dev_data()
+
+        seeded = Wallet.objects.filter(user__email__in=["admin@example.com", "user@example.com"])
+        self.assertEqual(seeded.count(), 2)
+        for wallet in seeded:
+            self.assertEqual(ledger_balance(wallet), wallet.balance)
+        self.assertEqual(reconcile_wallets(), [])
+
+    def test_entries_are_append_only(self) -> None:
+        entry = append_entry(self.wallet, 10, LedgerEntry.Kind.TOP_UP)
+
+        with self.assertRaises(TypeError):
+            entry.save()
+        with self.assertRaises(TypeError):
+            LedgerEntry.objects.filter(pk=entry.pk).update(amount=0)
+        with self.assertRaises(TypeError):
+            LedgerEntry.objects.filter(pk=entry.pk).delete()
+
+    def test_history_endpoint_pages_by_sequence(self) -> None:
+        for index in range(5):
+            append_entry(self.wallet, 1, LedgerEntry.Kind.TOP_UP, reference=f"R{index}")
+
+        client = Client()
+        first = client.get("/api/wallet/ledger", {"limit": 3}, **self.headers).json()
+        self.assertEqual([entry["sequence"] for entry in first["items"]], [5, 4, 3])
+        self.assertIsNone(first["prev"])
+        second = client.get(first["next"], **self.headers).json()
+        self.assertEqual([entry["sequence"] for entry in second["items"]], [2, 1])
+        self.assertIsNone(second["next"])
+
+
+class WalletStatsTests(TestCase):
+    def setUp(self) -> None:
+        self.borrower = User.objects.create_user(email="borrower@example.com", password="Passw0rd!")
+        self.lender = User.objects.create_user(email="lender@example.com", password="Passw0rd!")
+        self.ticket = Ticket.objects.create(asset_name="Gold", borrower=self.borrower, lender=self.lender)
+
+    def stats_for(self, user: User) -> tuple[int, int, int]:
+        stats = WalletStats.objects.get(user=user)
+        return stats.total_count, stats.verified_count, stats.initiated_sum
+
+    def test_payment_writes_update_both_participants(self) -> None:
+        payment = Payment.objects.create(ticket=self.ticket, authority="A-1", amount=40)
+        self.assertEqual(self.stats_for(self.borrower), (1, 0, 40))
+        self.assertEqual(self.stats_for(self.lender), (1, 0, 40))
+
+        payment.status = Payment.Status.VERIFIED
+        payment.save()
+        self.assertEqual(self.stats_for(self.borrower), (1, 1, 0))
+
+        deferred = Payment.objects.only("pk").get(pk=payment.pk)
+        deferred.status = Payment.Status.FAILED
+        deferred.save()
+        self.assertEqual(self.stats_for(self.lender), (1, 0, 0))
+
+        payment.refresh_from_db()
+        payment.delete()
+        self.assertEqual(self.stats_for(self.borrower), (0, 0, 0))
+
+    def test_rebuild_command_repairs_drift(self) -> None:
+        Payment.objects.create(ticket=self.ticket, authority="A-1", amount=10)
+        second = Ticket.objects.create(asset_name="Silver", borrower=self.lender, lender=self.borrower)
+        Payment.objects.create(ticket=second, authority="A-2", amount=5, status=Payment.Status.VERIFIED)
+        WalletStats.objects.update(total_count=99, verified_count=0, initiated_sum=0)
+
+        call_command("rebuild_wallet_stats", stdout=StringIO())
+
+        self.assertEqual(self.stats_for(self.borrower), (2, 1, 10))
+        self.assertEqual(self.stats_for(self.lender), (2, 1, 10))
+
+
+class WalletShardingTests(TestCase):
+    def setUp(self) -> None:
+        user = User.objects.create_user(email="hot@example.com", password="Passw0rd!")
+        self.wallet = Wallet.objects.create(user=user, balance=100)
+        set_shard_count(self.wallet, 4)
+
+    def test_credits_land_on_shards_until_compacted(self) -> None:
+        for _ in range(5):
+            credit(self.wallet, 10, LedgerEntry.Kind.SETTLEMENT)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, 100)
+        self.assertEqual(WalletBalanceShard.objects.filter(wallet=self.wallet).count(), 4)
+        self.assertEqual(wallet_balance(self.wallet), 150)
+
+        self.assertEqual(compact(self.wallet), 50)
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, 150)
+        self.assertEqual(wallet_balance(self.wallet), 150)
+        entry = LedgerEntry.objects.filter(wallet=self.wallet).latest("sequence")
+        self.assertEqual((entry.amount, entry.reference), (50, "shard-compaction"))
+        self.assertEqual(ledger_balance(self.wallet), 150)
+
+    def test_disabling_shards_keeps_pending_credits(self) -> None:
+        credit(self.wallet, 750, LedgerEntry.Kind.SETTLEMENT)
+
+        set_shard_count(self.wallet, 0)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, 850)
+        self.assertFalse(WalletBalanceShard.objects.filter(wallet=self.wallet).exists())
+        credit(self.wallet, 250, LedgerEntry.Kind.SETTLEMENT)
+        # Opening balance, compaction, then the unsharded credit.
+        self.assertEqual(LedgerEntry.objects.filter(wallet=self.wallet).count(), 3)
+
+
+class SettlementTests(TestCase):
+    def setUp(self) -> None:
+        self.borrower = User.objects.create_user(email="payer@example.com", password="Passw0rd!")
+        self.lender = User.objects.create_user(email="payee@example.com", password="Passw0rd!")
+        self.frozen = User.objects.create_user(email="frozen@example.com", password="Passw0rd!")
+        append_entry(Wallet.objects.create(user=self.borrower), 100, LedgerEntry.Kind.TOP_UP)
+        Wallet.objects.create(user=self.lender)
+        Wallet.objects.create(user=self.frozen, balance=500, status=Wallet.Status.FROZEN)
+
+    def test_batch_applies_valid_transfers_and_rejects_the_rest(self) -> None:
+        result = settle(
+            [
+                Transfer(self.borrower.pk, self.lender.pk, 60, "T-1"),
+                Transfer(self.borrower.pk, self.lender.pk, 60, "T-2"),
+                Transfer(self.frozen.pk, self.lender.pk, 10, "T-3"),
+                Transfer(self.borrower.pk, self.lender.pk, 40, "T-4"),
+            ]
+        )
+
+        self.assertEqual([transfer.reference for transfer in result.applied], ["T-1", "T-4"])
+        self.assertEqual([reason for _, reason in result.rejected], ["insufficient_funds", "wallet_frozen"])
+        payer = Wallet.objects.get(user=self.borrower)
+        payee = Wallet.objects.get(user=self.lender)
+        self.assertEqual((payer.balance, payee.balance), (0, 100))
+        self.assertEqual(ledger_balance(payer), payer.balance)
+        self.assertEqual(ledger_balance(payee), payee.balance)
+        self.assertEqual(list(payer.ledger_entries.order_by("sequence").values_list("sequence", flat=True)), [1, 2, 3])
+
+    def test_payment_is_never_settled_twice(self) -> None:
+        ticket = Ticket.objects.create(
+            asset_name="Gold", borrower=self.borrower, lender=self.lender, status=Ticket.Status.COMPLETED
+        )
+        payment = Payment.objects.create(ticket=ticket, authority="A-1", amount=30)
+        transfer = Transfer(self.borrower.pk, self.lender.pk, 30, "A-1", payment_id=payment.pk)
+
+        first = settle([transfer, transfer])
+        second = settle([transfer])
+
+        self.assertEqual(len(first.applied), 1)
+        self.assertEqual([reason for _, reason in first.rejected], ["payment_not_pending"])
+        self.assertEqual([reason for _, reason in second.rejected], ["payment_not_pending"])
+        self.assertEqual(Wallet.objects.get(user=self.borrower).balance, 70)
+        self.assertEqual(Wallet.objects.get(user=self.lender).balance, 30)
+
+    def test_uncompacted_shard_credits_count_as_funds(self) -> None:
+        payer = Wallet.objects.get(user=self.borrower)
+        set_shard_count(payer, 2)
+        credit(payer, 50, LedgerEntry.Kind.SETTLEMENT)
+
+        result = settle([Transfer(self.borrower.pk, self.lender.pk, 150, "T-1")])
+
+        self.assertEqual(len(result.applied), 1)
+        self.assertEqual(wallet_balance(payer), 0)
+        self.assertEqual(Wallet.objects.get(user=self.lender).balance, 150)
+
+    def test_sharded_payee_is_credited_through_shards(self) -> None:
+        payee = Wallet.objects.get(user=self.lender)
+        set_shard_count(payee, 4)
+
+        result = settle(
+            [
+                Transfer(self.borrower.pk, self.lender.pk, 30, "T-1"),
+                Transfer(self.borrower.pk, self.lender.pk, 20, "T-2"),
+            ]
+        )
+
+        self.assertEqual(len(result.applied), 2)
+        payee.refresh_from_db()
+        self.assertEqual(payee.balance, 0)
+        self.assertFalse(payee.ledger_entries.exists())
+        self.assertEqual(sum(payee.balance_shards.values_list("amount", flat=True)), 50)
+        self.assertEqual(wallet_balance(payee), 50)
+        compact(payee)
+        self.assertEqual(ledger_balance(payee), 50)
+
+    def test_completed_tickets_settle_and_verify_payments(self) -> None:
+        ticket = Ticket.objects.create(
+            asset_name="Gold", borrower=self.borrower, lender=self.lender, status=Ticket.Status.COMPLETED
+        )
+        payment = Payment.objects.create(ticket=ticket, authority="A-1", amount=25)
+
+        result = settle_completed_tickets(batch_size=10)
+
+        self.assertEqual(len(result.applied), 1)
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, Payment.Status.VERIFIED)
+        self.assertIsNotNone(payment.verified_at)
+        stats = WalletStats.objects.get(user=self.lender)
+        self.assertEqual((stats.verified_count, stats.initiated_sum), (1, 0))
+        self.assertEqual(Wallet.objects.get(user=self.lender).balance, 25)
+
+
+class MoneyTests(TestCase):
+    def test_major_units_round_trip_through_minor_units(self) -> None:
+        self.assertEqual(Money.from_major("12450000"), Money(12_450_000, "IRR"))
+        self.assertEqual(Money.from_major(Decimal("19.99"), "USD").minor, 1999)
+        self.assertEqual(str(Money(1999, "USD")), "19.99 USD")
+        with self.assertRaises(ValueError):
+            Money.from_major("10.5", "IRR")
+        with self.assertRaises(TypeError):
+            Money(1, "IRR") + Money(1, "USD")
+
+    def test_field_stores_and_sums_integers(self) -> None:
+        user = User.objects.create_user(email="money@example.com", password="Passw0rd!")
+        wallet = Wallet.objects.create(user=user, balance=Money(1_500_000))
+        append_entry(wallet, 2_000, LedgerEntry.Kind.TOP_UP)
+
+        wallet.refresh_from_db()
+        self.assertEqual(wallet.balance, 1_502_000)
+        self.assertIsInstance(wallet.balance, int)
+        self.assertIsInstance(ledger_balance(wallet), int)
+
+    def test_field_rejects_a_different_currency(self) -> None:
+        user = User.objects.create_user(email="currency@example.com", password="Passw0rd!")
+        wallet = Wallet.objects.create(user=user)
+
+        wallet.balance = Money(1_000, "USD")
+        with self.assertRaises(ValidationError), transaction.atomic():
+            wallet.save()
+        with self.assertRaises(ValidationError), transaction.atomic():
+            Wallet.objects.filter(pk=wallet.pk).update(balance=Money(1_000, "USD"))
+        with self.assertRaises(ValidationError):
+            Payment.objects.filter(amount=Money(5, "EUR")).exists()
+
+        dollars = Wallet.objects.create(
+            user=User.objects.create_user(email="dollars@example.com"), currency="USD", balance=Money(1_999, "USD")
+        )
+        dollars.refresh_from_db()
+        self.assertEqual(dollars.balance, 1_999)
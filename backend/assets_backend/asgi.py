@@ -2,6 +2,8 @@
 ASGI config for assets_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests for ``EVENTS_STREAM_PATH`` are served by the server-sent event
+stream in ``assets_backend.sse``; everything else goes to Django.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -13,4 +15,18 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "assets_backend.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after setup: the stream uses models for authentication.
+from django.conf import settings  # noqa: E402
+
+from assets_backend.sse import EventStreamApp  # noqa: E402
+
+event_stream = EventStreamApp()
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"].rstrip("/") == settings.EVENTS_STREAM_PATH:
+        await event_stream(scope, receive, send)
+        return
+    await django_application(scope, receive, send)
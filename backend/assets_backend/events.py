@@ -0,0 +1,204 @@
+"""Per-user change events for live clients.
+
+Writers call ``publish`` inside their transaction and the event is sent on
+commit through one transport: Redis pub/sub when ``REDIS_URL`` is set,
+PostgreSQL ``NOTIFY`` when the database is PostgreSQL, and in-process
+delivery otherwise (single-process development and tests).  Each server
+process runs one subscriber thread for that transport, and ``EventHub``
+fans every event out to the open streams of the users it names, so the
+number of streams never affects the number of broker or database
+connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .redis_client import create_pubsub_client, get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "assets_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7500
+
+
+def transport() -> str:
+    if get_redis_client() is not None:
+        return "redis"
+    if connections[DEFAULT_DB_ALIAS].vendor == "postgresql":
+        return "postgres"
+    return "local"
+
+
+def publish(user_ids: Iterable[Any], kind: str, data: dict[str, Any]) -> None:
+    """Send *kind* to every user in *user_ids* once the current transaction commits."""
+
+    publish_many([(user_ids, kind, data)])
+
+
+def publish_many(events: Iterable[tuple[Iterable[Any], str, dict[str, Any]]]) -> None:
+    """Send several events on commit, packed into as few broker messages as fit."""
+
+    encoded = []
+    for user_ids, kind, data in events:
+        users = sorted({int(user_id) for user_id in user_ids if user_id is not None})
+        if users:
+            encoded.append(json.dumps({"u": users, "t": kind, "d": data}, cls=DjangoJSONEncoder))
+    if encoded:
+        transaction.on_commit(lambda: _send(encoded))
+
+
+def _payloads(encoded: list[str]) -> list[str]:
+    payloads: list[str] = []
+    batch: list[str] = []
+    size = 2
+    for event in encoded:
+        if batch and size + len(event) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append(f"[{','.join(batch)}]")
+            batch, size = [], 2
+        batch.append(event)
+        size += len(event) + 1
+    if batch:
+        payloads.append(f"[{','.join(batch)}]")
+    return payloads
+
+
+def _send(encoded: list[str]) -> None:
+    mode = transport()
+    try:
+        for payload in _payloads(encoded):
+            if mode == "redis":
+                get_redis_client().publish(CHANNEL, payload)
+            elif mode == "postgres":
+                with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+                    cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+            else:
+                event_hub.dispatch(payload)
+    except Exception:  # noqa: BLE001 - live events are best effort; clients resync on reconnect
+        logger.warning("Failed to publish %d live events", len(encoded), exc_info=True)
+
+
+class EventHub:
+    """Fan events out to per-user ``asyncio.Queue`` streams in this process.
+
+    Queues are only touched on the event loop thread; the subscriber thread
+    hands payloads over with ``call_soon_threadsafe``.  A stream whose queue
+    is full drops events rather than slowing everyone else down.
+    """
+
+    def __init__(self, *, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self.delivered = 0
+        self.dropped = 0
+        self._streams: dict[int, set[asyncio.Queue[tuple[str, Any]]]] = defaultdict(set)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._listener: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue[tuple[str, Any]]:
+        """Open a stream for *user_id*; call from the event loop."""
+
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(maxsize=self.queue_size)
+        self._streams[user_id].add(queue)
+        self._ensure_listener()
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue[tuple[str, Any]]) -> None:
+        streams = self._streams.get(user_id)
+        if streams is not None:
+            streams.discard(queue)
+            if not streams:
+                del self._streams[user_id]
+
+    def dispatch(self, payload: str | bytes) -> None:
+        """Deliver a broker payload; safe to call from any thread."""
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._fan_out, payload)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "users": len(self._streams),
+            "streams": sum(len(streams) for streams in self._streams.values()),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+    def _fan_out(self, payload: str | bytes) -> None:
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed live event payload")
+            return
+        for event in events:
+            for user_id in event["u"]:
+                for queue in self._streams.get(user_id, ()):
+                    try:
+                        queue.put_nowait((event["t"], event["d"]))
+                    except asyncio.QueueFull:
+                        self.dropped += 1
+                    else:
+                        self.delivered += 1
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            mode = transport()
+            if mode == "local":
+                return
+            self._listener = threading.Thread(target=self._listen, args=(mode,), name="event-hub", daemon=True)
+            self._listener.start()
+
+    def _listen(self, mode: str) -> None:
+        while True:
+            try:
+                if mode == "redis":
+                    self._listen_redis()
+                else:
+                    self._listen_postgres()
+            except Exception:  # noqa: BLE001 - reconnect after broker or network errors
+                logger.warning("Live event subscriber disconnected; reconnecting", exc_info=True)
+            time.sleep(1)
+
+    def _listen_redis(self) -> None:
+        client = create_pubsub_client()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(CHANNEL)
+        try:
+            for message in pubsub.listen():
+                self.dispatch(message["data"])
+        finally:
+            pubsub.close()
+
+    def _listen_postgres(self) -> None:
+        database = connections[DEFAULT_DB_ALIAS]
+        # A dedicated connection outside Django's per-thread handling; LISTEN
+        # needs autocommit and stays open for the life of the process.
+        conn = database.get_new_connection(database.get_connection_params())
+        try:
+            conn.autocommit = True
+            conn.execute(f"LISTEN {CHANNEL}")
+            for notify in conn.notifies():
+                self.dispatch(notify.payload)
+        finally:
+            conn.close()
+
+
+event_hub = EventHub(queue_size=settings.EVENTS_QUEUE_SIZE)
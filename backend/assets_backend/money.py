@@ -0,0 +1,124 @@
+"""Money amounts stored as whole numbers of a currency's minor unit."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from django.core import exceptions
+from django.db import models
+
+
+DEFAULT_CURRENCY = "IRR"
+
+# Digits after the decimal point in each currency's major unit.  IRR has no
+# subunit in circulation, so one minor unit is one rial.
+CURRENCY_EXPONENTS = {
+    "IRR": 0,
+    "EUR": 2,
+    "USD": 2,
+}
+
+
+def _exponent(currency: str) -> int:
+    try:
+        return CURRENCY_EXPONENTS[currency]
+    except KeyError as exc:
+        msg = f"Unsupported currency {currency!r}"
+        raise ValueError(msg) from exc
+
+
+@dataclass(frozen=True)
+class Money:
+    """An integer number of minor units in one currency."""
+
+    minor: int
+    currency: str = DEFAULT_CURRENCY
+
+    @classmethod
+    def from_major(cls, value: Decimal | int | str, currency: str = DEFAULT_CURRENCY) -> Money:
+        """Build from a major-unit amount, refusing precision the currency cannot hold."""
+
+        scaled = Decimal(value).scaleb(_exponent(currency))
+        if scaled != scaled.to_integral_value():
+            msg = f"{value} has more precision than {currency} supports"
+            raise ValueError(msg)
+        return cls(int(scaled), currency)
+
+    @property
+    def major(self) -> Decimal:
+        return Decimal(self.minor).scaleb(-_exponent(self.currency))
+
+    def __add__(self, other: Money) -> Money:
+        return Money(self.minor + self._same_currency(other).minor, self.currency)
+
+    def __sub__(self, other: Money) -> Money:
+        return Money(self.minor - self._same_currency(other).minor, self.currency)
+
+    def __neg__(self) -> Money:
+        return Money(-self.minor, self.currency)
+
+    def __str__(self) -> str:
+        return f"{self.major:,} {self.currency}"
+
+    def _same_currency(self, other: Money) -> Money:
+        if not isinstance(other, Money) or other.currency != self.currency:
+            msg = f"Cannot combine {self!r} with {other!r}"
+            raise TypeError(msg)
+        return other
+
+
+class MoneyField(models.BigIntegerField):
+    """Amount in minor units.
+
+    Values read back as plain ``int`` so ``F()`` arithmetic, ``Sum`` and JSON
+    serialization never leave integers.  ``Money`` instances are accepted on
+    assignment and in lookups as long as their currency matches the column's:
+    the owning row's ``currency_field`` when one is given, otherwise
+    ``currency``.  A mismatch raises ``ValidationError``; amounts are never
+    converted between currencies.
+    """
+
+    description = "Amount in minor currency units"
+
+    def __init__(
+        self, *args: Any, currency: str = DEFAULT_CURRENCY, currency_field: str | None = None, **kwargs: Any
+    ) -> None:
+        self.currency = currency
+        self.currency_field = currency_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> tuple[str, str, list[Any], dict[str, Any]]:
+        name, path, args, kwargs = super().deconstruct()
+        if self.currency != DEFAULT_CURRENCY:
+            kwargs["currency"] = self.currency
+        if self.currency_field is not None:
+            kwargs["currency_field"] = self.currency_field
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> Any:
+        value = getattr(model_instance, self.attname)
+        if isinstance(value, Money):
+            currency = getattr(model_instance, self.currency_field) if self.currency_field else self.currency
+            value = self._to_minor(value, currency)
+            setattr(model_instance, self.attname, value)
+        return value
+
+    def get_prep_value(self, value: Any) -> Any:
+        return super().get_prep_value(self._to_minor(value, self.currency))
+
+    def to_python(self, value: Any) -> Any:
+        return super().to_python(self._to_minor(value, self.currency))
+
+    @staticmethod
+    def _to_minor(value: Any, currency: str) -> Any:
+        if isinstance(value, Money):
+            if value.currency != currency:
+                msg = f"{value} cannot be stored in a {currency} amount"
+                raise exceptions.ValidationError(msg, code="currency_mismatch")
+            return value.minor
+        if isinstance(value, Decimal) and value != value.to_integral_value():
+            msg = f"{value} is not a whole number of minor units"
+            raise exceptions.ValidationError(msg, code="invalid")
+        return value
@@ -0,0 +1,118 @@
+"""Keyset pagination for Ninja list endpoints."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+from ninja.errors import HttpError
+
+
+T = TypeVar("T", bound=Model)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+    prev_cursor: str | None
+
+    def links(self, request: HttpRequest, path: str | None = None) -> dict[str, str | None]:
+        """Return ``next``/``prev`` URLs for *path* (default: the current path)."""
+
+        def link(cursor: str | None) -> str | None:
+            if cursor is None:
+                return None
+            query = request.GET.copy()
+            query["cursor"] = cursor
+            return f"{path or request.path}?{query.urlencode()}"
+
+        return {"next": link(self.next_cursor), "prev": link(self.prev_cursor)}
+
+
+class KeysetPaginator:
+    """Paginate a queryset on ``(sort_field, pk)`` with opaque cursors.
+
+    Each page is one indexed range scan (``WHERE (key, id) < (...) ORDER BY
+    key, id LIMIT n``), so deep pages cost the same as the first and rows
+    inserted while a client pages cannot shift or duplicate results.
+    ``sort_field`` takes a leading ``-`` for newest-first order.
+    """
+
+    def __init__(self, sort_field: str, *, default_limit: int = 20, max_limit: int = 100) -> None:
+        self.descending = sort_field.startswith("-")
+        self.field = sort_field.lstrip("-")
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+    def paginate(self, queryset: QuerySet[T], *, cursor: str | None = None, limit: int | None = None) -> Page[T]:
+        limit = max(1, min(limit or self.default_limit, self.max_limit))
+        backwards = False
+        if cursor:
+            key, pk, backwards = self.decode(queryset, cursor)
+            # Moving forward in a descending listing means smaller keys.
+            smaller = self.descending != backwards
+            lookup = "lt" if smaller else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__{lookup}": key}) | Q(**{self.field: key, f"pk__{lookup}": pk})
+            )
+        ascending = self.descending == backwards
+        order = ("" if ascending else "-") + self.field
+        rows = list(queryset.order_by(order, "pk" if ascending else "-pk")[: limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if backwards:
+            rows.reverse()
+            next_cursor = self.encode(rows[-1], backwards=False) if rows else None
+            prev_cursor = self.encode(rows[0], backwards=True) if has_more else None
+        else:
+            next_cursor = self.encode(rows[-1], backwards=False) if has_more else None
+            prev_cursor = self.encode(rows[0], backwards=True) if cursor and rows else None
+        return Page(rows, next_cursor, prev_cursor)
+
+    def encode(self, row: Model, *, backwards: bool) -> str:
+        key = getattr(row, self.field)
+        if isinstance(key, (date, datetime)):
+            key = key.isoformat()
+        raw = json.dumps({"k": key, "id": row.pk, "b": backwards}).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode(self, queryset: QuerySet[Any], cursor: str) -> tuple[Any, int, bool]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            key = queryset.model._meta.get_field(self.field).to_python(payload["k"])
+            return key, int(payload["id"]), bool(payload.get("b"))
+        except (binascii.Error, ValueError, TypeError, KeyError, AttributeError, ValidationError) as exc:
+            msg = "Invalid cursor"
+            raise InvalidCursorError(msg) from exc
+
+
+def paginated_response(
+    request: HttpRequest,
+    queryset: QuerySet[T],
+    paginator: KeysetPaginator,
+    serialize: Callable[[T], dict[str, Any]],
+    *,
+    cursor: str | None,
+    limit: int | None,
+) -> dict[str, Any]:
+    """Return ``{"items", "next", "prev"}`` for one page, or raise a 400 for a bad cursor."""
+
+    try:
+        page = paginator.paginate(queryset, cursor=cursor, limit=limit)
+    except InvalidCursorError as exc:
+        raise HttpError(400, "Invalid cursor") from exc
+    return {"items": [serialize(row) for row in page.items], **page.links(request)}
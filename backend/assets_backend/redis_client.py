@@ -0,0 +1,46 @@
+"""Optional Redis connection shared by caches, throttles and pub/sub."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:  # pragma: no cover - exercised only when the optional dependency is installed
+    import redis
+except ImportError:  # pragma: no cover - redis is an optional extra
+    redis = None
+
+
+def _require_redis() -> None:
+    # Silently falling back would disable every Redis-backed cache, throttle and fan-out.
+    if redis is None:
+        msg = "REDIS_URL is set but the redis package is not installed; install requirements.txt."
+        raise ImproperlyConfigured(msg)
+
+
+@lru_cache(maxsize=1)
+def get_redis_client() -> Any | None:
+    """Return a process-wide Redis client, or None when Redis is not configured."""
+
+    url = getattr(settings, "REDIS_URL", "")
+    if not url:
+        return None
+    _require_redis()
+    return redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+
+def create_pubsub_client() -> Any | None:
+    """Return a new Redis client for a long-lived subscription, or None without Redis.
+
+    Subscribers block on reads, so this client has no socket timeout and its
+    own connection instead of the short-timeout shared one.
+    """
+
+    url = getattr(settings, "REDIS_URL", "")
+    if not url:
+        return None
+    _require_redis()
+    return redis.Redis.from_url(url, socket_connect_timeout=1, health_check_interval=30)
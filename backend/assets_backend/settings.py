@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "apps.auth.apps.AuthConfig",
     "apps.wallet.apps.WalletConfig",
@@ -136,6 +137,66 @@ def _env_int(name: str, default: int) -> int:
 
 ACCESS_TOKEN_LIFETIME_MINUTES = _env_int("ACCESS_TOKEN_LIFETIME_MINUTES", 15)
 REFRESH_TOKEN_LIFETIME_DAYS = _env_int("REFRESH_TOKEN_LIFETIME_DAYS", 14)
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = _env_int("REFRESH_TOKEN_REUSE_GRACE_SECONDS", 10)
+REFRESH_TOKEN_REVOKED_RETENTION_HOURS = _env_int("REFRESH_TOKEN_REVOKED_RETENTION_HOURS", 24)
+
+AUTH_HASHING_WORKERS = _env_int("AUTH_HASHING_WORKERS", min(4, os.cpu_count() or 1))
+AUTH_HASHING_MAX_PENDING = _env_int("AUTH_HASHING_MAX_PENDING", 64)
+
+AUTH_DENYLIST_CAPACITY = _env_int("AUTH_DENYLIST_CAPACITY", 100000)
+AUTH_DENYLIST_SYNC_SECONDS = _env_int("AUTH_DENYLIST_SYNC_SECONDS", 5)
+
+AUTH_THROTTLE_ENABLED = os.getenv("AUTH_THROTTLE_ENABLED", "1") == "1"
+AUTH_THROTTLE_WINDOW_SECONDS = _env_int("AUTH_THROTTLE_WINDOW_SECONDS", 300)
+AUTH_THROTTLE_IP_LIMIT = _env_int("AUTH_THROTTLE_IP_LIMIT", 50)
+AUTH_THROTTLE_EMAIL_LIMIT = _env_int("AUTH_THROTTLE_EMAIL_LIMIT", 10)
+AUTH_THROTTLE_IP_EMAIL_LIMIT = _env_int("AUTH_THROTTLE_IP_EMAIL_LIMIT", 5)
+AUTH_THROTTLE_LOCKOUT_SECONDS = _env_int("AUTH_THROTTLE_LOCKOUT_SECONDS", 30)
+AUTH_THROTTLE_MAX_LOCKOUT_SECONDS = _env_int("AUTH_THROTTLE_MAX_LOCKOUT_SECONDS", 3600)
+# Reverse proxies in front of the app that append to X-Forwarded-For; 0 uses REMOTE_ADDR only.
+TRUSTED_PROXY_COUNT = _env_int("TRUSTED_PROXY_COUNT", 0)
 
 AUTH_COOKIE_SECURE = os.getenv("AUTH_COOKIE_SECURE", "1" if not DEBUG else "0") == "1"
 AUTH_COOKIE_SAMESITE = os.getenv("AUTH_COOKIE_SAMESITE", "Lax")
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+AUTH_USER_CACHE_SIZE = _env_int("AUTH_USER_CACHE_SIZE", 10000)
+AUTH_USER_CACHE_TTL_SECONDS = _env_int("AUTH_USER_CACHE_TTL_SECONDS", 30)
+
+AUTH_AUDIT_BUFFERED = os.getenv("AUTH_AUDIT_BUFFERED", "1" if not DEBUG else "0") == "1"
+AUTH_AUDIT_QUEUE_SIZE = _env_int("AUTH_AUDIT_QUEUE_SIZE", 10000)
+AUTH_AUDIT_BATCH_SIZE = _env_int("AUTH_AUDIT_BATCH_SIZE", 500)
+AUTH_AUDIT_FLUSH_INTERVAL_MS = _env_int("AUTH_AUDIT_FLUSH_INTERVAL_MS", 1000)
+AUTH_AUDIT_OVERFLOW_POLICY = os.getenv("AUTH_AUDIT_OVERFLOW_POLICY", "drop_oldest")
+AUTH_AUDIT_SAMPLE_PERCENT = _env_int("AUTH_AUDIT_SAMPLE_PERCENT", 10)
+
+WALLET_CHECKPOINT_INTERVAL = _env_int("WALLET_CHECKPOINT_INTERVAL", 1000)
+WALLET_BALANCE_SHARDS = _env_int("WALLET_BALANCE_SHARDS", 16)
+
+TICKET_PENDING_EXPIRY_DAYS = _env_int("TICKET_PENDING_EXPIRY_DAYS", 30)
+
+NOTIFICATION_PROVIDER = os.getenv("NOTIFICATION_PROVIDER", "fake" if DEBUG else "live")
+NOTIFICATION_BATCH_SIZE = _env_int("NOTIFICATION_BATCH_SIZE", 100)
+NOTIFICATION_CONCURRENCY = _env_int("NOTIFICATION_CONCURRENCY", 16)
+NOTIFICATION_LEASE_SECONDS = _env_int("NOTIFICATION_LEASE_SECONDS", 300)
+NOTIFICATION_MAX_ATTEMPTS = _env_int("NOTIFICATION_MAX_ATTEMPTS", 5)
+NOTIFICATION_RETRY_BASE_SECONDS = _env_int("NOTIFICATION_RETRY_BASE_SECONDS", 30)
+NOTIFICATION_RETRY_MAX_SECONDS = _env_int("NOTIFICATION_RETRY_MAX_SECONDS", 3600)
+NOTIFICATION_HTTP_TIMEOUT_SECONDS = _env_int("NOTIFICATION_HTTP_TIMEOUT_SECONDS", 10)
+NOTIFICATION_FAKE_LATENCY_MS = _env_int("NOTIFICATION_FAKE_LATENCY_MS", 50)
+NOTIFICATION_FAKE_FAILURE_PERCENT = _env_int("NOTIFICATION_FAKE_FAILURE_PERCENT", 0)
+NOTIFICATION_EMAIL_SUBJECT = os.getenv("NOTIFICATION_EMAIL_SUBJECT", "Assets notification")
+SMS_IR_API_KEY = os.getenv("SMS_IR_API_KEY", "")
+SMS_IR_LINE_NUMBER = os.getenv("SMS_IR_LINE_NUMBER", "")
+WHATSAPP_PHONE_NUMBER_ID = os.getenv("WHATSAPP_PHONE_NUMBER_ID", "")
+WHATSAPP_ACCESS_TOKEN = os.getenv("WHATSAPP_ACCESS_TOKEN", "")
+# New notifications wait this long before delivery so bursts can be merged into one digest.
+NOTIFICATION_COALESCE_WINDOW_SECONDS = _env_int("NOTIFICATION_COALESCE_WINDOW_SECONDS", 60)
+NOTIFICATION_SMS_MAX_LENGTH = _env_int("NOTIFICATION_SMS_MAX_LENGTH", 480)
+NOTIFICATION_WHATSAPP_MAX_LENGTH = _env_int("NOTIFICATION_WHATSAPP_MAX_LENGTH", 4096)
+NOTIFICATION_EMAIL_MAX_LENGTH = _env_int("NOTIFICATION_EMAIL_MAX_LENGTH", 20000)
+
+EVENTS_STREAM_PATH = os.getenv("EVENTS_STREAM_PATH", "/api/events")
+EVENTS_HEARTBEAT_SECONDS = _env_int("EVENTS_HEARTBEAT_SECONDS", 15)
+EVENTS_QUEUE_SIZE = _env_int("EVENTS_QUEUE_SIZE", 100)
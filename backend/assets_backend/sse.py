@@ -0,0 +1,197 @@
+"""Server-sent event stream served directly by the ASGI application.
+
+The stream bypasses Django's request handling: after authentication an idle
+connection is one coroutine and one queue, with no thread, middleware
+state or database connection held for its lifetime.  The stream ends when
+its access token expires, and every heartbeat re-checks the token against
+the denylist and the user's ``is_active`` flag.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Awaitable, Callable
+
+import jwt
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+
+from apps.auth.cache import user_cache
+from apps.auth.models import User
+from apps.auth.revocation import access_denylist
+from apps.auth.tokens import validate_access_token
+
+from .events import EventHub, event_hub
+
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class StreamGrant:
+    """The user a stream belongs to and the access-token claims it was opened with."""
+
+    user_id: int
+    claims: dict[str, Any]
+
+    @property
+    def expires_at(self) -> float:
+        return float(self.claims["exp"])
+
+
+def _active_user_id(claims: dict[str, Any]) -> int | None:
+    if access_denylist.is_revoked(claims):
+        return None
+    user = user_cache.get_user(claims["sub"])
+    return user.pk if user.is_active else None
+
+
+def authenticate_stream(token: str) -> StreamGrant | None:
+    """Return the grant for an access token of an active user, or None."""
+
+    try:
+        claims = validate_access_token(token)
+        user_id = _active_user_id(claims)
+    except (jwt.InvalidTokenError, KeyError, User.DoesNotExist):
+        return None
+    finally:
+        close_old_connections()
+    return StreamGrant(user_id, claims) if user_id is not None else None
+
+
+def grant_is_current(grant: StreamGrant) -> bool:
+    """Return whether *grant*'s token is still unrevoked and its user still active."""
+
+    try:
+        return _active_user_id(grant.claims) == grant.user_id
+    except (KeyError, User.DoesNotExist):
+        return False
+    finally:
+        close_old_connections()
+
+
+def _token(headers: dict[str, str]) -> str | None:
+    scheme, _, credentials = headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials.strip():
+        return credentials.strip()
+    try:
+        cookie = SimpleCookie(headers.get("cookie", ""))
+    except CookieError:
+        return None
+    morsel = cookie.get("access_token")
+    return morsel.value if morsel else None
+
+
+def format_event(kind: str, data: Any) -> bytes:
+    return f"event: {kind}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n".encode()
+
+
+class EventStreamApp:
+    """ASGI app streaming the authenticated user's live events as ``text/event-stream``."""
+
+    def __init__(self, hub: EventHub = event_hub, *, heartbeat: float | None = None) -> None:
+        self.hub = hub
+        self.heartbeat = heartbeat or settings.EVENTS_HEARTBEAT_SECONDS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+        cors = self._cors_headers(headers.get("origin"))
+        if scope["method"] == "OPTIONS":
+            await self._respond(send, 204, cors)
+            return
+        if scope["method"] != "GET":
+            await self._respond(send, 405, cors, {"detail": "Method not allowed"})
+            return
+        token = _token(headers)
+        grant = await sync_to_async(authenticate_stream, thread_sensitive=False)(token) if token else None
+        if grant is None:
+            await self._respond(send, 401, cors, {"detail": "Authentication credentials were not provided"})
+            return
+
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + grant.expires_at - time.time()
+        next_check = loop.time() + self.heartbeat
+        queue = self.hub.subscribe(grant.user_id)
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/event-stream"),
+                        (b"cache-control", b"no-cache"),
+                        (b"x-accel-buffering", b"no"),
+                        *cors,
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b"retry: 5000\n\n", "more_body": True})
+            while True:
+                now = loop.time()
+                if now >= expires:
+                    # Tell the client to refresh its token before it reconnects.
+                    await self._finish(send, format_event("reauthenticate", {"reason": "expired"}))
+                    break
+                if now >= next_check:
+                    next_check = now + self.heartbeat
+                    if not await sync_to_async(grant_is_current, thread_sensitive=False)(grant):
+                        await self._finish(send)
+                        break
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, disconnected},
+                    timeout=min(self.heartbeat, expires - now),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter not in done:
+                    getter.cancel()
+                if disconnected.done():
+                    break
+                body = format_event(*getter.result()) if getter in done else b": keepalive\n\n"
+                await send({"type": "http.response.body", "body": body, "more_body": True})
+        except OSError:
+            pass  # The client went away mid-write.
+        finally:
+            self.hub.unsubscribe(grant.user_id, queue)
+            disconnected.cancel()
+
+    @staticmethod
+    async def _finish(send: Send, body: bytes = b"") -> None:
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+    @staticmethod
+    async def _wait_for_disconnect(receive: Receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    @staticmethod
+    def _cors_headers(origin: str | None) -> list[tuple[bytes, bytes]]:
+        if not origin or origin not in settings.CORS_ALLOWED_ORIGINS:
+            return []
+        return [
+            (b"access-control-allow-origin", origin.encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-allow-headers", b"authorization"),
+            (b"vary", b"origin"),
+        ]
+
+    @staticmethod
+    async def _respond(send: Send, status: int, headers: list[tuple[bytes, bytes]], body: Any = None) -> None:
+        content = json.dumps(body).encode() if body is not None else b""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"), *headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
@@ -17,6 +17,7 @@ import {
 } from "@nextui-org/react";
 
 import { AuthGate } from "@/components/auth/AuthGate";
+import { AppButton } from "@/components/ui/AppButton";
 import { fetchTickets } from "@/lib/tickets";
 import { formatRelativeTime } from "@/lib/format";
 import type { TicketItem } from "@/types";
@@ -35,6 +36,8 @@ export default function TicketsPage() {
   const [tickets, setTickets] = useState<TicketItem[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [next, setNext] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     let active = true;
@@ -44,7 +47,8 @@ export default function TicketsPage() {
         if (!active) {
           return;
         }
-        setTickets(response);
+        setTickets(response.items);
+        setNext(response.next);
         setError(null);
       } catch {
         if (!active) {
@@ -52,6 +56,7 @@ export default function TicketsPage() {
         }
         setError("Unable to load tickets");
         setTickets([]);
+        setNext(null);
       } finally {
         if (active) {
           setIsLoading(false);
@@ -65,6 +70,22 @@ export default function TicketsPage() {
     };
   }, []);
 
+  const loadMore = async () => {
+    if (!next) {
+      return;
+    }
+    setIsLoadingMore(true);
+    try {
+      const response = await fetchTickets(next);
+      setTickets((current) => [...current, ...response.items]);
+      setNext(response.next);
+    } catch {
+      setError("Unable to load more tickets");
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const sortedTickets = useMemo(
     () =>
       [...tickets].sort(
@@ -120,6 +141,13 @@ export default function TicketsPage() {
                 </TableBody>
               </Table>
             )}
+            {next && !isLoading && !error ? (
+              <div className="mt-4 flex justify-center">
+                <AppButton variant="flat" isLoading={isLoadingMore} onPress={() => void loadMore()}>
+                  Load more
+                </AppButton>
+              </div>
+            ) : null}
           </CardBody>
         </Card>
       </div>
@@ -16,6 +16,16 @@ export const api = axios.create({
   withCredentials: true,
 });
 
+/**
+ * Turn a `next`/`prev` link from a paginated response into a URL the client can request.
+ * Links carry the server path (including `/api`), so they resolve against the API origin
+ * rather than `baseURL`.
+ */
+export function pageLink(link: string): string {
+  const fallback = typeof window === "undefined" ? "http://localhost" : window.location.origin;
+  return new URL(link, new URL(baseURL, fallback).origin).toString();
+}
+
 const refreshClient = axios.create({
   baseURL,
   withCredentials: true,
@@ -0,0 +1,50 @@
+import { api } from "@/lib/api";
+import { API_BASE_URL } from "@/lib/config";
+import type { LiveEventHandlers } from "@/types";
+
+/**
+ * Subscribe to the current user's live events; returns a function that closes the stream.
+ * The browser reconnects on its own, so refetch in `open` to pick up anything missed.
+ * The server ends the stream with `reauthenticate` when the access token expires; the
+ * token is refreshed and a new stream opened, since a reconnect with the old one is refused.
+ */
+export function subscribeToEvents(handlers: LiveEventHandlers): () => void {
+  let closed = false;
+  let source = open(handlers, reauthenticate);
+
+  async function reauthenticate() {
+    source.close();
+    try {
+      await api.post("/auth/refresh");
+    } catch {
+      return;
+    }
+    if (!closed) {
+      source = open(handlers, reauthenticate);
+    }
+  }
+
+  return () => {
+    closed = true;
+    source.close();
+  };
+}
+
+function open(handlers: LiveEventHandlers, reauthenticate: () => Promise<void>): EventSource {
+  const source = new EventSource(`${API_BASE_URL}/events`, { withCredentials: true });
+  if (handlers.open) {
+    source.addEventListener("open", handlers.open);
+  }
+  listen(source, "notification", handlers.notification);
+  listen(source, "payment", handlers.payment);
+  listen(source, "ticket", handlers.ticket);
+  source.addEventListener("reauthenticate", () => void reauthenticate());
+  return source;
+}
+
+function listen<T>(source: EventSource, kind: string, handler?: (event: T) => void) {
+  if (!handler) {
+    return;
+  }
+  source.addEventListener(kind, (event) => handler(JSON.parse((event as MessageEvent<string>).data) as T));
+}
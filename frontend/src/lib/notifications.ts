@@ -1,7 +1,23 @@
-import { api } from "@/lib/api";
-import type { NotificationItem } from "@/types";
+import { api, pageLink } from "@/lib/api";
+import type { CursorPage, NotificationItem } from "@/types";
 
-export async function fetchRecentNotifications(): Promise<NotificationItem[]> {
-  const { data } = await api.get<NotificationItem[]>("/notifications/recent");
+/** Fetch the newest notifications, or the page behind a `next` link from an earlier one. */
+export async function fetchRecentNotifications(next?: string): Promise<CursorPage<NotificationItem>> {
+  const { data } = await api.get<CursorPage<NotificationItem>>(next ? pageLink(next) : "/notifications/recent");
   return data;
 }
+
+export async function fetchUnreadCount(): Promise<number> {
+  const { data } = await api.get<{ unread: number }>("/notifications/unread-count");
+  return data.unread;
+}
+
+export async function markNotificationRead(id: number): Promise<number> {
+  const { data } = await api.post<{ unread: number }>(`/notifications/${id}/read`);
+  return data.unread;
+}
+
+export async function markAllNotificationsRead(): Promise<number> {
+  const { data } = await api.post<{ updated: number; unread: number }>("/notifications/read-all");
+  return data.unread;
+}
@@ -1,7 +1,13 @@
-import { api } from "@/lib/api";
-import type { TicketItem } from "@/types";
+import { api, pageLink } from "@/lib/api";
+import type { CursorPage, TicketItem } from "@/types";
 
-export async function fetchTickets(): Promise<TicketItem[]> {
-  const { data } = await api.get<TicketItem[]>("/tickets");
+/** Fetch the first page of tickets, or the page behind a `next` link from an earlier one. */
+export async function fetchTickets(next?: string): Promise<CursorPage<TicketItem>> {
+  const { data } = await api.get<CursorPage<TicketItem>>(next ? pageLink(next) : "/tickets/");
+  return data;
+}
+
+export async function searchTickets(query: string): Promise<CursorPage<TicketItem>> {
+  const { data } = await api.get<CursorPage<TicketItem>>("/tickets/search", { params: { q: query } });
   return data;
 }
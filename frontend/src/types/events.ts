@@ -0,0 +1,23 @@
+export interface NotificationLiveEvent {
+  id: number;
+  channel: string;
+}
+
+export interface PaymentLiveEvent {
+  id: number;
+  ticketId: number;
+  status: string;
+}
+
+export interface TicketLiveEvent {
+  ids: number[];
+  count: number;
+  status: string;
+}
+
+export interface LiveEventHandlers {
+  open?: () => void;
+  notification?: (event: NotificationLiveEvent) => void;
+  payment?: (event: PaymentLiveEvent) => void;
+  ticket?: (event: TicketLiveEvent) => void;
+}
@@ -1,5 +1,7 @@
 export * from "./auth";
 export * from "./dashboard";
+export * from "./events";
 export * from "./notifications";
+export * from "./pagination";
 export * from "./tickets";
 export * from "./wallet";
@@ -6,4 +6,5 @@ export interface NotificationItem {
   statusLabel: string;
   message: string;
   createdAt: string;
+  readAt: string | null;
 }
@@ -0,0 +1,5 @@
+export interface CursorPage<T> {
+  items: T[];
+  next: string | null;
+  prev: string | null;
+}
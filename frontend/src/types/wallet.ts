@@ -21,4 +21,5 @@ export interface WalletTransaction {
 export interface WalletOverview {
   wallet: WalletSummary;
   transactions: WalletTransaction[];
+  transactionsNext: string | null;
 }